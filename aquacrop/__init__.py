@@ -1,10 +1,50 @@
-import sys
-if not '-m' in sys.argv:
+"""
+The top-level names are imported on first access, so that `import aquacrop`
+does not import numba, pandas and the model modules until they are used.
+"""
+import importlib
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
     from .core import AquaCropModel
     from .entities.soil import Soil
-    from .entities.crop import  Crop
+    from .entities.crop import Crop
     from .entities.inititalWaterContent import InitialWaterContent
     from .entities.irrigationManagement import IrrigationManagement
     from .entities.fieldManagement import FieldMngt
-    from .entities.groundWater import  GroundWater
-    from .entities.co2 import  CO2
+    from .entities.groundWater import GroundWater
+    from .entities.co2 import CO2
+    from .entities.outputSink import OutputSink
+    from .entities.initializationCache import InitializationCache
+    from .scenarios import run_many
+
+
+_LAZY_NAMES = {
+    "AquaCropModel": ".core",
+    "Soil": ".entities.soil",
+    "Crop": ".entities.crop",
+    "InitialWaterContent": ".entities.inititalWaterContent",
+    "IrrigationManagement": ".entities.irrigationManagement",
+    "FieldMngt": ".entities.fieldManagement",
+    "GroundWater": ".entities.groundWater",
+    "CO2": ".entities.co2",
+    "OutputSink": ".entities.outputSink",
+    "InitializationCache": ".entities.initializationCache",
+    "run_many": ".scenarios",
+}
+
+__all__ = list(_LAZY_NAMES)
+
+
+def __getattr__(name):
+    if name not in _LAZY_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_NAMES[name], __name__), name)
+    # Later accesses do not go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES))
@@ -6,8 +6,8 @@ import datetime
 import os
 import logging
 import warnings
-from typing import Dict, Union, Optional, Tuple, TYPE_CHECKING
-from .scripts.checkIfPackageIsCompiled import compile_all_AOT_files
+import numpy as np
+from typing import Dict, List, Union, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     # Important: classes are only imported when types are checked, not in production.
@@ -15,29 +15,35 @@ if TYPE_CHECKING:
     from aquacrop.entities.clockStruct import ClockStruct
     from aquacrop.entities.co2 import CO2
     from aquacrop.entities.crop import Crop
+    from aquacrop.entities.initializationCache import InitializationCache
     from aquacrop.entities.initParamVariables import InitialCondition
     from aquacrop.entities.inititalWaterContent import InitialWaterContent
+    from aquacrop.entities.modelCheckpoint import ModelCheckpoint
+    from aquacrop.entities.outputSink import OutputSink
     from aquacrop.entities.paramStruct import ParamStruct
     from aquacrop.entities.soil import Soil
 
 
-# Important: This code is necessary to check if the AOT files are compiled.
+# The AOT files are compiled with the aquacrop-compile command, not on import.
 if os.getenv("DEVELOPMENT"):
     logging.basicConfig(level=logging.INFO)
     logger = logging.getLogger(__name__)
     logging.info("Running the simulation in development mode.")
-else:
-    compile_all_AOT_files()
 
 
 # pylint: disable=wrong-import-position
 from .entities.co2 import CO2
+from .entities.initParamVariables import WORK_COUNTER_FIELDS
 from .entities.fieldManagement import FieldMngt
 from .entities.groundWater import GroundWater
+from .entities.initializationCache import InitializationTemplate
 from .entities.irrigationManagement import IrrigationManagement
+from .entities.modelCheckpoint import ModelCheckpoint, copy_model_state
 from .entities.output import Output
+from .entities.outputSink import OutputSink
 from .initialize.compute_variables import compute_variables
 from .initialize.create_soil_profile import create_soil_profile
+from .initialize.fingerprint_inputs import fingerprint_inputs
 from .initialize.read_clocks_parameters import read_clock_parameters
 from .initialize.read_field_managment import read_field_management
 from .initialize.read_groundwater_table import read_groundwater_table
@@ -47,7 +53,9 @@ from .initialize.read_model_parameters import read_model_parameters
 from .initialize.read_weather_inputs import read_weather_inputs
 from .timestep.check_if_model_is_finished import check_model_is_finished
 from .timestep.run_single_timestep import solution_single_time_step
+from .timestep.stage_timers import StageTimers
 from .timestep.update_time import update_time
+from .timestep.run_compiled_simulation import run_compiled_simulation, run_compiled_batch
 from .timestep.outputs_when_model_is_finished import outputs_when_model_is_finished
 
 class AquaCropModel:
@@ -84,6 +92,17 @@ class AquaCropModel:
         off_season: (True) simulate off-season or (False) skip ahead to start of 
                     next growing season
 
+        output_sink: Writes the daily outputs to disk in chunks while the
+                    simulation runs (default: kept in memory)
+
+        stage_timers: (True) accumulate the wall time and calls of each stage
+                    of the time steps, reported by get_additional_information
+                    (not available with compiled runs)
+
+        initialization_cache: InitializationCache shared by the models with
+                    the same inputs (except the irrigation management), to
+                    initialise them only once (default: no cache)
+
 
     """
 
@@ -99,6 +118,7 @@ class AquaCropModel:
     _init_cond: "InitialCondition"
     _outputs: "Output"
     _weather: "DataFrame"
+    _stage_timers: Optional["StageTimers"] = None
 
     def __init__(
         self,
@@ -114,6 +134,9 @@ class AquaCropModel:
         groundwater: Optional["GroundWater"] = None,
         co2_concentration: Optional["CO2"] = None,
         off_season: bool=False,
+        output_sink: Optional["OutputSink"] = None,
+        stage_timers: bool = False,
+        initialization_cache: Optional["InitializationCache"] = None,
     ) -> None:
 
         self.sim_start_time = sim_start_time
@@ -124,6 +147,9 @@ class AquaCropModel:
         self.initial_water_content = initial_water_content   
         self.co2_concentration = co2_concentration
         self.off_season = off_season
+        self.output_sink = output_sink
+        self.stage_timers = stage_timers
+        self.initialization_cache = initialization_cache
       
         self.irrigation_management = irrigation_management
         self.field_management = field_management
@@ -201,6 +227,68 @@ class AquaCropModel:
         """
         Initialise all model variables
         """
+        cache = self.initialization_cache
+        if cache is None:
+            self._initialize_from_inputs()
+            # save model _weather to _init_cond
+            self._weather = self.weather_df.values
+        else:
+            fingerprint = fingerprint_inputs(
+                self.sim_start_time,
+                self.sim_end_time,
+                self.weather_df,
+                self.soil,
+                self.crop,
+                self.initial_water_content,
+                self.field_management,
+                self.fallow_field_management,
+                self.groundwater,
+                self.co2_concentration,
+                self.off_season,
+            )
+            template = cache.get(fingerprint)
+            if template is None:
+                self._initialize_from_inputs()
+                self._weather = self.weather_df.values
+                cache.put(
+                    fingerprint,
+                    InitializationTemplate(
+                        *copy_model_state(
+                            self._clock_struct, self._init_cond, self._param_struct
+                        ),
+                        self.weather_df,
+                        self._weather,
+                    ),
+                )
+            else:
+                # Copy of the initialised structures, with this irrigation management
+                (
+                    self._clock_struct,
+                    self._init_cond,
+                    self._param_struct,
+                ) = copy_model_state(
+                    template.clock_struct, template.init_cond, template.param_struct
+                )
+                self.weather_df = template.weather_df
+                self._weather = template.weather
+                self._param_struct = read_irrigation_management(
+                    self._param_struct, self.irrigation_management, self._clock_struct
+                )
+
+        # Outputs results (water_flux, crop_growth, final_stats)
+        self._outputs = Output(
+            self._clock_struct.time_span,
+            self._init_cond.th,
+            self._clock_struct.n_seasons,
+            self.output_sink,
+        )
+
+        self._stage_timers = StageTimers() if self.stage_timers else None
+
+    def _initialize_from_inputs(self) -> None:
+        """
+        Initialise the model structures from the inputs
+        """
 
         # Initialize ClockStruct object
         self._clock_struct = read_clock_parameters(
@@ -243,18 +331,13 @@ class AquaCropModel:
 
         self._param_struct = create_soil_profile(self._param_struct)
 
-        # Outputs results (water_flux, crop_growth, final_stats)
-        self._outputs = Output(self._clock_struct.time_span, self._init_cond.th)
-
-        # save model _weather to _init_cond
-        self._weather = self.weather_df.values
-
     def run_model(
         self,
         num_steps: int = 1,
         till_termination: bool = False,
         initialize_model: bool = True,
         process_outputs: bool = False,
+        compiled: bool = False,
     ) -> bool:
         """
         This function is responsible for executing the model.
@@ -271,14 +354,44 @@ class AquaCropModel:
             process_outputs: process outputs into dataframe before \
                 simulation is finished
 
+            compiled: run the whole simulation in a single compiled \
+                (numba) loop. Only available with till_termination=True
+
         Returns:
             True if finished
         """
 
+        if compiled and not till_termination:
+            raise ValueError("compiled=True is only available with till_termination=True.")
+        if compiled and self.stage_timers:
+            raise ValueError("stage_timers are not available with compiled=True.")
+
         if initialize_model:
             self._initialize()
 
-        if till_termination:
+        if till_termination and compiled:
+            self.__start_model_execution = time.time()
+            if self._clock_struct.model_is_finished is False:
+                (
+                    self._clock_struct,
+                    self._init_cond,
+                    self._param_struct,
+                    self._outputs,
+                ) = run_compiled_simulation(
+                    self._clock_struct,
+                    self._init_cond,
+                    self._param_struct,
+                    self._weather,
+                    self._outputs,
+                )
+                outputs_when_model_is_finished(
+                    True, self._outputs, self.__steps_are_finished
+                )
+            self.__end_model_execution = time.time()
+            self.__has_model_executed = True
+            self.__has_model_finished = True
+            return True
+        elif till_termination:
             self.__start_model_execution = time.time()
             while self._clock_struct.model_is_finished is False:
 
@@ -319,6 +432,174 @@ class AquaCropModel:
             self.__has_model_finished = False
             return True
 
+    @staticmethod
+    def run_batch(models: List["AquaCropModel"]) -> bool:
+        """
+        Run several models till termination in a single compiled loop.
+
+        The models (e.g. different soils, crops, irrigation strategies or
+        initial water contents) must share the same simulation period and
+        weather data. They are advanced in lockstep with their state stored
+        along a field axis, which amortises the python overhead of running
+        them one by one. Results are read from each model as usual.
+
+        Arguments:
+
+            models: AquaCropModel objects to run
+
+        Returns:
+            True if finished
+        """
+        if len(models) == 0:
+            raise ValueError("run_batch needs at least one model.")
+        if any(model.stage_timers for model in models):
+            raise ValueError("stage_timers are not available with run_batch.")
+
+        for model in models:
+            model._initialize()
+
+        reference = models[0]
+        for model in models[1:]:
+            if (model.sim_start_time, model.sim_end_time) != (
+                reference.sim_start_time,
+                reference.sim_end_time,
+            ):
+                raise ValueError("All the models of a batch must share the simulation period.")
+            if not np.array_equal(model._weather[:, :4], reference._weather[:, :4]):
+                raise ValueError("All the models of a batch must share the weather data.")
+            if len(model._init_cond.th) != len(reference._init_cond.th):
+                raise ValueError(
+                    "All the models of a batch must have the same number of soil compartments."
+                )
+
+        start_execution = time.time()
+        run_compiled_batch(
+            [model._clock_struct for model in models],
+            [model._init_cond for model in models],
+            [model._param_struct for model in models],
+            reference._weather,
+            [model._outputs for model in models],
+        )
+        end_execution = time.time()
+
+        for model in models:
+            outputs_when_model_is_finished(True, model._outputs, False)
+            model.__start_model_execution = start_execution
+            model.__end_model_execution = end_execution
+            model.__has_model_executed = True
+            model.__has_model_finished = True
+
+        return True
+
+    def checkpoint(self) -> "ModelCheckpoint":
+        """
+        Save the state of a model that has run part of its simulation
+        (e.g. up to today in a growing season), to continue it later from
+        this point any number of times with AquaCropModel.from_checkpoint.
+
+        The soil, crop and management paramaters and the weather data are
+        shared with the model, only the state updated while running is copied.
+
+        Returns:
+            ModelCheckpoint with the current state of the model
+        """
+        if not self.__has_model_executed:
+            raise ValueError(
+                "You cannot create a checkpoint without running the model. "
+                + "Please execute the run_model() method."
+            )
+        if self._clock_struct.model_is_finished:
+            raise ValueError("You cannot create a checkpoint of a finished model.")
+
+        clock_struct, init_cond, param_struct = copy_model_state(
+            self._clock_struct, self._init_cond, self._param_struct
+        )
+        filled_rows = self._clock_struct.time_step_counter
+        return ModelCheckpoint(
+            config=dict(
+                sim_start_time=self.sim_start_time,
+                sim_end_time=self.sim_end_time,
+                weather_df=self.weather_df,
+                soil=self.soil,
+                crop=self.crop,
+                initial_water_content=self.initial_water_content,
+                irrigation_management=self.irrigation_management,
+                field_management=self.field_management,
+                fallow_field_management=self.fallow_field_management,
+                groundwater=self.groundwater,
+                co2_concentration=self.co2_concentration,
+                off_season=self.off_season,
+                output_sink=self.output_sink,
+                stage_timers=self.stage_timers,
+                initialization_cache=self.initialization_cache,
+            ),
+            clock_struct=clock_struct,
+            init_cond=init_cond,
+            param_struct=param_struct,
+            weather=self._weather,
+            water_storage=self._outputs.read("water_storage", stop=filled_rows).copy(),
+            water_flux=self._outputs.read("water_flux", stop=filled_rows).copy(),
+            crop_growth=self._outputs.read("crop_growth", stop=filled_rows).copy(),
+            final_stats=self._outputs.final_stats.copy(),
+        )
+
+    @classmethod
+    def from_checkpoint(
+        cls,
+        checkpoint: "ModelCheckpoint",
+        irrigation_management: Optional["IrrigationManagement"] = None,
+    ) -> "AquaCropModel":
+        """
+        Create a model that continues the simulation saved in a checkpoint.
+        Run it with run_model(initialize_model=False).
+
+        Arguments:
+
+            checkpoint: ModelCheckpoint created by AquaCropModel.checkpoint
+
+            irrigation_management: irrigation strategy for the rest of the
+                simulation (default: the strategy of the checkpointed model)
+
+        Returns:
+            AquaCropModel at the state of the checkpoint
+        """
+        config = dict(checkpoint.config)
+        if irrigation_management is not None:
+            config["irrigation_management"] = irrigation_management
+        if config["output_sink"] is not None:
+            # Each continuation writes its outputs to its own directory
+            config["output_sink"] = OutputSink(config["output_sink"].chunk_size)
+        model = cls(**config)
+
+        (
+            model._clock_struct,
+            model._init_cond,
+            model._param_struct,
+        ) = copy_model_state(
+            checkpoint.clock_struct, checkpoint.init_cond, checkpoint.param_struct
+        )
+        if irrigation_management is not None:
+            model._param_struct = read_irrigation_management(
+                model._param_struct, irrigation_management, model._clock_struct
+            )
+        model._weather = checkpoint.weather
+
+        model._outputs = Output(
+            model._clock_struct.time_span,
+            model._init_cond.th,
+            model._clock_struct.n_seasons,
+            model.output_sink,
+        )
+        model._outputs.load_rows(
+            checkpoint.water_storage, checkpoint.water_flux, checkpoint.crop_growth
+        )
+        model._outputs.final_stats = checkpoint.final_stats.copy()
+        model._stage_timers = StageTimers() if model.stage_timers else None
+
+        model.__has_model_executed = True
+        model.__has_model_finished = False
+        return model
+
     def _perform_timestep(
         self,
     ) -> Tuple["ClockStruct", "InitialCondition", "ParamStruct", "Output"]:
@@ -332,8 +613,12 @@ class AquaCropModel:
             self._weather, self._clock_struct.time_step_counter
         )
 
-        # Get model solution_single_time_step
-        new_cond, param_struct, outputs = solution_single_time_step(
+        # Get model solution_single_time_step (with timed stages if requested)
+        if self._stage_timers is None:
+            step_function = solution_single_time_step
+        else:
+            step_function = self._stage_timers.solution_single_time_step
+        new_cond, param_struct, outputs = step_function(
             self._init_cond,
             self._param_struct,
             self._clock_struct,
@@ -344,8 +629,8 @@ class AquaCropModel:
         # Check model termination
         clock_struct = self._clock_struct
         clock_struct.model_is_finished = check_model_is_finished(
-            self._clock_struct.step_end_time,
-            self._clock_struct.simulation_end_date,
+            self._clock_struct.time_step_counter + 1,
+            self._clock_struct.simulation_end_day,
             self._clock_struct.model_is_finished,
             self._clock_struct.season_counter,
             self._clock_struct.n_seasons,
@@ -357,22 +642,11 @@ class AquaCropModel:
             clock_struct, new_cond, param_struct, self._weather, self.crop
         )
 
-        # Create  _outputsdataframes when model is finished
-        final_water_flux_growth_outputs = outputs_when_model_is_finished(
-            clock_struct.model_is_finished,
-            outputs.water_flux,
-            outputs.water_storage,
-            outputs.crop_growth,
-            self.__steps_are_finished,
+        # Make the _outputs available as dataframes when model is finished
+        outputs_when_model_is_finished(
+            clock_struct.model_is_finished, outputs, self.__steps_are_finished
         )
 
-        if final_water_flux_growth_outputs is not False:
-            (
-                outputs.water_flux,
-                outputs.water_storage,
-                outputs.crop_growth,
-            ) = final_water_flux_growth_outputs
-
         return clock_struct, _init_cond, param_struct, outputs
 
     def get_simulation_results(self):
@@ -381,7 +655,7 @@ class AquaCropModel:
         """
         if self.__has_model_executed:
             if self.__has_model_finished:
-                return self._outputs.final_stats
+                return self._outputs.get_final_stats()
             else:
                 return False  # If the model is not finished, the results are not generated.
         else:
@@ -390,11 +664,22 @@ class AquaCropModel:
                 + "Please execute the run_model() method."
             )
 
-    def get_water_storage(self):
+    def get_water_storage(self, columns: Optional[List[str]] = None):
         """
         Return water storage in soil results
+
+        Arguments:
+
+            columns: columns to return (default: all of them). The dataframe \
+                is built for these columns when first requested
+
+        Returns:
+            pandas.DataFrame, or the numpy array of the outputs if the model \
+            is not finished and process_outputs was not requested
         """
         if self.__has_model_executed:
+            if self._outputs.processed:
+                return self._outputs.get_dataframe("water_storage", columns)
             return self._outputs.water_storage
         else:
             raise ValueError(
@@ -402,11 +687,22 @@ class AquaCropModel:
                 + "Please execute the run_model() method."
             )
 
-    def get_water_flux(self):
+    def get_water_flux(self, columns: Optional[List[str]] = None):
         """
         Return water flux results
+
+        Arguments:
+
+            columns: columns to return (default: all of them). The dataframe \
+                is built for these columns when first requested
+
+        Returns:
+            pandas.DataFrame, or the numpy array of the outputs if the model \
+            is not finished and process_outputs was not requested
         """
         if self.__has_model_executed:
+            if self._outputs.processed:
+                return self._outputs.get_dataframe("water_flux", columns)
             return self._outputs.water_flux
         else:
             raise ValueError(
@@ -414,11 +710,22 @@ class AquaCropModel:
                 + "Please execute the run_model() method."
             )
 
-    def get_crop_growth(self):
+    def get_crop_growth(self, columns: Optional[List[str]] = None):
         """
         Return crop growth results
+
+        Arguments:
+
+            columns: columns to return (default: all of them). The dataframe \
+                is built for these columns when first requested
+
+        Returns:
+            pandas.DataFrame, or the numpy array of the outputs if the model \
+            is not finished and process_outputs was not requested
         """
         if self.__has_model_executed:
+            if self._outputs.processed:
+                return self._outputs.get_dataframe("crop_growth", columns)
             return self._outputs.crop_growth
         else:
             raise ValueError(
@@ -426,20 +733,30 @@ class AquaCropModel:
                 + "Please execute the run_model() method."
             )
 
-    def get_additional_information(self) -> Dict[str, Union[bool, float]]:
+    def get_additional_information(self) -> Dict[str, Union[bool, float, Dict]]:
         """
         Additional model information.
 
         Returns:
-            dict: {has_model_finished,execution_time}
+            dict: {has_model_finished,execution_time,work_counters}, and
+                stage_timers ({stage: {time, calls}}) if the model has stage timers.
+                work_counters ({counter: count}) is the work done by the solution
+                functions since the start of the simulation (see
+                initParamVariables.WORK_COUNTER_FIELDS)
 
         """
         if self.__has_model_executed:
-            return {
+            information = {
                 "has_model_finished": self.__has_model_finished,
                 "execution_time": self.__end_model_execution
                 - self.__start_model_execution,
+                "work_counters": {
+                    name: getattr(self._init_cond, name) for name in WORK_COUNTER_FIELDS
+                },
             }
+            if self._stage_timers is not None:
+                information["stage_timers"] = self._stage_timers.totals()
+            return information
         else:
             raise ValueError(
                 "You cannot get results without running the model. "
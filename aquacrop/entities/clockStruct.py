@@ -2,6 +2,8 @@
 Contains model information regarding dates and step times etc.
 
 """
+import numpy as np
+import pandas as pd
 
 
 class ClockStruct:
@@ -10,7 +12,8 @@ class ClockStruct:
 
     Attributes:
 
-        time_step_counter (int): Keeps track of current timestep
+        time_step_counter (int): Keeps track of current timestep (the day
+            of the simulation, 0 on simulation_start_date)
 
         model_is_finished (Bool): False unless model has finished
 
@@ -24,9 +27,11 @@ class ClockStruct:
 
         time_span (np.array): all dates that lie within the start and end dates of simulation
 
-        step_start_time (np.Datetime64): Date at start of timestep
+        simulation_end_day (int): day of simulation end (n_steps - 1)
 
-        step_end_time (np.Datetime64): Date at end of timestep
+        step_start_time (pd.Timestamp): Date at start of timestep (read only)
+
+        step_end_time (pd.Timestamp): Date at end of timestep (read only)
 
         evap_time_steps (int): Number of time-steps (per day) for soil evaporation calculation
 
@@ -36,10 +41,16 @@ class ClockStruct:
 
         harvest_dates (list-like): list of harvest dates in datetime format
 
+        planting_days (np.array): day of each planting date (int64)
+
+        harvest_days (np.array): day of each harvest date (int64)
+
         n_seasons (int): Total number of seasons to be simulated
 
         season_counter (int): counter to keep track of which season we are currenlty simulating
 
+    The clock runs on days since simulation_start_date (int64), and the
+    dates are only used to read the inputs and write the outputs.
 
     """
 
@@ -54,8 +65,7 @@ class ClockStruct:
         self.time_span = (
             0  # all dates that lie within the start and end dates of simulation
         )
-        self.step_start_time = 0  # Date at start of timestep
-        self.step_end_time = 0  # Date at start of timestep
+        self.simulation_end_day = 0  # Day of simulation end
         # Number of time-steps (per day) for soil evaporation calculation
         self.evap_time_steps = 20
         self.sim_off_season = (
@@ -65,5 +75,51 @@ class ClockStruct:
             []
         )  # list of crop planting dates during simulation
         self.harvest_dates = []  # list of crop planting dates during simulation
+        self.planting_days = np.zeros(0, dtype=np.int64)  # days of planting_dates
+        self.harvest_days = np.zeros(0, dtype=np.int64)  # days of harvest_dates
         self.n_seasons = 0  # total number of seasons (plant and harvest)
         self.season_counter = -1  # running counter of seasons
+
+    def date(self, day: int) -> pd.Timestamp:
+        """
+        Date of a day of the simulation
+
+        Arguments:
+
+            day (int): days since simulation_start_date
+
+        Returns:
+
+            date (pd.Timestamp): date of the day
+
+        """
+        return self.simulation_start_date + pd.Timedelta(days=int(day))
+
+    def day(self, date) -> int:
+        """
+        Day of the simulation of a date
+
+        Arguments:
+
+            date (str or datetime-like): date
+
+        Returns:
+
+            day (int): days since simulation_start_date
+
+        """
+        return (pd.Timestamp(date) - self.simulation_start_date).days
+
+    @property
+    def step_start_time(self) -> pd.Timestamp:
+        """
+        Date at start of timestep
+        """
+        return self.date(self.time_step_counter)
+
+    @property
+    def step_end_time(self) -> pd.Timestamp:
+        """
+        Date at end of timestep
+        """
+        return self.date(self.time_step_counter + 1)
@@ -1,7 +1,17 @@
 from numba import float64
+import numpy as np
 import pandas as pd
+from functools import lru_cache
 from os.path import dirname, abspath
 
+from typing import Dict, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Important: classes are only imported when types are checked, not in production.
+    from numpy import ndarray
+    from pandas import DataFrame
+    from aquacrop.entities.crop import Crop, CropStruct
+
 acfp: str = dirname(dirname(abspath(__file__)))
 
 spec = [
@@ -22,7 +32,9 @@ class CO2(object):
 
         constant_conc (bool): use constant conc every season
 
-        co2_data (DataFrame): CO2 timeseries (2 columns: 'year' and 'ppm')
+        co2_data (DataFrame): CO2 timeseries (2 columns: 'year' and 'ppm'). The
+            default data is read once and shared by every CO2 object, so it
+            should be replaced rather than changed in place
 
     """
 
@@ -39,13 +51,163 @@ class CO2(object):
         if co2_data is not None:
             self.co2_data = co2_data
         else:
-            self.co2_data = pd.read_csv(
-                    f"{acfp}/data/MaunaLoaCO2.txt",
-                    header=1,
-                    delim_whitespace=True,
-                    names=["year", "ppm"],
-    )
+            self.co2_data = read_co2_data(f"{acfp}/data/MaunaLoaCO2.txt")
         self.co2_data_processed = None
 
 
+@lru_cache(maxsize=None)
+def read_co2_data(filepath: str) -> "DataFrame":
+    """
+    Read a CO2 timeseries file (once per process, the data frame is shared)
+
+    Arguments:
+
+        filepath (str): path to the file (2 columns: year and ppm, after a header line)
+
+    Returns:
+
+        co2_data (DataFrame): CO2 timeseries (2 columns: 'year' and 'ppm')
+
+    """
+    return pd.read_csv(
+        filepath,
+        header=1,
+        delim_whitespace=True,
+        names=["year", "ppm"],
+    )
+
+
+def crop_co2_adjustment(
+    CO2conc: "float | ndarray",
+    CO2ref: float,
+    crop: "Crop | CropStruct") -> "float | ndarray":
+    """
+    Function to calculate the adjustment of the water productivity of a
+    crop for the CO2 concentration (fCO2), for one or many concentrations
+
+    Arguments:
+
+        CO2conc (float or numpy.ndarray): CO2 concentration(s)
+
+        CO2ref (float): reference CO2 concentration
+
+        crop (Crop): crop paramaters (bsted, bface, fsink and WP)
+
+    Returns:
+
+        fCO2 (float or numpy.ndarray): adjustment of the water productivity
+            for each CO2 concentration
+
+    """
+    CO2conc = np.asarray(CO2conc, dtype=np.float64)
+
+    # Weighting factor for CO2
+    fw = np.where(
+        CO2conc <= CO2ref,
+        0.0,
+        np.where(CO2conc >= 550, 1.0, 1 - ((550 - CO2conc) / (550 - CO2ref))),
+    )
+    # Initial adjustment (used up to 550 ppm)
+    fCO2old = (CO2conc / CO2ref) / (
+        1
+        + (CO2conc - CO2ref)
+        * (
+            (1 - fw) * crop.bsted
+            + fw * ((crop.bsted * crop.fsink) + (crop.bface * (1 - crop.fsink)))
+        )
+    )
+    # New adjusted correction coefficient for CO2 (version 7 of AquaCrop)
+    fshape = -4.61824 - 3.43831*crop.fsink - 5.32587*crop.fsink*crop.fsink
+    CO2rel = (CO2conc-CO2ref)/(2000-CO2ref)
+    fCO2new = np.where(
+        CO2conc >= 2000,
+        1.58,  # Maximum CO2 adjustment
+        1 + 0.58 * ((np.exp(CO2rel*fshape) - 1)/(np.exp(fshape) - 1)),
+    )
 
+    # Select adjusted coefficient for CO2
+    fCO2 = np.where(
+        (CO2conc <= CO2ref) | ((CO2conc <= 550) & (fCO2old < fCO2new)),
+        fCO2old,
+        fCO2new,
+    )
+
+    # Consider crop type
+    if crop.WP >= 40:
+        # No correction for C4 crops
+        ftype = 0
+    elif crop.WP <= 20:
+        # Full correction for C3 crops
+        ftype = 1
+    else:
+        ftype = (40 - crop.WP) / (40 - 20)
+
+    # Total adjustment
+    fCO2 = 1 + ftype * (fCO2 - 1)
+    return fCO2[()] if fCO2.ndim == 0 else fCO2
+
+
+class CO2Table:
+    """
+    CO2 Table Class contains the CO2 concentration of each year of a CO2
+    timeseries, and the adjustment of the water productivity (fCO2) of each
+    year for the crops, so that the CO2 of each growing season is found with
+    array lookups. The tables of the default CO2 data are shared by the
+    whole process (see co2_table).
+
+    Attributes:
+
+        first_year (int): first year of the table (the years before it have its concentration)
+
+        ppm (numpy.ndarray): CO2 concentration of each year (interpolated)
+
+        ref_concentration (float): reference CO2 concentration
+
+        fCO2 (dict): fCO2 of each year, by crop CO2 paramaters (bsted, bface, fsink and WP)
+
+    """
+
+    def __init__(self, year: "ndarray", ppm: "ndarray", ref_concentration: float):
+        year = np.asarray(year, dtype=np.float64)
+        self.first_year = int(np.floor(year.min()))
+        years = np.arange(self.first_year, int(np.ceil(year.max())) + 1)
+        self.ppm = np.interp(years, year, np.asarray(ppm, dtype=np.float64))
+        self.ref_concentration = ref_concentration
+        self.fCO2: Dict[tuple, "ndarray"] = {}
+
+    def _index(self, year: int) -> int:
+        return min(max(year - self.first_year, 0), len(self.ppm) - 1)
+
+    def concentration(self, year: int) -> float:
+        """
+        CO2 concentration of a year
+        """
+        return self.ppm[self._index(year)]
+
+    def crop_adjustment(self, crop: "Crop | CropStruct", year: int) -> float:
+        """
+        fCO2 of a crop for the CO2 concentration of a year (computed for
+        every year the first time the crop CO2 paramaters are used)
+        """
+        key = (crop.bsted, crop.bface, crop.fsink, crop.WP)
+        if key not in self.fCO2:
+            self.fCO2[key] = crop_co2_adjustment(self.ppm, self.ref_concentration, crop)
+        return self.fCO2[key][self._index(year)]
+
+
+@lru_cache(maxsize=None)
+def _default_co2_table(ref_concentration: float) -> CO2Table:
+    co2_data = read_co2_data(f"{acfp}/data/MaunaLoaCO2.txt")
+    return CO2Table(co2_data.year.to_numpy(), co2_data.ppm.to_numpy(), ref_concentration)
+
+
+def co2_table(co2: CO2) -> CO2Table:
+    """
+    CO2Table of the CO2 data and reference concentration of a CO2 object
+    (the same table for every CO2 object with the default data)
+    """
+    if co2.co2_data is read_co2_data(f"{acfp}/data/MaunaLoaCO2.txt"):
+        return _default_co2_table(float(co2.ref_concentration))
+    return CO2Table(
+        co2.co2_data.year.to_numpy(), co2.co2_data.ppm.to_numpy(), co2.ref_concentration
+    )
@@ -260,7 +260,7 @@ crop_spec = [
     ("PlantMethod", int64),
     ("CalendarType", int64),
     ("SwitchGDD", int64),
-    ("SwitchGDDType", str),
+    ("SwitchGDDType", types.unicode_type),
     ("EmergenceCD", int64),
     ("Canopy10PctCD", int64),
     ("MaxRootingCD", int64),
@@ -491,3 +491,32 @@ CropStructNT = typing.NamedTuple("CropStructNT", crop_spec)
 CropStructNT_type_sig = types.NamedTuple(
     tuple(dict(crop_spec).values()), CropStructNT
 )
+
+
+def crop_struct_to_named_tuple(crop: CropStruct) -> CropStructNT:
+    """
+    Copy the paramaters of a CropStruct into a CropStructNT, the crop
+    paramaters passed to the solution functions. Every value is cast to the
+    type given in crop_spec, as the compiled solution functions expect.
+
+    Arguments:
+
+        crop (CropStruct): crop paramaters
+
+    Returns:
+
+        crop_nt (CropStructNT): crop paramaters as a NamedTuple
+
+    """
+    class_args = {}
+    for name, numba_type in crop_spec:
+        value = getattr(crop, name)
+        if isinstance(numba_type, types.Array):
+            value = np.ascontiguousarray(value, dtype=numba_type.dtype.name)
+        elif numba_type == float64:
+            value = float(value)
+        elif numba_type == int64:
+            value = int(value)
+        class_args[name] = value
+
+    return CropStructNT(**class_args)
@@ -1,4 +1,5 @@
 from numba import float64, int64, boolean, types
+import typing
 
 
 class FieldMngt:
@@ -87,3 +88,5 @@ class FieldMngtStruct:
         self.bund_water = 0.0
         self.curve_number_adj_pct = 0.0
 
+
+FieldMngtNT = typing.NamedTuple("FieldMngtNT", spec)
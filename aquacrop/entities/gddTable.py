@@ -0,0 +1,117 @@
+import numpy as np
+
+from ..solution.growing_degree_day import growing_degree_days
+
+from typing import Dict, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Important: classes are only imported when types are checked, not in production.
+    from numpy import ndarray
+    from aquacrop.entities.crop import Crop, CropStruct
+
+
+class GDDTable:
+    """
+    GDD Table Class contains the growing degree days of each day of the
+    simulation period, and their prefix sums, for each gdd method (GDDmethod,
+    Tbase and Tupp) of the crops. They are computed once, and read by the
+    daily time steps, and the crop calendar of each growing season (in gdd
+    mode) is found from them with a binary search instead of from the
+    weather of the rest of the simulation. Models with the same weather
+    (e.g. from an InitializationCache) share them.
+
+    Attributes:
+
+        temp_max (numpy.ndarray): maximum temperature of each day of the simulation period
+
+        temp_min (numpy.ndarray): minimum temperature of each day of the simulation period
+
+        tables (dict): daily gdd's and their prefix sums (with a leading 0), by gdd method
+
+    """
+
+    def __init__(self, temp_max: "ndarray", temp_min: "ndarray"):
+        self.temp_max = np.asarray(temp_max, dtype=np.float64)
+        self.temp_min = np.asarray(temp_min, dtype=np.float64)
+        self.tables: Dict[tuple, Tuple["ndarray", "ndarray"]] = {}
+
+    def get(self, crop: "Crop | CropStruct") -> Tuple["ndarray", "ndarray"]:
+        """
+        Daily gdd's and their prefix sums with the gdd method of a crop
+        (computed the first time the gdd method is used)
+        """
+        key = (int(crop.GDDmethod), float(crop.Tbase), float(crop.Tupp))
+        if key not in self.tables:
+            gdd = growing_degree_days(
+                crop.GDDmethod, crop.Tupp, crop.Tbase, self.temp_max, self.temp_min
+            )
+            self.tables[key] = (gdd, np.concatenate(([0.0], np.cumsum(gdd))))
+        return self.tables[key]
+
+    def seasons_gdd(
+        self,
+        crops: "list",
+        planting_days: "ndarray") -> "ndarray":
+        """
+        Function to get the gdd's of each day of the simulation period,
+        with the crop of the growing season the day belongs to (from its
+        planting day to the next one, the first season also before it).
+        If every season has the same gdd method, it is the table of that
+        method (not a copy).
+
+        Arguments:
+
+            crops (list): crop paramaters of each season
+
+            planting_days (numpy.ndarray): planting day of each season (days since the simulation start)
+
+        Returns:
+
+            gdd (numpy.ndarray): gdd's of each day
+
+        """
+        tables = [self.get(crop)[0] for crop in crops]
+        if len(tables) == 0:
+            return np.zeros(len(self.temp_max))
+
+        gdd = tables[0]
+        if any(table is not gdd for table in tables):
+            gdd = gdd.copy()
+            for table, start in zip(tables[1:], planting_days[1:]):
+                start = min(max(int(start), 0), len(gdd))
+                gdd[start:] = table[start:]
+        return gdd
+
+    def season_cumulative_gdd(
+        self,
+        crop: "Crop | CropStruct",
+        start_day: int,
+        max_stage: float) -> "ndarray":
+        """
+        Function to get the cumulative gdd's of each day from the start of a
+        growing season, until the first day on which they exceed the last
+        gdd stage of the crop by 1 gdd (or until the end of the simulation,
+        if it is not reached)
+
+        Arguments:
+
+            crop (Crop): crop paramaters (gdd method)
+
+            start_day (int): first day of the growing season (days since the simulation start)
+
+            max_stage (float): gdd's from sowing to the last stage of the crop
+
+        Returns:
+
+            gdd_cum (numpy.ndarray): cumulative gdd's of each day from the start of the season
+
+        """
+        gdd, prefix_sums = self.get(crop)
+        # The cumulative gdd's are summed from the start of the season, as
+        # before, so that stages equal to a cumulative gdd are found on the
+        # same day. They differ from the prefix sums by rounding only, much
+        # less than the 1 gdd margin of the cut-off.
+        end_day = np.searchsorted(
+            prefix_sums, prefix_sums[start_day] + max_stage + 1.0, side="right"
+        )
+        return np.cumsum(gdd[start_day:end_day])
@@ -1,5 +1,5 @@
 import numpy as np
-from numba import float64, int64, boolean
+from numba import float64, int64, boolean, types
 
 from ..entities.modelConstants import ModelConstants
 
@@ -81,24 +81,332 @@ InitCond_spec = [
     ("w_stage_2", float64),
     ("depletion", float64),
     ("taw", float64),
+    # Work counters of the solution functions since the start of the
+    # simulation (see WORK_COUNTER_FIELDS)
+    ("evap_stage2_sub_steps", int64),
+    ("evap_layer_expansions", int64),
+    ("capillary_rise_iterations", int64),
+    ("infiltration_iterations", int64),
+    ("root_zone_calls", int64),
+    ("root_zone_evaluations", int64),
+    ("season_resets", int64),
 ]
 
 
+# Position of every scalar field of InitCond_spec in the flat float64 state
+# vector used by the compiled simulation loop (booleans are stored as 0/1),
+# named after the field in upper case. The compartment arrays (th, th_fc_Adj,
+# thini, aer_days_comp) are stored after the scalar fields. The positions are
+# checked against InitCond_spec when the module is imported.
+InitCond_scalar_fields = [
+    name for name, numba_type in InitCond_spec if not isinstance(numba_type, types.Array)
+]
+
+AGE_DAYS = 0
+AGE_DAYS_NS = 1
+AER_DAYS = 2
+IRR_CUM = 3
+DELAYED_GDDS = 4
+DELAYED_CDS = 5
+PCT_LAG_PHASE = 6
+T_EARLY_SEN = 7
+GDD_CUM = 8
+DAY_SUBMERGED = 9
+IRR_NET_CUM = 10
+DAP = 11
+E_POT = 12
+T_POT = 13
+PRE_ADJ = 14
+CROP_MATURE = 15
+CROP_DEAD = 16
+GERMINATION = 17
+PREMAT_SENES = 18
+HARVEST_FLAG = 19
+GROWING_SEASON = 20
+YIELD_FORM = 21
+STAGE2 = 22
+WT_IN_SOIL = 23
+STAGE = 24
+F_PRE = 25
+F_POST = 26
+FPOST_DWN = 27
+FPOST_UPP = 28
+H1_COR_ASUM = 29
+H1_COR_BSUM = 30
+F_POL = 31
+S_COR1 = 32
+S_COR2 = 33
+HI_REF = 34
+HIFINAL = 35
+GROWTH_STAGE = 36
+TR_RATIO = 37
+R_COR = 38
+CANOPY_COVER = 39
+CANOPY_COVER_ADJ = 40
+CANOPY_COVER_NS = 41
+CANOPY_COVER_ADJ_NS = 42
+BIOMASS = 43
+BIOMASS_NS = 44
+YIELDPOT = 45
+HARVEST_INDEX = 46
+HARVEST_INDEX_ADJ = 47
+CCX_ACT = 48
+CCX_ACT_NS = 49
+CCX_W = 50
+CCX_W_NS = 51
+CCX_EARLY_SEN = 52
+CC_PREV = 53
+PROTECTED_SEED = 54
+DRYYIELD = 55
+FRESHYIELD = 56
+Z_ROOT = 57
+CC0_ADJ = 58
+SURFACE_STORAGE = 59
+Z_GW = 60
+TIME_STEP_COUNTER = 61
+PRECIPITATION = 62
+TEMP_MAX = 63
+TEMP_MIN = 64
+ET0 = 65
+SUMET0EARLYSEN = 66
+GDD = 67
+W_SURF = 68
+EVAP_Z = 69
+W_STAGE_2 = 70
+DEPLETION = 71
+TAW = 72
+EVAP_STAGE2_SUB_STEPS = 73
+EVAP_LAYER_EXPANSIONS = 74
+CAPILLARY_RISE_ITERATIONS = 75
+INFILTRATION_ITERATIONS = 76
+ROOT_ZONE_CALLS = 77
+ROOT_ZONE_EVALUATIONS = 78
+SEASON_RESETS = 79
+
+N_SCALARS = len(InitCond_scalar_fields)
+
+assert [globals()[name.upper()] for name in InitCond_scalar_fields] == list(
+    range(N_SCALARS)
+), "The positions of the scalar fields do not follow InitCond_spec"
+
+
+# Work counters: the amount of work done by the solution functions (stage 2
+# evaporation sub-steps, loop iterations, root zone water calculations and
+# season resets). They are the contiguous scalar fields starting at
+# WORK_COUNTERS, passed to the solution functions as a view of the state
+# (state[WORK_COUNTERS : WORK_COUNTERS + N_WORK_COUNTERS]) and indexed with
+# the WC_ positions.
+WORK_COUNTER_FIELDS = [
+    "evap_stage2_sub_steps",
+    "evap_layer_expansions",
+    "capillary_rise_iterations",
+    "infiltration_iterations",
+    "root_zone_calls",
+    "root_zone_evaluations",
+    "season_resets",
+]
+
+WORK_COUNTERS = EVAP_STAGE2_SUB_STEPS
+N_WORK_COUNTERS = len(WORK_COUNTER_FIELDS)
+
+WC_EVAP_STAGE2_SUB_STEPS = 0
+WC_EVAP_LAYER_EXPANSIONS = 1
+WC_CAPILLARY_RISE_ITERATIONS = 2
+WC_INFILTRATION_ITERATIONS = 3
+WC_ROOT_ZONE_CALLS = 4
+WC_ROOT_ZONE_EVALUATIONS = 5
+WC_SEASON_RESETS = 6
+
+assert (
+    InitCond_scalar_fields[WORK_COUNTERS : WORK_COUNTERS + N_WORK_COUNTERS]
+    == WORK_COUNTER_FIELDS
+), "The work counters are not contiguous scalar fields of InitCond_spec"
+assert [globals()["WC_" + name.upper()] for name in WORK_COUNTER_FIELDS] == list(
+    range(N_WORK_COUNTERS)
+), "The positions of the work counters do not follow WORK_COUNTER_FIELDS"
+
+
+# Layout of the compartment arrays, stored after the scalar fields in the
+# buffer of InitialCondition (each of them has one value per compartment)
+InitCond_array_fields = [
+    name for name, numba_type in InitCond_spec if isinstance(numba_type, types.Array)
+]
+
+AER_DAYS_COMP_ARRAY = 0
+TH_FC_ADJ_ARRAY = 1
+TH_ARRAY = 2
+THINI_ARRAY = 3
+
+N_ARRAYS = len(InitCond_array_fields)
+
+assert [globals()[name.upper() + "_ARRAY"] for name in InitCond_array_fields] == list(
+    range(N_ARRAYS)
+), "The positions of the compartment arrays do not follow InitCond_spec"
+
+# Scalar fields that can be None (no water table), stored as NaN
+InitCond_optional_fields = ["wt_in_soil", "z_gw"]
+
+
+def state_size(num_comp: int) -> int:
+    """
+    Length of the buffer holding the state of an InitialCondition
+
+    Arguments:
+
+        num_comp (int): number of soil compartments
+
+    Returns:
+
+        size (int): number of float64 values of the buffer
+
+    """
+    return N_SCALARS + N_ARRAYS * num_comp
+
+
+class _ScalarField:
+    """
+    Named accessor of a scalar field of InitialCondition, stored in its buffer.
+    Each read converts the value of the buffer (buffer.item) to the type of
+    the field, which is slower than reading a plain attribute.
+    """
+
+    __slots__ = ("index", "cast", "optional")
+
+    def __init__(self, index: int, cast: type, optional: bool):
+        self.index = index
+        self.cast = cast
+        self.optional = optional
+
+    def __get__(self, init_cond, owner=None):
+        if init_cond is None:
+            return self
+        value = init_cond.buffer.item(self.index)
+        if self.optional and value != value:
+            return None
+        return self.cast(value)
+
+    def __set__(self, init_cond, value):
+        init_cond.buffer[self.index] = np.nan if value is None else value
+
+
+class _ArrayField:
+    """
+    Named accessor of a compartment array of InitialCondition. The array is a
+    view of the buffer and assigning to it copies the values into the buffer:
+    the field does not alias the assigned array (after init_cond.th = th,
+    changing th does not change init_cond.th), and the array must have one
+    value per compartment.
+    """
+
+    __slots__ = ("index",)
+
+    def __init__(self, index: int):
+        self.index = index
+
+    def __get__(self, init_cond, owner=None):
+        if init_cond is None:
+            return self
+        return init_cond.arrays[self.index]
+
+    def __set__(self, init_cond, value):
+        init_cond.arrays[self.index][:] = value
+
+
+def _to_bool(value: float) -> bool:
+    return value != 0
+
+
 class InitialCondition:
     """
     The InitCond Class contains all Paramaters and variables used in the simulation
 
     updated each timestep with the name NewCond
 
+    The whole state is stored in a single float64 buffer: the scalar fields
+    (in the order of InitCond_scalar_fields, booleans as 0/1) followed by the
+    compartment arrays (in the order of InitCond_array_fields). Fields are
+    read and written by name as attributes, so copying the state, passing it
+    to the compiled loop or stacking many of them is a single array copy.
+
+    Unlike the attributes of a plain class, the attributes are read through
+    descriptors (_ScalarField, _ArrayField) that convert the values of the
+    buffer, so code reading many fields in a loop should index the buffer
+    with the positions of the fields (e.g. buffer[TIME_STEP_COUNTER]), as
+    time_step does. Assigning an array to a compartment field copies its
+    values into the buffer instead of keeping a reference to it.
+
+    Attributes:
+
+        buffer (np.array): state of the model, of length state_size(num_comp)
+
+        arrays (tuple): views of the buffer for each compartment array
 
     """
 
-    def __init__(self, num_comp):
+    __slots__ = ("buffer", "arrays")
+
+    def __init__(self, num_comp: int, buffer: "np.ndarray" = None):
+        if buffer is None:
+            self._set_buffer(np.zeros(state_size(num_comp)))
+            self._set_defaults()
+        else:
+            self._set_buffer(buffer)
+
+    def _set_buffer(self, buffer: "np.ndarray") -> None:
+        num_comp = (len(buffer) - N_SCALARS) // N_ARRAYS
+        self.buffer = buffer
+        self.arrays = tuple(
+            buffer[N_SCALARS + idx * num_comp : N_SCALARS + (idx + 1) * num_comp]
+            for idx in range(N_ARRAYS)
+        )
+
+    @classmethod
+    def from_buffer(cls, buffer: "np.ndarray") -> "InitialCondition":
+        """
+        Create an InitialCondition using (not copying) a state buffer
+
+        Arguments:
+
+            buffer (np.array): state of the model, of length state_size(num_comp)
+
+        Returns:
+
+            init_cond (InitialCondition): model state backed by buffer
+
+        """
+        buffer = np.asarray(buffer)
+        if buffer.dtype != np.float64 or buffer.ndim != 1 or not buffer.flags.c_contiguous:
+            raise ValueError("The buffer must be a contiguous 1D float64 array.")
+        if len(buffer) < N_SCALARS or (len(buffer) - N_SCALARS) % N_ARRAYS != 0:
+            raise ValueError(f"Invalid state buffer length {len(buffer)}.")
+        return cls(0, buffer)
+
+    @property
+    def num_comp(self) -> int:
+        """
+        Number of soil compartments
+        """
+        return len(self.arrays[0])
+
+    def copy(self) -> "InitialCondition":
+        """
+        Copy of the state, not sharing memory with this one
+        """
+        return InitialCondition(0, self.buffer.copy())
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo) -> "InitialCondition":
+        return self.copy()
+
+    def __reduce__(self):
+        return (InitialCondition.from_buffer, (self.buffer,))
+
+    def _set_defaults(self) -> None:
         # counters
         self.age_days = 0
         self.age_days_ns = 0
         self.aer_days = 0
-        self.aer_days_comp = np.zeros(num_comp)
         self.irr_cum = 0
         self.delayed_gdds = 0
         self.delayed_cds = 0
@@ -172,10 +480,6 @@ class InitialCondition:
         self.surface_storage = 0
         self.z_gw = ModelConstants.NO_VALUE
 
-        self.th_fc_Adj = np.zeros(num_comp)
-        self.th = np.zeros(num_comp)
-        self.thini = np.zeros(num_comp)
-
         self.time_step_counter = 0
 
         self.precipitation = 0
@@ -191,3 +495,21 @@ class InitialCondition:
 
         self.depletion = 0
         self.taw = 0
+
+
+for _idx, (_name, _numba_type) in enumerate(
+    (name, numba_type) for name, numba_type in InitCond_spec
+    if not isinstance(numba_type, types.Array)
+):
+    setattr(
+        InitialCondition,
+        _name,
+        _ScalarField(
+            _idx,
+            _to_bool if _numba_type == boolean else int if _numba_type == int64 else float,
+            _name in InitCond_optional_fields,
+        ),
+    )
+
+for _idx, _name in enumerate(InitCond_array_fields):
+    setattr(InitialCondition, _name, _ArrayField(_idx))
@@ -0,0 +1,193 @@
+import os
+import pickle
+
+from collections import OrderedDict
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Important: classes are only imported when types are checked, not in production.
+    from numpy import ndarray
+    from pandas import DataFrame
+    from aquacrop.entities.clockStruct import ClockStruct
+    from aquacrop.entities.initParamVariables import InitialCondition
+    from aquacrop.entities.paramStruct import ParamStruct
+
+
+class InitializationTemplate:
+    """
+    Model structures after the initialisation, ready to be copied (with
+    copy_model_state) by the models with the same inputs
+
+    Attributes:
+
+        clock_struct (ClockStruct): model time paramaters
+
+        init_cond (InitialCondition): initial model state
+
+        param_struct (ParamStruct): model paramaters
+
+        weather_df (DataFrame): weather data of the simulation period
+
+        weather (numpy.array): values of weather_df
+
+    """
+
+    def __init__(
+        self,
+        clock_struct: "ClockStruct",
+        init_cond: "InitialCondition",
+        param_struct: "ParamStruct",
+        weather_df: "DataFrame",
+        weather: "ndarray",
+    ):
+        self.clock_struct = clock_struct
+        self.init_cond = init_cond
+        self.param_struct = param_struct
+        self.weather_df = weather_df
+        self.weather = weather
+
+
+class InitializationCache:
+    """
+    Initialization Cache Class stores the initialised model structures of the
+    models it is given to, by fingerprint of their inputs (see
+    fingerprint_inputs), so that models with the same weather, soil, crop,
+    dates, initial water content, field management, groundwater and CO2 are
+    only initialised once, e.g. when only the irrigation management changes
+    between runs. The irrigation management is read again for each model.
+
+    The least recently used templates are evicted when their total (pickled)
+    size exceeds max_bytes. If a directory is given, the templates are also
+    saved to it (one pickle file per template, evicted in the same way), so
+    that they are shared by processes and kept between sessions.
+
+    Attributes:
+
+        max_bytes (int): maximum total size of the templates kept in memory
+            (and on disk)
+
+        directory (str): directory of the template files. If None, the
+            templates are only kept in memory
+
+        hits (int): number of initialisations taken from the cache
+
+        misses (int): number of initialisations that were not in the cache
+
+        nbytes (int): total size of the templates kept in memory
+
+    """
+
+    def __init__(self, max_bytes=256 * 2**20, directory=None):
+
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be equal to or greater than 1.")
+
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        # fingerprint: (template, size), least recently used first
+        self._templates = OrderedDict()
+        self._code_key = None
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self):
+        return len(self._templates)
+
+    def get(self, fingerprint: str) -> Optional[InitializationTemplate]:
+        """
+        Template of the inputs with a fingerprint (None if not in the cache)
+        """
+        if fingerprint in self._templates:
+            self._templates.move_to_end(fingerprint)
+            self.hits += 1
+            return self._templates[fingerprint][0]
+
+        template = None
+        if self.directory is not None:
+            path = self._path(fingerprint)
+            try:
+                with open(path, "rb") as file:
+                    data = file.read()
+                template = pickle.loads(data)
+            except FileNotFoundError:
+                pass
+            except Exception:  # pylint: disable=broad-except
+                # Unreadable file (e.g. written by other library versions)
+                os.remove(path)
+            else:
+                os.utime(path)
+                self._keep(fingerprint, template, len(data))
+
+        if template is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return template
+
+    def put(self, fingerprint: str, template: InitializationTemplate) -> None:
+        """
+        Add the template of the inputs with a fingerprint
+        """
+        data = pickle.dumps(template, protocol=pickle.HIGHEST_PROTOCOL)
+        self._keep(fingerprint, template, len(data))
+
+        if self.directory is not None and len(data) <= self.max_bytes:
+            path = self._path(fingerprint)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as file:
+                file.write(data)
+            os.replace(tmp_path, path)
+            self._evict_files()
+
+    def clear(self) -> None:
+        """
+        Remove all the templates (from memory and disk)
+        """
+        self._templates.clear()
+        self.nbytes = 0
+        if self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith(".pkl"):
+                    os.remove(os.path.join(self.directory, name))
+
+    def _keep(self, fingerprint: str, template: InitializationTemplate, size: int) -> None:
+        if fingerprint in self._templates:
+            self.nbytes -= self._templates.pop(fingerprint)[1]
+        if size > self.max_bytes:
+            return
+        self._templates[fingerprint] = (template, size)
+        self.nbytes += size
+        while self.nbytes > self.max_bytes:
+            self.nbytes -= self._templates.popitem(last=False)[1][1]
+
+    def _path(self, fingerprint: str) -> str:
+        if self._code_key is None:
+            # Templates saved by other versions of the model are not used
+            from ..scripts.aot_registry import source_hash, source_modules
+
+            self._code_key = source_hash(source_modules("aquacrop.core"))[:16]
+        return os.path.join(self.directory, f"{fingerprint}-{self._code_key}.pkl")
+
+    def _evict_files(self) -> None:
+        files = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".pkl"):
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
@@ -1,6 +1,7 @@
 import numpy as np
 import pandas as pd
 from numba import float64, int64, boolean, types
+import typing
 
 
 class IrrigationManagement:
@@ -119,3 +120,4 @@ class IrrMngtStruct:
         self.depth = 0.0
 
 
+IrrMngtNT = typing.NamedTuple("IrrMngtNT", spec)
@@ -0,0 +1,110 @@
+import copy
+
+from typing import Dict, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Important: classes are only imported when types are checked, not in production.
+    from numpy import ndarray
+    from aquacrop.entities.clockStruct import ClockStruct
+    from aquacrop.entities.initParamVariables import InitialCondition
+    from aquacrop.entities.paramStruct import ParamStruct
+
+
+class ModelCheckpoint:
+    """
+    State of an AquaCropModel in the middle of a simulation, created with
+    AquaCropModel.checkpoint(). Any number of models can be continued from the
+    same checkpoint with AquaCropModel.from_checkpoint().
+
+    Only the parts of the model that change while it runs are copied, the soil,
+    crop and management paramaters and the weather data are shared.
+
+    Attributes:
+
+        config (dict): arguments of the AquaCropModel
+
+        clock_struct (ClockStruct): model time paramaters
+
+        init_cond (InitialCondition): model state
+
+        param_struct (ParamStruct): model paramaters
+
+        weather (numpy.array): weather data for simulation period
+
+        water_storage (numpy.array): rows of the water storage outputs filled so far
+
+        water_flux (numpy.array): rows of the water flux outputs filled so far
+
+        crop_growth (numpy.array): rows of the crop growth outputs filled so far
+
+        final_stats (numpy.array): final stats of each season (see Output)
+
+    """
+
+    def __init__(
+        self,
+        config: Dict,
+        clock_struct: "ClockStruct",
+        init_cond: "InitialCondition",
+        param_struct: "ParamStruct",
+        weather: "ndarray",
+        water_storage: "ndarray",
+        water_flux: "ndarray",
+        crop_growth: "ndarray",
+        final_stats: "ndarray",
+    ):
+        self.config = config
+        self.clock_struct = clock_struct
+        self.init_cond = init_cond
+        self.param_struct = param_struct
+        self.weather = weather
+        self.water_storage = water_storage
+        self.water_flux = water_flux
+        self.crop_growth = crop_growth
+        self.final_stats = final_stats
+
+
+def copy_model_state(
+    clock_struct: "ClockStruct",
+    init_cond: "InitialCondition",
+    param_struct: "ParamStruct",
+) -> Tuple["ClockStruct", "InitialCondition", "ParamStruct"]:
+    """
+    Copy the parts of the model structures updated during a simulation
+
+    The ParamStruct copy shares its paramaters with param_struct, except the
+    CO2 concentration, the fallow crop and the crops of the seasons still to
+    be reset, which are updated in place when the simulation reaches them.
+
+    Arguments:
+
+        clock_struct (ClockStruct): model time paramaters
+
+        init_cond (InitialCondition): model state
+
+        param_struct (ParamStruct): model paramaters
+
+    Returns:
+
+        clock_struct (ClockStruct): copy of clock_struct
+
+        init_cond (InitialCondition): copy of init_cond
+
+        param_struct (ParamStruct): copy of param_struct
+
+    """
+    param_copy = copy.copy(param_struct)
+    param_copy.CO2 = copy.copy(param_struct.CO2)
+    param_copy.Fallow_Crop = copy.copy(param_struct.Fallow_Crop)
+
+    # Crops of the current and past seasons are not changed anymore
+    crop_copies = {}
+    param_copy.Seasonal_Crop_List = list(param_struct.Seasonal_Crop_List)
+    for season in range(clock_struct.season_counter + 1, len(param_copy.Seasonal_Crop_List)):
+        crop = param_copy.Seasonal_Crop_List[season]
+        if id(crop) not in crop_copies:
+            crop_copies[id(crop)] = copy.copy(crop)
+        param_copy.Seasonal_Crop_List[season] = crop_copies[id(crop)]
+    param_copy.Seasonal_Crop_NT_List = list(param_struct.Seasonal_Crop_NT_List)
+
+    return copy.copy(clock_struct), init_cond.copy(), param_copy
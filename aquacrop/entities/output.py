@@ -1,40 +1,394 @@
+import glob
+import os
+import shutil
+import tempfile
+import weakref
+
 import pandas as pd
 import numpy as np
 
+from typing import Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Important: classes are only imported when types are checked, not in production.
+    from aquacrop.entities.outputSink import OutputSink
+
+
+DAILY_OUTPUTS = ("water_storage", "water_flux", "crop_growth")
+
+
+WATER_FLUX_COLUMNS = [
+    "time_step_counter",
+    "season_counter",
+    "dap",
+    "Wr",
+    "z_gw",
+    "surface_storage",
+    "IrrDay",
+    "Infl",
+    "Runoff",
+    "DeepPerc",
+    "CR",
+    "GwIn",
+    "Es",
+    "EsPot",
+    "Tr",
+    "TrPot",
+]
+
+CROP_GROWTH_COLUMNS = [
+    "time_step_counter",
+    "season_counter",
+    "dap",
+    "gdd",
+    "gdd_cum",
+    "z_root",
+    "canopy_cover",
+    "canopy_cover_ns",
+    "biomass",
+    "biomass_ns",
+    "harvest_index",
+    "harvest_index_adj",
+    "DryYield",
+    "FreshYield",
+    "YieldPot",
+]
+
+# Seasons not finished yet have a Season of -1
+FINAL_STATS_DTYPE = np.dtype(
+    [
+        ("Season", np.int64),
+        ("crop Type", object),
+        ("Harvest Date (YYYY/MM/DD)", "datetime64[ns]"),
+        ("Harvest Date (Step)", np.int64),
+        ("Dry yield (tonne/ha)", np.float64),
+        ("Fresh yield (tonne/ha)", np.float64),
+        ("Yield potential (tonne/ha)", np.float64),
+        ("Seasonal irrigation (mm)", np.float64),
+    ]
+)
+
+
+def water_storage_columns(num_comp: int) -> list:
+    """
+    Columns of the water storage outputs
+
+    Arguments:
+
+        num_comp (int): number of soil compartments
+
+    Returns:
+
+        columns (list): column names
+
+    """
+    return ["time_step_counter", "growing_season", "dap"] + [
+        "th" + str(i) for i in range(1, num_comp + 1)
+    ]
+
 
 class Output:
     """
     Class to hold output data
 
-    During Simulation these are numpy arrays and are converted to pandas dataframes
-    at the end of the simulation
+    Outputs are stored as numpy arrays. pandas dataframes are only built when
+    they are requested (with get_dataframe and get_final_stats), for the
+    requested columns, and kept until the outputs change.
+
+    With an OutputSink, the daily output arrays only hold the chunk of days
+    being simulated (starting at chunk_start), the other chunks are saved to
+    .npy files. Rows are written at the index given by row(), and the whole
+    simulation period is read back with read().
 
     Atributes:
-    
-        water_flux (pandas.DataFrame, numpy.array): Daily water flux changes
 
-        water_storage (pandas.DataFrame, numpy array): daily water content of each soil compartment
+        water_flux (numpy.array): Daily water flux changes
+
+        water_storage (numpy.array): daily water content of each soil compartment
+
+        crop_growth (numpy.array): daily crop growth variables
 
-        crop_growth (pandas.DataFrame, numpy array): daily crop growth variables
+        chunk_rows (int): number of days of the daily output arrays
 
-        final_stats (pandas.DataFrame, numpy array): final stats at end of each season
+        chunk_start (int): time step of the first row of the daily output arrays
+
+        directory (str): directory of the chunk files (None if kept in memory)
+
+        final_stats (numpy.array): final stats at end of each season (structured
+            array with one row per season, see FINAL_STATS_DTYPE)
+
+        processed (bool): outputs can be read as dataframes (the model is
+            finished or process_outputs was requested)
 
     """
 
-    def __init__(self, time_span, initial_th):
-
-        self.water_storage = np.zeros((len(time_span), 3 + len(initial_th)))
-        self.water_flux = np.zeros((len(time_span), 16))
-        self.crop_growth = np.zeros((len(time_span), 15))
-        self.final_stats = pd.DataFrame(
-            columns=[
-                "Season",
-                "crop Type",
-                "Harvest Date (YYYY/MM/DD)",
-                "Harvest Date (Step)",
-                "Dry yield (tonne/ha)",
-                "Fresh yield (tonne/ha)",
-                "Yield potential (tonne/ha)",
-                "Seasonal irrigation (mm)",
-            ]
-        )
\ No newline at end of file
+    def __init__(self, time_span, initial_th, n_seasons=0, sink: Optional["OutputSink"] = None):
+
+        self.n_rows = len(time_span)
+        self.chunk_start = 0
+        self.directory = None
+        if sink is None:
+            self.chunk_rows = self.n_rows
+        else:
+            self.chunk_rows = min(sink.chunk_size, self.n_rows)
+            if sink.directory is None:
+                self.directory = tempfile.mkdtemp(prefix="aquacrop_outputs_")
+                weakref.finalize(self, shutil.rmtree, self.directory, True)
+            else:
+                self.directory = sink.directory
+                os.makedirs(self.directory, exist_ok=True)
+                # Chunks of a previous simulation with the same sink
+                for path in sink._chunk_files:
+                    if os.path.exists(path):
+                        os.remove(path)
+                sink._chunk_files.clear()
+                for name in DAILY_OUTPUTS:
+                    if glob.glob(os.path.join(self.directory, f"{name}_*.npy")):
+                        raise FileExistsError(
+                            f"{self.directory} holds chunk files that were not written "
+                            "with this OutputSink, use an empty directory."
+                        )
+        self._sink = sink
+        self._saved_chunks = set()
+        self._chunk_changed = False
+
+        self.water_storage = np.zeros((self.chunk_rows, 3 + len(initial_th)))
+        self.water_flux = np.zeros((self.chunk_rows, 16))
+        self.crop_growth = np.zeros((self.chunk_rows, 15))
+        self.final_stats = np.zeros(n_seasons, dtype=FINAL_STATS_DTYPE)
+        self.final_stats["Season"] = -1
+        self.processed = False
+        self._dataframes: Dict[Tuple, pd.DataFrame] = {}
+
+    def _chunk_path(self, name: str, chunk: int) -> str:
+        return os.path.join(self.directory, f"{name}_{chunk:06d}.npy")
+
+    def row(self, time_step_counter: int) -> int:
+        """
+        Row of the daily output arrays where a time step is written, moving
+        them to the chunk of the time step if needed
+
+        Arguments:
+
+            time_step_counter (int): time step to write
+
+        Returns:
+
+            row (int): row of the time step in the daily output arrays
+
+        """
+        row = time_step_counter - self.chunk_start
+        if row < 0 or row >= self.chunk_rows:
+            self.start_chunk(time_step_counter - time_step_counter % self.chunk_rows)
+            row = time_step_counter - self.chunk_start
+        self._chunk_changed = True
+        return row
+
+    def start_chunk(self, first_row: int) -> None:
+        """
+        Save the current chunk and load the chunk starting at first_row
+        in the daily output arrays
+
+        Arguments:
+
+            first_row (int): first time step of the chunk
+
+        """
+        if first_row == self.chunk_start:
+            return
+        self.flush()
+        self.chunk_start = first_row
+        chunk = first_row // self.chunk_rows
+        for name in DAILY_OUTPUTS:
+            if chunk in self._saved_chunks:
+                getattr(self, name)[:] = np.load(self._chunk_path(name, chunk))
+            else:
+                getattr(self, name)[:] = 0
+
+    def store_chunk(self, first_row: int, water_storage, water_flux, crop_growth) -> None:
+        """
+        Write the rows of the chunk starting at first_row
+
+        Arguments:
+
+            first_row (int): first time step of the chunk
+
+            water_storage (numpy.array): water storage rows of the chunk
+
+            water_flux (numpy.array): water flux rows of the chunk
+
+            crop_growth (numpy.array): crop growth rows of the chunk
+
+        """
+        self.start_chunk(first_row)
+        self.water_storage[: len(water_storage)] = water_storage
+        self.water_flux[: len(water_flux)] = water_flux
+        self.crop_growth[: len(crop_growth)] = crop_growth
+        self._chunk_changed = True
+
+    def use_arrays(self, water_storage, water_flux, crop_growth) -> None:
+        """
+        Keep the daily outputs in the given arrays (e.g. the rows of the
+        arrays of a batch of models), copying the current chunk into them
+
+        Arguments:
+
+            water_storage (numpy.array): water storage array of the chunk
+
+            water_flux (numpy.array): water flux array of the chunk
+
+            crop_growth (numpy.array): crop growth array of the chunk
+
+        """
+        water_storage[:] = self.water_storage
+        water_flux[:] = self.water_flux
+        crop_growth[:] = self.crop_growth
+        self.water_storage = water_storage
+        self.water_flux = water_flux
+        self.crop_growth = crop_growth
+        self._dataframes.clear()
+
+    def load_rows(self, water_storage, water_flux, crop_growth) -> None:
+        """
+        Write the first rows of the daily outputs (e.g. from a checkpoint)
+
+        Arguments:
+
+            water_storage (numpy.array): water storage rows
+
+            water_flux (numpy.array): water flux rows
+
+            crop_growth (numpy.array): crop growth rows
+
+        """
+        for first_row in range(0, len(water_storage), self.chunk_rows):
+            last_row = first_row + self.chunk_rows
+            self.store_chunk(
+                first_row,
+                water_storage[first_row:last_row],
+                water_flux[first_row:last_row],
+                crop_growth[first_row:last_row],
+            )
+
+    def flush(self) -> None:
+        """
+        Save the current chunk to its files (if the outputs are written to disk)
+        """
+        if self.directory is None or not self._chunk_changed:
+            return
+        chunk = self.chunk_start // self.chunk_rows
+        for name in DAILY_OUTPUTS:
+            path = self._chunk_path(name, chunk)
+            np.save(path, getattr(self, name))
+            if self._sink.directory is not None:
+                self._sink._chunk_files.add(path)
+        self._saved_chunks.add(chunk)
+        self._chunk_changed = False
+
+    def read(
+        self, name: str, columns: Optional[List[int]] = None, stop: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Daily outputs of the whole simulation period. Kept in memory, they are
+        returned without copy. From disk, only the requested columns are read.
+
+        Arguments:
+
+            name (str): 'water_flux', 'water_storage' or 'crop_growth'
+
+            columns (list): indices of the columns to read (default: all of them)
+
+            stop (int): number of time steps to read (default: all of them)
+
+        Returns:
+
+            outputs (numpy.array): requested outputs
+
+        """
+        stop = self.n_rows if stop is None else stop
+        values = getattr(self, name)
+        if self.directory is None:
+            return values[:stop] if columns is None else values[:stop, columns]
+
+        n_columns = values.shape[1] if columns is None else len(columns)
+        result = np.zeros((stop, n_columns))
+        current_chunk = self.chunk_start // self.chunk_rows
+        for chunk in self._saved_chunks | {current_chunk}:
+            first_row = chunk * self.chunk_rows
+            n = min(self.chunk_rows, stop - first_row)
+            if n <= 0:
+                continue
+            if chunk == current_chunk:
+                chunk_values = values
+            else:
+                chunk_values = np.load(self._chunk_path(name, chunk), mmap_mode="r")
+            if columns is None:
+                result[first_row : first_row + n] = chunk_values[:n]
+            else:
+                result[first_row : first_row + n] = chunk_values[:n, columns]
+
+        return result
+
+    def clear_cache(self) -> None:
+        """
+        Forget the dataframes built so far (to call when the outputs change)
+        """
+        self._dataframes.clear()
+
+    def get_dataframe(
+        self, name: str, columns: Optional[Sequence[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Daily outputs as a dataframe
+
+        Arguments:
+
+            name (str): 'water_flux', 'water_storage' or 'crop_growth'
+
+            columns (list): columns to include (default: all of them)
+
+        Returns:
+
+            outputs (pandas.DataFrame): requested outputs
+
+        """
+        key = (name, None if columns is None else tuple(columns))
+        if key not in self._dataframes:
+            if name == "water_flux":
+                all_columns = WATER_FLUX_COLUMNS
+            elif name == "water_storage":
+                all_columns = water_storage_columns(self.water_storage.shape[1] - 3)
+            elif name == "crop_growth":
+                all_columns = CROP_GROWTH_COLUMNS
+            else:
+                raise ValueError(f"Unknown output '{name}'.")
+
+            if columns is None:
+                dataframe = pd.DataFrame(self.read(name), columns=all_columns)
+            else:
+                unknown = [column for column in columns if column not in all_columns]
+                if unknown:
+                    raise KeyError(f"Unknown {name} columns {unknown}.")
+                dataframe = pd.DataFrame(
+                    self.read(name, [all_columns.index(column) for column in columns]),
+                    columns=list(columns),
+                )
+            self._dataframes[key] = dataframe
+
+        return self._dataframes[key]
+
+    def get_final_stats(self) -> pd.DataFrame:
+        """
+        Final stats of the finished seasons as a dataframe, indexed by season
+
+        Returns:
+
+            final_stats (pandas.DataFrame): final stats at end of each season
+
+        """
+        key = ("final_stats", None)
+        if key not in self._dataframes:
+            finished = self.final_stats[self.final_stats["Season"] >= 0]
+            self._dataframes[key] = pd.DataFrame(finished, index=finished["Season"])
+
+        return self._dataframes[key]
@@ -0,0 +1,32 @@
+class OutputSink:
+    """
+    Output Sink Class stores how the daily outputs are written to disk while
+    the simulation runs, instead of being kept in memory for the whole
+    simulation period.
+
+    The daily outputs are written in chunks of chunk_size days, one .npy file
+    per output and chunk ('water_flux_000000.npy', ...), and only the chunk
+    being simulated is kept in memory. The getters of the model read the
+    files back when they are called.
+
+    Attributes:
+
+        chunk_size (int): number of days of each chunk
+
+        directory (str): directory of the chunk files. It must not be shared
+            with other models, nor hold chunk files that were not written with
+            this sink. If None, a temporary directory is used, and deleted
+            with the outputs of the model
+
+    """
+
+    def __init__(self, chunk_size=3650, directory=None):
+
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be equal to or greater than 1.")
+
+        self.chunk_size = chunk_size
+        self.directory = directory
+        # Chunk files written in directory with this sink, replaced when the
+        # next simulation starts
+        self._chunk_files = set()
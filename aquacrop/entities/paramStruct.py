@@ -22,6 +22,8 @@ class ParamStruct:
 
         CO2 (CO2): object containing reference and current co2 concentration
 
+        co2_table (CO2Table): CO2 concentration and crop adjustments of each year, used to reset the crops
+
         water_table (int): Water table present (1=yes, 0=no)
 
         z_gw (np.array): water_table depth (mm) for each day of simulation
@@ -38,12 +40,20 @@ class ParamStruct:
 
         Seasonal_Crop_List (list): List of CropStructs, one for each season (jit class objects)
 
+        Seasonal_Crop_NT_List (list): CropStructNT of each season passed to the solution functions, built from Seasonal_Crop_List when first needed (None until then, or after the crop paramaters change)
+
         crop_name_list (list): List of crop names, one for each season
 
         Fallow_Crop (CropStruct): CropStruct object (jit class) for off season
 
+        Fallow_Crop_NT (CropStructNT): CropStructNT built from Fallow_Crop when first needed (None until then)
+
         Fallow_Crop_Name (str): name of fallow crop
 
+        gdd_table (GDDTable): daily gdd's of the simulation period, used to find the calendar of the crops in gdd mode (and again when a season is reset)
+
+        season_gdd (np.array): gdd's of each day of the simulation period with the crop of its season, read by the time steps
+
         """
 
     def __init__(self):
@@ -63,6 +73,7 @@ class ParamStruct:
         self.CO2data = []
         self.CO2 = 0
         self.co2_concentration_adj = None
+        self.co2_table = None
 
         # water table
         self.water_table = 0
@@ -75,6 +86,12 @@ class ParamStruct:
         self.python_crop_list = []
         self.python_fallow_crop = 0
         self.Seasonal_Crop_List = []
+        self.Seasonal_Crop_NT_List = []
         self.crop_name_list = []
         self.Fallow_Crop = 0
-        self.Fallow_Crop_Name = ""
\ No newline at end of file
+        self.Fallow_Crop_NT = None
+        self.Fallow_Crop_Name = ""
+
+        # growing degree days
+        self.gdd_table = None
+        self.season_gdd = None
\ No newline at end of file
@@ -3,11 +3,13 @@ import pandas as pd
 
 from ..entities.modelConstants import ModelConstants
 from ..utils.prepare_gdd import prepare_gdd
-from typing import TYPE_CHECKING
+from typing import Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     # Important: classes are only imported when types are checked, not in production.
     from aquacrop.entities.crop import Crop
+    from aquacrop.entities.gddTable import GDDTable
+    from numpy import ndarray
     from pandas import DatetimeIndex, DataFrame
 
 
@@ -18,6 +20,7 @@ def compute_crop_calendar(
     clock_struct_simulation_end_date: str,
     clock_struct_time_span: "DatetimeIndex",
     weather_df: "DataFrame",
+    gdd_table: "GDDTable",
 ) -> "Crop":
     """
     Function to compute additional parameters needed to define crop phenological calendar
@@ -37,6 +40,8 @@ def compute_crop_calendar(
 
         weather_df (DataFrame):  weather data for simulation period
 
+        gdd_table (GDDTable):  daily gdd's of the simulation period (of weather_df)
+
 
     Returns:
 
@@ -122,38 +127,12 @@ def compute_crop_calendar(
             #                     idx = -1
             #             assert idx > -1
 
-            date_range = pd.date_range(pl_date, clock_struct_time_span[-1])
-            weather_df = weather_df.copy()
-            weather_df.index = weather_df.Date
-            weather_df = weather_df.loc[date_range]
-            temp_min = weather_df.MinTemp
-            temp_max = weather_df.MaxTemp
-
-            # Calculate gdd's
-            if crop.GDDmethod == 1:
-
-                Tmean = (temp_max + temp_min) / 2
-                Tmean = Tmean.clip(lower=crop.Tbase, upper=crop.Tupp)
-                gdd = Tmean - crop.Tbase
-
-            elif crop.GDDmethod == 2:
+            start, weather_df = _weather_from(weather_df, pl_date, clock_struct_time_span)
+            gdd = gdd_table.get(crop)[0][start : start + len(weather_df)]
 
-                temp_max = temp_max.clip(lower=crop.Tbase, upper=crop.Tupp)
-                temp_min = temp_min.clip(lower=crop.Tbase, upper=crop.Tupp)
-                Tmean = (temp_max + temp_min) / 2
-                gdd = Tmean - crop.Tbase
-
-            elif crop.GDDmethod == 3:
-
-                temp_max = temp_max.clip(lower=crop.Tbase, upper=crop.Tupp)
-                temp_min = temp_min.clip(upper=crop.Tupp)
-                Tmean = (temp_max + temp_min) / 2
-                Tmean = Tmean.clip(lower=crop.Tbase)
-                gdd = Tmean - crop.Tbase
-                
-            crop = prepare_gdd(weather_df, 
+            crop = prepare_gdd(weather_df,
                                clock_struct_simulation_start_date,
-                               clock_struct_simulation_end_date, 
+                               clock_struct_simulation_end_date,
                                gdd, crop, crop.SwitchGDDType)
 
             # Convert CGC to gdd mode
@@ -226,62 +205,81 @@ def compute_crop_calendar(
         #             else:
         #                 idx = -1
         #         assert idx> -1
-        date_range = pd.date_range(pl_date, clock_struct_time_span[-1])
-        weather_df = weather_df.copy()
-        weather_df.index = weather_df.Date
+        start, weather_df = _weather_from(weather_df, pl_date, clock_struct_time_span)
+        gdd = gdd_table.get(crop)[0][start : start + len(weather_df)]
+        gdd_cum = np.cumsum(gdd)
 
-        weather_df = weather_df.loc[date_range]
-        temp_min = weather_df.MinTemp
-        temp_max = weather_df.MaxTemp
+        assert (
+            gdd_cum[-1] > crop.Maturity
+        ), f"not enough growing degree days in simulation ({gdd_cum[-1]}) to reach maturity ({crop.Maturity})"
 
-        # Calculate gdd's
-        if crop.GDDmethod == 1:
+        # Calendar days from sowing to each gdd stage, found at once
+        stages = [crop.Maturity, crop.MaxCanopy, crop.CanopyDevEnd, crop.HIstart, crop.HIend]
+        if crop.CropType == 3:
+            stages.append(crop.FloweringEnd)
+        (
+            crop.MaturityCD,
+            crop.MaxCanopyCD,
+            crop.CanopyDevEndCD,
+            crop.HIstartCD,
+            crop.HIendCD,
+            *FloweringEnd,
+        ) = gdd_to_calendar_days(gdd_cum, stages).tolist()
 
-            Tmean = (temp_max + temp_min) / 2
-            Tmean = Tmean.clip(lower=crop.Tbase, upper=crop.Tupp)
-            gdd = Tmean - crop.Tbase
+        assert crop.MaturityCD < 365, "crop will take longer than 1 year to mature"
 
-        elif crop.GDDmethod == 2:
+        # Duration of yield_ formation in calendar days
+        crop.YldFormCD = crop.HIendCD - crop.HIstartCD
+        if crop.CropType == 3:
+            # Duration of flowering in calendar days
+            crop.FloweringCD = FloweringEnd[0] - crop.HIstartCD
+        else:
+            crop.FloweringCD = ModelConstants.NO_VALUE
 
-            temp_max = temp_max.clip(lower=crop.Tbase, upper=crop.Tupp)
-            temp_min = temp_min.clip(lower=crop.Tbase, upper=crop.Tupp)
-            Tmean = (temp_max + temp_min) / 2
-            gdd = Tmean - crop.Tbase
+    return crop
 
-        elif crop.GDDmethod == 3:
 
-            temp_max = temp_max.clip(lower=crop.Tbase, upper=crop.Tupp)
-            temp_min = temp_min.clip(upper=crop.Tupp)
-            Tmean = (temp_max + temp_min) / 2
-            Tmean = Tmean.clip(lower=crop.Tbase)
-            gdd = Tmean - crop.Tbase
+def _weather_from(
+    weather_df: "DataFrame",
+    pl_date: str,
+    clock_struct_time_span: "DatetimeIndex") -> Tuple[int, "DataFrame"]:
+    """
+    Weather data from the planting date to the end of the simulation, and
+    the row of weather_df of the planting date
+    """
+    date_range = pd.date_range(pl_date, clock_struct_time_span[-1])
+    start = np.searchsorted(weather_df.Date.to_numpy(), date_range[0].to_datetime64())
+    weather_df = weather_df.iloc[start : start + len(date_range)]
+    if (
+        len(weather_df) != len(date_range)
+        or weather_df.Date.iloc[0] != date_range[0]
+        or weather_df.Date.iloc[-1] != date_range[-1]
+    ):
+        raise KeyError(f"The weather data does not have every date from {pl_date}.")
+    return start, weather_df
+
+
+def gdd_to_calendar_days(
+    gdd_cum: "ndarray",
+    stages: "list") -> "ndarray":
+    """
+    Function to find the calendar days from sowing to gdd stages, with a
+    binary search of the cumulative gdd's for all the stages at once
 
-        gdd_cum = np.cumsum(gdd).reset_index(drop=True)
+    Arguments:
 
-        assert (
-            gdd_cum.values[-1] > crop.Maturity
-        ), f"not enough growing degree days in simulation ({gdd_cum.values[-1]}) to reach maturity ({crop.Maturity})"
+        gdd_cum (numpy.ndarray):  cumulative gdd's of each day from sowing
+            (non decreasing)
 
-        crop.MaturityCD = (gdd_cum > crop.Maturity).idxmax() + 1
+        stages (list):  gdd's from sowing to each stage
 
-        assert crop.MaturityCD < 365, "crop will take longer than 1 year to mature"
+    Returns:
 
-        # 1. gdd's from sowing to maximum canopy cover
-        crop.MaxCanopyCD = (gdd_cum > crop.MaxCanopy).idxmax() + 1
-        # 2. gdd's from sowing to end of vegetative growth
-        crop.CanopyDevEndCD = (gdd_cum > crop.CanopyDevEnd).idxmax() + 1
-        # 3. Calendar days from sowing to start of yield_ formation
-        crop.HIstartCD = (gdd_cum > crop.HIstart).idxmax() + 1
-        # 4. Calendar days from sowing to end of yield_ formation
-        crop.HIendCD = (gdd_cum > crop.HIend).idxmax() + 1
-        # 5. Duration of yield_ formation in calendar days
-        crop.YldFormCD = crop.HIendCD - crop.HIstartCD
-        if crop.CropType == 3:
-            # 1. Calendar days from sowing to end of flowering
-            FloweringEnd = (gdd_cum > crop.FloweringEnd).idxmax() + 1
-            # 2. Duration of flowering in calendar days
-            crop.FloweringCD = FloweringEnd - crop.HIstartCD
-        else:
-            crop.FloweringCD = ModelConstants.NO_VALUE
+        days (numpy.ndarray):  calendar days from sowing to each stage (the
+            first day on which the cumulative gdd's exceed the stage), 1 for
+            the stages that are not reached
 
-    return crop
+    """
+    days = np.searchsorted(gdd_cum, np.asarray(stages, dtype=np.float64), side="right")
+    days[days == len(gdd_cum)] = 0
+    return days + 1
@@ -4,7 +4,7 @@ import pandas as pd
 from .compute_crop_calendar import compute_crop_calendar
 from .calculate_HIGC import calculate_HIGC
 from .calculate_HI_linear import calculate_HI_linear
-from ..entities.co2 import CO2
+from ..entities.co2 import CO2, co2_table
 from ..entities.crop import CropStruct
 from copy import deepcopy
 from os.path import dirname, abspath
@@ -92,6 +92,7 @@ def compute_variables(
             clock_struct.simulation_end_date,
             clock_struct.time_span,
             weather_df,
+            param_struct.gdd_table,
         )
 
         # Harvest index param_struct.Seasonal_Crop_List[clock_struct.season_counter].Paramsgrowth coefficient
@@ -114,6 +115,10 @@ def compute_variables(
 
         param_struct.CropList[i] = crop
 
+    # Daily gdd's of the simulation period, with the gdd method of each crop
+    for crop in param_struct.CropList:
+        param_struct.gdd_table.get(crop)
+
     # Calculate WP adjustment factor for elevation in CO2 concentration
     # Load CO2 data
     co2Data = param_struct.CO2.co2_data
@@ -129,6 +134,8 @@ def compute_variables(
 
     # Store data
     param_struct.CO2.co2_data_processed = pd.Series(CO2conc_interp, index=sim_years)  # maybe get rid of this
+    # CO2 concentration and crop adjustments of every year, for the seasons
+    param_struct.co2_table = co2_table(param_struct.CO2)
 
     # Get CO2 concentration for first year
     CO2conc = param_struct.CO2.co2_data_processed.iloc[0]
@@ -234,4 +241,14 @@ def compute_variables(
 
     param_struct.Fallow_Crop = fallow_struct
 
+    # NamedTuple copies of the crop paramaters, built when first needed
+    param_struct.Seasonal_Crop_NT_List = [None] * len(param_struct.Seasonal_Crop_List)
+    param_struct.Fallow_Crop_NT = None
+
+    # Daily gdd's read by the time steps (the gdd method of a season's crop
+    # does not change when it is reset)
+    param_struct.season_gdd = param_struct.gdd_table.seasons_gdd(
+        param_struct.Seasonal_Crop_List, clock_struct.planting_days
+    )
+
     return param_struct
@@ -0,0 +1,131 @@
+"""
+Fingerprint of the inputs of the model initialisation
+"""
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Important: classes are only imported when types are checked, not in production.
+    from pandas import DataFrame
+    from aquacrop.entities.soil import Soil
+    from aquacrop.entities.crop import Crop
+    from aquacrop.entities.inititalWaterContent import InitialWaterContent
+    from aquacrop.entities.fieldManagement import FieldMngt
+    from aquacrop.entities.groundWater import GroundWater
+    from aquacrop.entities.co2 import CO2
+
+
+def fingerprint_inputs(
+    sim_start_time: str,
+    sim_end_time: str,
+    weather_df: "DataFrame",
+    soil: "Soil",
+    crop: "Crop",
+    initial_water_content: "InitialWaterContent",
+    field_management: "FieldMngt",
+    fallow_field_management: "FieldMngt",
+    groundwater: "GroundWater",
+    co2_concentration: "CO2",
+    off_season: bool) -> str:
+    """
+    Function to compute a stable fingerprint of everything the model
+    initialisation depends on, except the irrigation management (read
+    again for each model). Equal inputs give equal fingerprints in any
+    process.
+
+    Arguments:
+
+        sim_start_time (str): simulation start date
+
+        sim_end_time (str): simulation end date
+
+        weather_df (DataFrame): weather data (only the simulation period is used)
+
+        soil (Soil): soil paramaters
+
+        crop (Crop): crop paramaters
+
+        initial_water_content (InitialWaterContent): initial water content
+
+        field_management (FieldMngt): field management of the growing seasons
+
+        fallow_field_management (FieldMngt): field management of the fallow periods
+
+        groundwater (GroundWater): water table paramaters
+
+        co2_concentration (CO2): CO2 paramaters
+
+        off_season (bool): simulate the off season
+
+    Returns:
+
+        fingerprint (str): sha256 hex digest
+
+    """
+    start_date = pd.to_datetime(sim_start_time, format="%Y/%m/%d").to_datetime64()
+    end_date = pd.to_datetime(sim_end_time, format="%Y/%m/%d").to_datetime64()
+    dates = weather_df["Date"].to_numpy()
+    in_simulation = (dates >= start_date) & (dates <= end_date)
+    weather_slice = [
+        (column, weather_df[column].to_numpy()[in_simulation])
+        for column in weather_df.columns
+    ]
+
+    digest = hashlib.sha256()
+    for value in (
+        start_date,
+        end_date,
+        weather_slice,
+        soil,
+        crop,
+        initial_water_content,
+        field_management,
+        fallow_field_management,
+        groundwater,
+        co2_concentration,
+        off_season,
+    ):
+        _update_digest(digest, value)
+
+    return digest.hexdigest()
+
+
+def _update_digest(digest: "hashlib._Hash", value: Any) -> None:
+    """
+    Add a value to a fingerprint (with its type, so that e.g. 1 and '1' differ)
+    """
+    digest.update(type(value).__qualname__.encode())
+    if isinstance(value, pd.DataFrame):
+        digest.update(str(len(value.columns)).encode())
+        for column in value.columns:
+            _update_digest(digest, column)
+            _update_digest(digest, value[column])
+    elif isinstance(value, pd.Series):
+        if value.dtype.kind in "biufcmM":
+            # numbers and dates are hashed from their memory
+            _update_digest(digest, value.to_numpy())
+        else:
+            digest.update(pd.util.hash_pandas_object(value, index=False).values.tobytes())
+    elif isinstance(value, np.ndarray):
+        digest.update(f"{value.dtype.str}{value.shape}".encode())
+        if value.dtype.kind == "O":
+            _update_digest(digest, value.tolist())
+        else:
+            digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (list, tuple)):
+        digest.update(str(len(value)).encode())
+        for item in value:
+            _update_digest(digest, item)
+    elif isinstance(value, dict):
+        digest.update(str(len(value)).encode())
+        for key in sorted(value, key=repr):
+            _update_digest(digest, key)
+            _update_digest(digest, value[key])
+    elif hasattr(value, "__dict__") and not isinstance(value, type):
+        _update_digest(digest, vars(value))
+    else:
+        digest.update(repr(value).encode())
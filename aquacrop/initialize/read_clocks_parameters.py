@@ -45,8 +45,7 @@ def read_clock_parameters(
         freq="D", start=pandas_sim_start_time, end=pandas_sim_end_time
     )
 
-    clock_struct.step_start_time = clock_struct.time_span[0]
-    clock_struct.step_end_time = clock_struct.time_span[1]
+    clock_struct.simulation_end_day = clock_struct.n_steps - 1
 
     clock_struct.sim_off_season = off_season
 
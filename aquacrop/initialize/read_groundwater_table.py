@@ -7,6 +7,7 @@ if TYPE_CHECKING:
     from aquacrop.entities.clockStruct import ClockStruct
     from aquacrop.entities.paramStruct import ParamStruct
     from aquacrop.entities.groundWater import GroundWater
+    from numpy import ndarray
 
 
 
@@ -44,65 +45,83 @@ def read_groundwater_table(
     elif WT == "Y":
         ParamStruct.water_table = 1
 
-        df = pd.DataFrame([GwStruct.dates, GwStruct.values]).T
-        df.columns = ["Date", "Depth(mm)"]
-
-        # get date in correct format
-        df.Date = pd.DatetimeIndex(df.Date)
-        # print(f'DF length: {len(df)}')
-        # print(f'Index length: {len(df.index)}')
-
-        if len(df) == 1:
-            
-            # if only 1 watertable depth then set that value to be constant
-            # accross whole simulation            
-            z_gw = pd.DataFrame(
-                data=df["Depth(mm)"].iloc[0]*np.ones(len(ClockStruct.time_span)),
-                index=pd.to_datetime(ClockStruct.time_span),
-                columns=['Depth(mm)']
-            )['Depth(mm)']
-
-        elif len(df) > 1:
-            # check water table method
-            if WTMethod == "Constant":
-
-                # No interpolation between dates
-
-                # create daily depths for each simulation day
-                z_gw = pd.Series(
-                    np.nan * np.ones(len(ClockStruct.time_span)), index=ClockStruct.time_span
-                )
-
-                # assign constant depth for all dates in between
-                for row in range(len(df)):
-                    date = df.Date.iloc[row]
-                    depth = df["Depth(mm)"].iloc[row]
-                    z_gw.loc[z_gw.index >= date] = depth
-                    if row == 0:
-                        z_gw.loc[z_gw.index <= date] = depth
-
-            elif WTMethod == "Variable":
-
-                # Linear interpolation between dates
-
-                # create daily depths for each simulation day
-                # fill unspecified days with NaN
-                z_gw = pd.Series(
-                    np.nan * np.ones(len(ClockStruct.time_span)), index=ClockStruct.time_span
-                )
-
-                for row in range(len(df)):
-                    date = df.Date.iloc[row]
-                    depth = df["Depth(mm)"].iloc[row]
-                    z_gw.loc[date] = depth
-
-                # Interpolate daily groundwater depths
-                z_gw = z_gw.interpolate()
+        # observation dates in days since the start of the simulation
+        observation_days = (
+            pd.DatetimeIndex(GwStruct.dates) - ClockStruct.simulation_start_date
+        ).days
 
         # assign values to Paramstruct object
-        ParamStruct.z_gw = z_gw.values
-        ParamStruct.zGW_dates = z_gw.index.values
+        ParamStruct.z_gw = daily_groundwater_depths(
+            np.arange(len(ClockStruct.time_span)),
+            observation_days,
+            GwStruct.values,
+            WTMethod,
+        )
+        ParamStruct.zGW_dates = ClockStruct.time_span.values
         ParamStruct.WTMethod = WTMethod
 
     return ParamStruct
 
+
+def daily_groundwater_depths(
+    days: "ndarray",
+    observation_days: "ndarray",
+    depths: "ndarray",
+    method: str = "Constant") -> "ndarray":
+    """
+    Function to build the daily water table depths from the observations,
+    with a binary search of the observations of each day rather than a pass
+    over the days for each observation
+
+    Arguments:
+
+        days (numpy.ndarray): days to build the depths for (e.g. days since
+            the start of the simulation)
+
+        observation_days (numpy.ndarray): day of each observation, on the same
+            scale as days
+
+        depths (numpy.ndarray): depth of each observation
+
+        method (str): 'Constant' to keep each depth from its day on (the
+            first depth before that), 'Variable' to interpolate linearly
+            between observations (NaN before the first one, the last depth
+            after the last one)
+
+    Returns:
+
+        z_gw (numpy.ndarray): depth of each day
+
+    """
+    days = np.asarray(days, dtype=np.int64)
+    observation_days = np.asarray(observation_days, dtype=np.int64)
+    depths = np.asarray(depths, dtype=np.float64)
+    if len(observation_days) == 0 or len(observation_days) != len(depths):
+        raise ValueError(
+            "The groundwater dates and values must have the same (non zero) length."
+        )
+
+    # observations sorted by day (in the given order for repeated days)
+    order = np.argsort(observation_days, kind="stable")
+    sorted_days = observation_days[order]
+    previous = np.searchsorted(sorted_days, days, side="right") - 1
+
+    # if only 1 watertable depth then set that value to be constant
+    # accross whole simulation
+    if method == "Constant" or len(observation_days) == 1:
+        # No interpolation between dates: each observation sets the depth of
+        # the days from its date on, in the given order, so a day has the
+        # depth of the last given observation on or before it (the first
+        # observation sets every day before them)
+        last_given = np.maximum.accumulate(order)
+        return depths[np.where(previous >= 0, last_given[np.maximum(previous, 0)], 0)]
+
+    if method == "Variable":
+        # Linear interpolation between dates, with the last given
+        # observation of repeated days
+        last_of_day = np.append(sorted_days[1:] != sorted_days[:-1], True)
+        return np.interp(
+            days, sorted_days[last_of_day], depths[order][last_of_day], left=np.nan
+        )
+
+    raise ValueError(f"Unknown water table method '{method}', use 'Constant' or 'Variable'.")
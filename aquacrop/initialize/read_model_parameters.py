@@ -1,11 +1,15 @@
+import copy
+
 import numpy as np
 import pandas as pd
+from ..entities.gddTable import GDDTable
 from ..entities.paramStruct import ParamStruct
 from .compute_crop_calendar import compute_crop_calendar
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     # Important: classes are only imported when types are checked, not in production.
+    from numpy import ndarray
     from pandas import DataFrame
     from aquacrop.entities.clockStruct import ClockStruct
     from aquacrop.entities.crop import Crop
@@ -43,17 +47,23 @@ def read_model_parameters(
     # create param_struct object
     param_struct = ParamStruct()
 
+    # The model works on a copy of the soil (fill_nan creates a new profile),
+    # so that the same soil can be used by other models
+    soil = copy.copy(soil)
     soil.fill_nan()
 
     # Assign soil object to param_struct
     param_struct.Soil = soil
 
-    while soil.zSoil < crop.Zmax + 0.1:
-        for i in soil.profile.index[::-1]:
-            if soil.profile.loc[i, "dz"] < 0.25:
-                soil.profile.loc[i, "dz"] += 0.1
-                soil.fill_nan()
-                break
+    # Daily gdd's of the simulation period, with the gdd method of each crop
+    param_struct.gdd_table = GDDTable(
+        weather_df.MaxTemp.to_numpy(), weather_df.MinTemp.to_numpy()
+    )
+
+    # Deepen the soil profile to the maximum rooting depth (plus 0.1 m)
+    if soil.zSoil < crop.Zmax + 0.1:
+        soil.profile["dz"] = extend_soil_profile(soil.profile["dz"].values, crop.Zmax + 0.1)
+        soil.fill_nan()
 
     # TODO: Why all these commented lines? The model does not allow rotations now?
     ###########
@@ -113,6 +123,7 @@ def read_model_parameters(
             clock_struct.simulation_end_date,
             clock_struct.time_span,
             weather_df,
+            param_struct.gdd_table,
         )
         mature = int(crop.MaturityCD + 30)
         plant = pd.to_datetime("1990/" + crop.planting_date)
@@ -194,13 +205,61 @@ def read_model_parameters(
     # save clock paramaters
     clock_struct.planting_dates = pd.to_datetime(planting_dates)
     clock_struct.harvest_dates = pd.to_datetime(harvest_dates)
+    clock_struct.planting_days = np.asarray(
+        (clock_struct.planting_dates - clock_struct.simulation_start_date).days, dtype=np.int64
+    )
+    clock_struct.harvest_days = np.asarray(
+        (clock_struct.harvest_dates - clock_struct.simulation_start_date).days, dtype=np.int64
+    )
     clock_struct.n_seasons = len(planting_dates)
 
     # Initialise growing season counter
-    if pd.to_datetime(clock_struct.step_start_time) == clock_struct.planting_dates[0]:
+    if clock_struct.planting_days[0] == clock_struct.time_step_counter:
         clock_struct.season_counter = 0
     else:
         clock_struct.season_counter = -1
 
     # return the FileLocations object as i have added some elements
     return clock_struct, param_struct
+
+
+def extend_soil_profile(
+    dz: "ndarray",
+    min_depth: float) -> "ndarray":
+    """
+    Function to deepen a soil profile to a minimum depth, adding 0.1 m at a
+    time to the deepest compartment thinner than 0.25 m (until it is not
+    thinner than 0.25 m)
+
+    Arguments:
+
+        dz (numpy.ndarray):  thickness of each compartment (m), rounded to 0.01 m
+
+        min_depth (float):  minimum depth of the profile (m)
+
+    Returns:
+
+        dz (numpy.ndarray):  new thickness of each compartment (m)
+
+    """
+    # thickness in cm, to add whole increments of 10 cm
+    dz_cm = np.rint(np.asarray(dz, dtype=np.float64) * 100).astype(np.int64)
+
+    # increments each compartment takes before it is not thinner than 0.25 m
+    capacity = np.maximum(-((dz_cm - 25) // 10), 0)
+
+    # number of increments needed to reach the minimum depth
+    depths = np.round((dz_cm.sum() + 10 * np.arange(capacity.sum() + 1)) / 100, 2)
+    deep_enough = depths >= min_depth
+    if not deep_enough.any():
+        raise ValueError(
+            f"The soil profile cannot be deepened to {min_depth} m "
+            "(all compartments are at least 0.25 m thick)."
+        )
+    needed = np.argmax(deep_enough)
+
+    # increments are added from the deepest compartment up
+    capacity_up = capacity[::-1]
+    taken_up = np.clip(needed - (np.cumsum(capacity_up) - capacity_up), 0, capacity_up)
+
+    return np.round((dz_cm + 10 * taken_up[::-1]) / 100, 2)
@@ -0,0 +1,235 @@
+"""
+This file contains run_many, which runs many AquaCropModel scenarios in a pool
+of worker processes.
+"""
+import copy
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from .core import AquaCropModel
+from .entities.co2 import CO2
+from .timestep.run_single_timestep import time_step_function
+
+if TYPE_CHECKING:
+    # Important: classes are only imported when types are checked, not in production.
+    from pandas import DataFrame
+    from numpy import ndarray
+
+
+OUTPUT_NAMES = ("water_flux", "water_storage", "crop_growth", "final_stats")
+
+# Data frames shared with the current worker process, indexed by their key,
+# and the shared memory blocks holding them
+_worker_frames: List["DataFrame"] = []
+_worker_blocks: List[shared_memory.SharedMemory] = []
+
+FrameDescriptor = Tuple[str, int, List[Tuple[str, np.dtype, int]]]
+
+
+def _share_frame(
+    frame: "DataFrame", blocks: List[shared_memory.SharedMemory]
+) -> FrameDescriptor:
+    """
+    Copy the columns of a data frame, one after the other, into a new shared
+    memory block
+
+    Arguments:
+
+        frame (DataFrame): data frame to share
+
+        blocks (list): shared memory blocks created so far (updated in place)
+
+    Returns:
+
+        descriptor (tuple): block name, number of rows and the name, dtype
+            and offset of each column
+
+    """
+    columns = []
+    size = 0
+    for name in frame.columns:
+        values = frame[name].to_numpy()
+        columns.append((name, values.dtype, size))
+        size += -(-values.nbytes // 8) * 8
+
+    block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    blocks.append(block)
+    for name, dtype, offset in columns:
+        np.ndarray(len(frame), dtype=dtype, buffer=block.buf, offset=offset)[:] = frame[name]
+    return block.name, len(frame), columns
+
+
+def _attach_frames(descriptors: Sequence[FrameDescriptor]) -> List["DataFrame"]:
+    """
+    Rebuild the shared data frames as read-only views of their shared memory
+    blocks (no copy), which are kept open in _worker_blocks
+
+    Arguments:
+
+        descriptors (list): block name, number of rows and columns of each frame
+
+    Returns:
+
+        frames (list): data frames, in the same order as the descriptors
+
+    """
+    frames = []
+    for name, n_rows, columns in descriptors:
+        block = shared_memory.SharedMemory(name=name)
+        _worker_blocks.append(block)
+        data = {}
+        for column, dtype, offset in columns:
+            values = np.ndarray(n_rows, dtype=dtype, buffer=block.buf, offset=offset)
+            values.flags.writeable = False
+            data[column] = values
+        frames.append(pd.DataFrame(data, copy=False))
+
+    return frames
+
+
+def _init_worker(descriptors: Sequence[FrameDescriptor]) -> None:
+    """
+    Attach a worker process to the shared weather and CO2 data, and load the
+    solution functions of the backend. The worker keeps them (and the
+    compiled kernels) for all its tasks.
+
+    Arguments:
+
+        descriptors (list): block name, number of rows and columns of each frame
+
+    """
+    _worker_frames[:] = _attach_frames(descriptors)
+    time_step_function()
+
+
+def _run_config(task: Tuple[Dict, bool, Tuple[str, ...]]) -> Dict[str, "ndarray"]:
+    """
+    Run one scenario in the current process
+
+    Arguments:
+
+        task (tuple): AquaCropModel arguments (with shared frame keys), compiled flag
+            and names of the outputs to return
+
+    Returns:
+
+        results (dict): requested outputs as numpy arrays
+
+    """
+    config, compiled, outputs = task
+    config = dict(config)
+    config["weather_df"] = _worker_frames[config["weather_df"]]
+    co2 = copy.copy(config["co2_concentration"])
+    co2.co2_data = _worker_frames[co2.co2_data]
+    config["co2_concentration"] = co2
+
+    model = AquaCropModel(**config)
+    model.run_model(till_termination=True, compiled=compiled)
+
+    # The outputs are returned as stored by the model, no dataframe is built
+    results = {}
+    for name in outputs:
+        if name == "final_stats":
+            final_stats = model._outputs.final_stats
+            results[name] = final_stats[final_stats["Season"] >= 0]
+        else:
+            results[name] = model._outputs.read(name)
+
+    return results
+
+
+def run_many(
+    configs: Sequence[Dict],
+    workers: Optional[int] = None,
+    compiled: bool = True,
+    outputs: Sequence[str] = OUTPUT_NAMES,
+) -> List[Dict[str, "ndarray"]]:
+    """
+    Run many AquaCropModel scenarios (e.g. climate or management sweeps) in a
+    pool of worker processes.
+
+    The weather data frames and CO2 tables are copied once into shared memory
+    and attached by every worker when it starts, instead of being pickled with
+    every scenario. Workers are reused for all the scenarios.
+
+    Arguments:
+
+        configs (list): keyword arguments of AquaCropModel for each scenario
+
+        workers (int): number of worker processes (default: number of CPUs).
+            With workers=1 the scenarios run in the current process
+
+        compiled (bool): run each simulation in the compiled loop
+
+        outputs (list): outputs to return, among 'water_flux', 'water_storage',
+            'crop_growth' and 'final_stats'
+
+    Returns:
+
+        results (list): for each scenario, a dict with the requested outputs.
+            Daily outputs are 2D float arrays with the columns of the model
+            data frames, final_stats is a numpy structured array with one
+            row per finished season
+
+    """
+    outputs = tuple(outputs)
+    for name in outputs:
+        if name not in OUTPUT_NAMES:
+            raise ValueError(f"Unknown output '{name}'. Options are {OUTPUT_NAMES}.")
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be equal to or greater than 1.")
+
+    # Replace every weather and CO2 data frame with a key to a shared frame
+    frames: List["DataFrame"] = []
+    frame_keys: Dict[int, int] = {}
+
+    def frame_key(frame: "DataFrame") -> int:
+        if id(frame) not in frame_keys:
+            frame_keys[id(frame)] = len(frames)
+            frames.append(frame)
+        return frame_keys[id(frame)]
+
+    default_co2 = None
+    tasks = []
+    for config in configs:
+        config = dict(config)
+        config["weather_df"] = frame_key(config["weather_df"])
+
+        co2 = config.get("co2_concentration")
+        if co2 is None:
+            if default_co2 is None:
+                default_co2 = CO2()
+            co2 = default_co2
+        co2 = copy.copy(co2)
+        co2.co2_data = frame_key(co2.co2_data)
+        config["co2_concentration"] = co2
+
+        tasks.append((config, compiled, outputs))
+
+    if workers == 1:
+        _worker_frames[:] = frames
+        try:
+            return [_run_config(task) for task in tasks]
+        finally:
+            _worker_frames.clear()
+
+    blocks: List[shared_memory.SharedMemory] = []
+    try:
+        descriptors = [_share_frame(frame, blocks) for frame in frames]
+        chunksize = max(1, len(tasks) // (4 * workers))
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(descriptors,)
+        ) as executor:
+            return list(executor.map(_run_config, tasks, chunksize=chunksize))
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
@@ -0,0 +1,379 @@
+"""
+Registry of the AOT compiled solution modules.
+
+Every compiled module (solution_<name> extension) is recorded in
+aquacrop/solution/aot_registry.json with the key of the environment it was
+compiled for (Python, numba and numpy versions) and a hash of its source,
+including the aquacrop modules it imports (so the export signatures and the
+numba types they use are part of the hash). The compiled modules are only
+used when the registry matches the current environment and sources, and they
+are built explicitly with the aquacrop-compile command, never on import.
+The command only compiles the modules that are not up to date, in parallel.
+"""
+import argparse
+import ast
+import hashlib
+import importlib
+import json
+import os
+import sys
+import sysconfig
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+REGISTRY_PATH = os.path.join(PACKAGE_DIR, "solution", "aot_registry.json")
+
+AOT_MODULES = [
+    "aquacrop.solution.water_stress",
+    "aquacrop.solution.evap_layer_water_content",
+    "aquacrop.solution.root_zone_water",
+    "aquacrop.solution.cc_development",
+    "aquacrop.solution.update_CCx_CDC",
+    "aquacrop.solution.cc_required_time",
+    "aquacrop.solution.aeration_stress",
+    "aquacrop.solution.HIadj_pre_anthesis",
+    "aquacrop.solution.HIadj_post_anthesis",
+    "aquacrop.solution.HIadj_pollination",
+    "aquacrop.solution.drainage",
+    "aquacrop.solution.rainfall_partition",
+    "aquacrop.solution.check_groundwater_table",
+    "aquacrop.solution.soil_evaporation",
+    "aquacrop.solution.root_development",
+    "aquacrop.solution.infiltration",
+    "aquacrop.solution.HIref_current_day",
+    "aquacrop.solution.temperature_stress",
+    "aquacrop.solution.biomass_accumulation",
+    "aquacrop.solution.pre_irrigation",
+    "aquacrop.solution.irrigation",
+    "aquacrop.solution.capillary_rise",
+    "aquacrop.solution.germination",
+    "aquacrop.solution.growth_stage",
+    "aquacrop.solution.canopy_cover",
+    "aquacrop.solution.transpiration",
+    "aquacrop.solution.groundwater_inflow",
+    "aquacrop.solution.harvest_index",
+]
+
+
+def environment_key() -> str:
+    """
+    Key of the environment the modules are compiled for
+
+    Returns:
+
+        key (str): Python, numba and numpy versions
+
+    """
+    import numba
+    import numpy
+
+    return (
+        f"python-{sys.version_info.major}.{sys.version_info.minor}"
+        f"-numba-{numba.__version__}-numpy-{numpy.__version__}"
+    )
+
+
+def _module_path(module: str) -> Optional[str]:
+    """
+    Source file of an aquacrop module (None if it is not a python file of the package)
+    """
+    parts = module.split(".")
+    if parts[0] != "aquacrop":
+        return None
+    path = os.path.join(PACKAGE_DIR, *parts[1:])
+    if os.path.isfile(path + ".py"):
+        return path + ".py"
+    if os.path.isfile(os.path.join(path, "__init__.py")):
+        return os.path.join(path, "__init__.py")
+    return None
+
+
+def _imported_modules(module: str, path: str) -> List[str]:
+    """
+    aquacrop modules imported by a module
+    """
+    with open(path, "rb") as file:
+        tree = ast.parse(file.read(), filename=path)
+
+    package = module if path.endswith("__init__.py") else module.rsplit(".", 1)[0]
+    imported = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imported.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level > 0:
+                base = ".".join(package.split(".")[: len(package.split(".")) - node.level + 1])
+                base = f"{base}.{node.module}" if node.module else base
+            else:
+                base = node.module or ""
+            imported.append(base)
+            # from package import module
+            imported.extend(f"{base}.{alias.name}" for alias in node.names)
+
+    return [name for name in imported if name.startswith("aquacrop")]
+
+
+def source_modules(module: str) -> List[str]:
+    """
+    aquacrop modules a module is compiled from: the module and the aquacrop
+    modules it imports (recursively)
+
+    Arguments:
+
+        module (str): module name, e.g. 'aquacrop.solution.drainage'
+
+    Returns:
+
+        modules (list): sorted module names
+
+    """
+    sources: Dict[str, str] = {}
+    pending = [module]
+    seen: Set[str] = set()
+    while pending:
+        name = pending.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        path = _module_path(name)
+        if path is None or path in sources.values():
+            continue
+        sources[name] = path
+        pending.extend(_imported_modules(name, path))
+
+    return sorted(sources)
+
+
+def source_hash(modules: Sequence[str]) -> str:
+    """
+    Hash of the source of modules
+
+    Arguments:
+
+        modules (list): module names, see source_modules
+
+    Returns:
+
+        hash (str): sha256 hex digest
+
+    """
+    digest = hashlib.sha256()
+    for name in modules:
+        path = _module_path(name)
+        digest.update(name.encode())
+        if path is not None:
+            with open(path, "rb") as file:
+                digest.update(file.read())
+
+    return digest.hexdigest()
+
+
+def artifact_path(module: str) -> str:
+    """
+    Path of the compiled extension of a module
+
+    Arguments:
+
+        module (str): module name, e.g. 'aquacrop.solution.drainage'
+
+    Returns:
+
+        path (str): path of the solution_<name> extension
+
+    """
+    name = module.rsplit(".", 1)[1]
+    return os.path.join(
+        PACKAGE_DIR, "solution", "solution_" + name + sysconfig.get_config_var("EXT_SUFFIX")
+    )
+
+
+def read_registry() -> Dict:
+    """
+    Read the registry of compiled modules
+
+    Returns:
+
+        registry (dict): environment key and source hash of each compiled module
+
+    """
+    try:
+        with open(REGISTRY_PATH) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_registry(registry: Dict) -> None:
+    tmp_path = REGISTRY_PATH + ".tmp"
+    with open(tmp_path, "w") as file:
+        json.dump(registry, file, indent=2, sort_keys=True)
+    os.replace(tmp_path, REGISTRY_PATH)
+
+
+def is_up_to_date(module: str, registry: Optional[Dict] = None) -> bool:
+    """
+    Check if the compiled module matches the current environment and source
+
+    Arguments:
+
+        module (str): module name, e.g. 'aquacrop.solution.drainage'
+
+        registry (dict): registry of compiled modules (read if not given)
+
+    Returns:
+
+        up_to_date (bool): the compiled module can be used
+
+    """
+    if registry is None:
+        registry = read_registry()
+    entry = registry.get(module)
+    return (
+        entry is not None
+        and entry.get("environment") == environment_key()
+        and entry.get("source_hash") == source_hash(entry.get("sources", []))
+        and os.path.isfile(artifact_path(module))
+    )
+
+
+def aot_is_available() -> bool:
+    """
+    Check, without importing them, if all the compiled modules can be used
+
+    Returns:
+
+        available (bool): every compiled module matches the current environment and sources
+
+    """
+    registry = read_registry()
+    return all(is_up_to_date(module, registry) for module in AOT_MODULES)
+
+
+def _compile_module(module: str) -> Tuple[str, float]:
+    """
+    AOT compile a module (run in the worker processes of compile_modules)
+    """
+    start = time.perf_counter()
+    importlib.import_module(module).cc.compile()
+    return module, time.perf_counter() - start
+
+
+def compile_modules(
+    modules: Sequence[str] = AOT_MODULES,
+    jobs: Optional[int] = None,
+    callback: Optional[Callable[[str, float], None]] = None,
+) -> Dict[str, float]:
+    """
+    AOT compile modules concurrently and record them in the registry
+
+    Arguments:
+
+        modules (list): names of the modules to compile
+
+        jobs (int): number of worker processes (default: number of CPUs)
+
+        callback (function): called with the module name and its compile
+            time (in seconds) when each module is compiled
+
+    Returns:
+
+        timings (dict): compile time of each module in seconds
+
+    """
+    # Sources are hashed before compiling, so that changes made meanwhile
+    # are compiled next time
+    entries = {}
+    for module in modules:
+        sources = source_modules(module)
+        entries[module] = {
+            "environment": environment_key(),
+            "sources": sources,
+            "source_hash": source_hash(sources),
+            "artifact": os.path.basename(artifact_path(module)),
+        }
+
+    jobs = min(jobs or os.cpu_count() or 1, max(len(modules), 1))
+    timings = {}
+
+    def record(module: str, seconds: float) -> None:
+        timings[module] = seconds
+        registry = read_registry()
+        registry[module] = entries[module]
+        _write_registry(registry)
+        if callback is not None:
+            callback(module, seconds)
+
+    if jobs == 1:
+        for module in modules:
+            record(*_compile_module(module))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [executor.submit(_compile_module, module) for module in modules]
+            for future in as_completed(futures):
+                record(*future.result())
+
+    return timings
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    aquacrop-compile command: AOT compile the solution modules that are not
+    up to date with the current environment and sources
+    """
+    parser = argparse.ArgumentParser(
+        prog="aquacrop-compile",
+        description="AOT compile the aquacrop solution modules.",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="compile modules that are up to date"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="number of modules compiled in parallel (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="only check if the compiled modules are up to date",
+    )
+    args = parser.parse_args(argv)
+
+    registry = read_registry()
+    outdated = [
+        module
+        for module in AOT_MODULES
+        if args.force or not is_up_to_date(module, registry)
+    ]
+
+    if args.check:
+        for module in outdated:
+            print(f"{module} is not compiled for {environment_key()}")
+        return 1 if outdated else 0
+
+    if not outdated:
+        print(f"All modules are compiled for {environment_key()}")
+        return 0
+
+    print(f"Compiling {len(outdated)} modules for {environment_key()}...")
+    skipped = len(AOT_MODULES) - len(outdated)
+    if skipped:
+        print(f"{skipped} modules are up to date")
+
+    start = time.perf_counter()
+    compile_modules(
+        outdated,
+        jobs=args.jobs,
+        callback=lambda module, seconds: print(f"{seconds:8.1f}s  {module}", flush=True),
+    )
+    print(f"{time.perf_counter() - start:8.1f}s  total")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,343 @@
+"""
+Benchmark suite of aquacrop.
+
+Each benchmark times one part of a simulation (import, initialisation, daily
+steps, outputs, long simulations, groundwater, irrigation methods, growing
+degree day calendars). The suite is run for each backend in a new interpreter
+(see aquacrop.solution.backend), the results can be saved to a JSON baseline
+file, and the benchmarks slower than the baseline by more than a threshold are
+reported as regressions:
+
+    python -m aquacrop.scripts.benchmark --backend python jit --save baseline.json
+
+    python -m aquacrop.scripts.benchmark --backend python jit --baseline baseline.json
+
+The command exits with status 1 if there are regressions.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Benchmark name: function returning the time (in seconds) of the benchmarked part
+BENCHMARKS: Dict[str, Callable[[], float]] = {}
+
+
+def benchmark(name: str) -> Callable:
+    """
+    Register a benchmark function
+    """
+
+    def decorator(function: Callable[[], float]) -> Callable[[], float]:
+        BENCHMARKS[name] = function
+        return function
+
+    return decorator
+
+
+def _weather(file_name: str):
+    from aquacrop.utils import prepare_weather, get_filepath
+
+    return prepare_weather(get_filepath(file_name))
+
+
+def _tunis_wheat(sim_end_time: str = "1980/05/30", crop_name: str = "Wheat", **kwargs):
+    """
+    Wheat in Tunis, the model of the tests (new entities on each call, the
+    model may modify them)
+    """
+    from aquacrop import AquaCropModel, Soil, Crop, InitialWaterContent
+
+    weather = kwargs.pop("weather", None)
+    return AquaCropModel(
+        sim_start_time="1979/10/01",
+        sim_end_time=sim_end_time,
+        weather_df=_weather("tunis_climate.txt") if weather is None else weather,
+        soil=Soil(soil_type="SandyLoam"),
+        crop=Crop(crop_name, planting_date="10/01"),
+        initial_water_content=InitialWaterContent(value=["FC"]),
+        **kwargs,
+    )
+
+
+def _champion_maize(sim_end_time: str):
+    """
+    Maize in Champion (Nebraska) from 1982
+    """
+    from aquacrop import AquaCropModel, Soil, Crop, InitialWaterContent
+
+    return AquaCropModel(
+        sim_start_time="1982/05/01",
+        sim_end_time=sim_end_time,
+        weather_df=_weather("champion_climate.txt"),
+        soil=Soil(soil_type="SiltClayLoam"),
+        crop=Crop("Maize", planting_date="05/01", harvest_date="10/30"),
+        initial_water_content=InitialWaterContent(value=["FC"]),
+    )
+
+
+def _time_run(model, **kwargs) -> float:
+    start = time.perf_counter()
+    model.run_model(till_termination=True, **kwargs)
+    return time.perf_counter() - start
+
+
+def _time_subprocess(statement: str) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", statement], check=True)
+    return time.perf_counter() - start
+
+
+@benchmark("import_aquacrop")
+def import_aquacrop() -> float:
+    return _time_subprocess("import aquacrop")
+
+
+@benchmark("import_model")
+def import_model() -> float:
+    return _time_subprocess("from aquacrop import AquaCropModel")
+
+
+@benchmark("initialize")
+def initialize() -> float:
+    model = _tunis_wheat()
+    start = time.perf_counter()
+    model._initialize()
+    return time.perf_counter() - start
+
+
+@benchmark("step_per_day")
+def step_per_day() -> float:
+    model = _tunis_wheat()
+    model._initialize()
+    num_steps = 200
+    start = time.perf_counter()
+    model.run_model(num_steps=num_steps, initialize_model=False)
+    return (time.perf_counter() - start) / num_steps
+
+
+@benchmark("outputs")
+def outputs() -> float:
+    model = _tunis_wheat(sim_end_time="1985/05/30")
+    model.run_model(till_termination=True)
+    model._outputs.clear_cache()
+    start = time.perf_counter()
+    model.get_water_flux()
+    model.get_water_storage()
+    model.get_crop_growth()
+    model.get_simulation_results()
+    return time.perf_counter() - start
+
+
+@benchmark("multi_season")
+def multi_season() -> float:
+    return _time_run(_champion_maize("2018/12/31"))
+
+
+@benchmark("multi_season_compiled")
+def multi_season_compiled() -> float:
+    return _time_run(_champion_maize("2018/12/31"), compiled=True)
+
+
+@benchmark("groundwater")
+def groundwater() -> float:
+    from aquacrop import GroundWater
+
+    weather = _weather("tunis_climate.txt")
+    # Too much rain for a groundwater effect in the original weather
+    weather["Precipitation"] = weather["Precipitation"] / 10
+    model = _tunis_wheat(
+        sim_end_time="1985/05/30",
+        weather=weather,
+        groundwater=GroundWater(
+            water_table="Y",
+            method="Variable",
+            dates=["1979/10/01", "1982/10/01", "1985/05/30"],
+            values=[2.66, 2.0, 2.4],
+        ),
+    )
+    return _time_run(model)
+
+
+def _irrigation_benchmark(irrigation_method: int, **kwargs) -> Callable[[], float]:
+    def irrigation() -> float:
+        from aquacrop import IrrigationManagement
+
+        model = _tunis_wheat(
+            sim_end_time="1985/05/30",
+            irrigation_management=IrrigationManagement(
+                irrigation_method=irrigation_method, **kwargs
+            ),
+        )
+        return _time_run(model)
+
+    return irrigation
+
+
+benchmark("irrigation_rainfed")(_irrigation_benchmark(0))
+benchmark("irrigation_soil_moisture_targets")(_irrigation_benchmark(1, SMT=[70] * 4))
+benchmark("irrigation_interval")(_irrigation_benchmark(2, IrrInterval=7))
+benchmark("irrigation_net")(_irrigation_benchmark(4, NetIrrSMT=70))
+benchmark("irrigation_constant_depth")(_irrigation_benchmark(5, depth=2))
+
+
+@benchmark("irrigation_schedule")
+def irrigation_schedule() -> float:
+    import pandas as pd
+
+    dates = pd.date_range("1979/10/01", "1985/05/30", freq="14D")
+    schedule = pd.DataFrame({"Date": dates, "Depth": [25.0] * len(dates)})
+    return _irrigation_benchmark(3, Schedule=schedule)()
+
+
+@benchmark("gdd_calendar")
+def gdd_calendar() -> float:
+    return _time_run(_tunis_wheat(sim_end_time="1985/05/30", crop_name="WheatGDD"))
+
+
+def run_benchmarks(
+    names: Optional[Sequence[str]] = None, repeat: int = 3
+) -> Dict[str, float]:
+    """
+    Run benchmarks with the backend of this interpreter
+
+    Arguments:
+
+        names (list): names of the benchmarks to run (default: all of them)
+
+        repeat (int): number of runs of each benchmark
+
+    Returns:
+
+        results (dict): minimum time of each benchmark in seconds
+
+    """
+    results = {}
+    for name in BENCHMARKS if names is None else names:
+        results[name] = min(BENCHMARKS[name]() for _ in range(repeat))
+    return results
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float,
+) -> List[Tuple[str, str, float, float]]:
+    """
+    Benchmarks slower than the baseline by more than a threshold
+
+    Arguments:
+
+        results (dict): time of each benchmark (seconds) of each backend
+
+        baseline (dict): baseline time of each benchmark of each backend
+
+        threshold (float): allowed slowdown, e.g. 0.2 for 20%
+
+    Returns:
+
+        regressions (list): (backend, benchmark, baseline time, time) of the regressions
+
+    """
+    regressions = []
+    for backend, backend_results in results.items():
+        for name, seconds in backend_results.items():
+            baseline_seconds = baseline.get(backend, {}).get(name)
+            if baseline_seconds is not None and seconds > baseline_seconds * (1 + threshold):
+                regressions.append((backend, name, baseline_seconds, seconds))
+    return regressions
+
+
+def _run_backend(backend: str, names: Optional[Sequence[str]], repeat: int) -> Dict[str, float]:
+    """
+    Run the benchmarks with a backend in a new interpreter
+    """
+    command = [sys.executable, "-m", "aquacrop.scripts.benchmark", "--worker", "--repeat", str(repeat)]
+    if names:
+        command += ["--only", *names]
+    result = subprocess.run(
+        command,
+        env=dict(os.environ, AQUACROP_BACKEND=backend),
+        check=True,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    from aquacrop.scripts.aot_registry import aot_is_available, environment_key
+
+    parser = argparse.ArgumentParser(
+        prog="python -m aquacrop.scripts.benchmark", description="Benchmark aquacrop."
+    )
+    parser.add_argument(
+        "--backend",
+        nargs="+",
+        choices=("python", "aot", "jit"),
+        default=None,
+        help="backends to benchmark (default: python, jit, and aot if compiled)",
+    )
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="benchmarks to run")
+    parser.add_argument("--repeat", type=int, default=3, help="runs of each benchmark")
+    parser.add_argument("--baseline", help="baseline file to compare the results with")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="slowdown reported as a regression (default: 0.2 for 20%%)",
+    )
+    parser.add_argument("--save", help="file to save the results to, as a baseline")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(run_benchmarks(args.only, args.repeat)))
+        return 0
+
+    backends = args.backend
+    if backends is None:
+        backends = ["python", "jit"] + (["aot"] if aot_is_available() else [])
+
+    results = {}
+    for backend in backends:
+        results[backend] = _run_backend(backend, args.only, args.repeat)
+        for name, seconds in results[backend].items():
+            print(f"{backend:>6}  {name:<34}{seconds:12.6f}s")
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        if baseline.get("environment") != environment_key():
+            print(
+                f"Note: the baseline was recorded with {baseline.get('environment')}, "
+                f"not {environment_key()}"
+            )
+        regressions = compare(results, baseline["backends"], args.threshold)
+        for backend, name, baseline_seconds, seconds in regressions:
+            print(
+                f"REGRESSION {backend} {name}: {seconds:.6f}s "
+                f"(baseline {baseline_seconds:.6f}s, {seconds / baseline_seconds - 1:+.0%})"
+            )
+        if regressions:
+            status = 1
+
+    if args.save:
+        saved = {"environment": environment_key(), "backends": {}}
+        if os.path.isfile(args.save):
+            with open(args.save) as file:
+                saved["backends"] = json.load(file).get("backends", {})
+        saved["backends"].update(results)
+        with open(args.save, "w") as file:
+            json.dump(saved, file, indent=2, sort_keys=True)
+
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
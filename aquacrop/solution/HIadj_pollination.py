@@ -2,6 +2,7 @@ import numpy as np
 
 from numba import njit, f8, i8, b1
 from numba.pycc import CC
+from numba.extending import register_jitable
 
 
 try:
@@ -25,6 +26,7 @@ if TYPE_CHECKING:
 # temporary name for compiled module
 cc = CC("solution_HIadj_pollination")
 
+@register_jitable
 @cc.export("HIadj_pollination", (f8,f8,f8,f8,f8,KswNT_type_sig,KstNT_type_sig,f8))
 def HIadj_pollination(
     NewCond_CC: float,
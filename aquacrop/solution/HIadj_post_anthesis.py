@@ -2,6 +2,7 @@ import numpy as np
 
 from numba import njit, f8, i8, b1
 from numba.pycc import CC
+from numba.extending import register_jitable
 
 try:
     from ..entities.crop import CropStructNT_type_sig
@@ -21,6 +22,7 @@ if TYPE_CHECKING:
 cc = CC("solution_HIadj_post_anthesis")
 
 
+@register_jitable
 @cc.export("HIadj_post_anthesis", (i8,f8,f8,i8,f8,f8,f8,f8,CropStructNT_type_sig,KswNT_type_sig,))
 def HIadj_post_anthesis(
     NewCond_DelayedCDs: int,
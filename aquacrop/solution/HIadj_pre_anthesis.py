@@ -2,12 +2,14 @@ import numpy as np
 
 from numba import njit, f8, i8, b1
 from numba.pycc import CC
+from numba.extending import register_jitable
 
 
 # temporary name for compiled module
 cc = CC("solution_HIadj_pre_anthesis")
 
 
+@register_jitable
 @cc.export("HIadj_pre_anthesis", (f8,f8,f8,f8))
 def HIadj_pre_anthesis(
     NewCond_B: float,
@@ -2,12 +2,10 @@ import numpy as np
 
 from numba import njit, f8, i8, b1
 from numba.pycc import CC
+from numba.extending import register_jitable
+
+from .signatures import SIGNATURES
 
-try:
-    from ..entities.crop import CropStructNT_type_sig
-except:
-    from entities.crop import CropStructNT_type_sig
-    
 # temporary name for compiled module
 cc = CC("solution_HIref_current_day")
 
@@ -18,7 +16,8 @@ if TYPE_CHECKING:
     from aquacrop.entities.crop import CropStructNT
 
 
-@cc.export("HIref_current_day", (f8,f8,i8,i8,b1,f8,f8,f8,f8,CropStructNT_type_sig,b1))
+@register_jitable
+@cc.export("HIref_current_day", SIGNATURES["HIref_current_day"])
 def HIref_current_day(
     NewCond_HIref: float,
     NewCond_HIfinal: float,
@@ -1,18 +1,12 @@
-import os
+from numba.extending import register_jitable
 
-if __name__ != "__main__":
-    if os.getenv("DEVELOPMENT"):
-        from .cc_development import cc_development
-        from .cc_required_time import cc_required_time
-    else:
-        from .solution_cc_development import cc_development
-        from .solution_cc_required_time import cc_required_time
-else:
-    from .cc_development import cc_development
-    from .cc_required_time import cc_required_time
-   
+# Sub-kernels are imported from source so that adjust_CCx can also be compiled
+# as part of the whole-simulation loop
+from .cc_development import cc_development
+from .cc_required_time import cc_required_time
 
 
+@register_jitable
 def adjust_CCx(
     cc_prev: float,
     CCo: float,
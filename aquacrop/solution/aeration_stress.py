@@ -1,6 +1,7 @@
 
 from numba import njit, f8, i8, b1
 from numba.pycc import CC
+from numba.extending import register_jitable
 
 try:
     from ..entities.rootZoneWaterContent import thRZNT_type_sig
@@ -16,6 +17,7 @@ cc.verbose = False
 
 
 
+@register_jitable
 @cc.export("aeration_stress", (f8,f8,thRZNT_type_sig))
 def aeration_stress(
     NewCond_AerDays: float,
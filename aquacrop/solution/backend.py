@@ -0,0 +1,122 @@
+"""
+Selection of the backend that runs the solution functions of each time step.
+
+    python: the pure python functions (slow, easy to debug)
+
+    aot: the numba AOT compiled solution_<name> modules (see aquacrop-compile)
+
+    jit: the pure python functions compiled with numba njit for the
+        signatures of the aot modules, and cached on disk (slow the first time)
+
+The backend is set with the AQUACROP_BACKEND environment variable. If it is
+not set, the python backend is used in DEVELOPMENT mode, and the aot backend
+otherwise, falling back to python (with a message on stderr naming the
+aquacrop-compile command) if the modules are not compiled for the current
+environment. It is resolved once, when the first
+simulation step loads the solution functions (not when aquacrop is imported).
+"""
+import importlib
+import os
+import sys
+
+from typing import Callable, Optional
+
+BACKENDS = ("python", "aot", "jit")
+
+_backend: Optional[str] = None
+
+
+def get_backend() -> str:
+    """
+    Backend of the solution functions
+
+    Returns:
+
+        backend (str): 'python', 'aot' or 'jit'
+
+    """
+    global _backend
+    if _backend is None:
+        _backend = _resolve_backend(os.getenv("AQUACROP_BACKEND"))
+    return _backend
+
+
+def _resolve_backend(requested: Optional[str]) -> str:
+    from ..scripts.aot_registry import aot_is_available, environment_key
+
+    if requested:
+        backend = requested.lower()
+        if backend not in BACKENDS:
+            raise ValueError(
+                f"Unknown AQUACROP_BACKEND '{requested}', use one of {BACKENDS}."
+            )
+        if backend == "aot" and not aot_is_available():
+            raise ImportError(
+                "The aquacrop modules are not compiled for this environment. "
+                "Run 'aquacrop-compile' to compile them."
+            )
+        return backend
+
+    if os.getenv("DEVELOPMENT"):
+        return "python"
+
+    # The compiled modules are only used if they match the current environment
+    # and sources (see aquacrop.scripts.aot_registry)
+    if aot_is_available():
+        return "aot"
+
+    # Printed, not only warned (warnings can be filtered), as the simulation
+    # is several times slower than with the compiled modules
+    print(
+        "\033[1;33m The aquacrop modules are not compiled for this environment "
+        f"({environment_key()}), the simulation runs in pure python (slower).\n"
+        " Run 'aquacrop-compile' once to compile them, or set AQUACROP_BACKEND "
+        "to 'jit' (compiled on first use) or 'python' (no message).\033[0m",
+        file=sys.stderr,
+    )
+    return "python"
+
+
+def load_function(name: str, backend: Optional[str] = None) -> Callable:
+    """
+    Solution function of the backend
+
+    Arguments:
+
+        name (str): name of the function (and of its module in aquacrop.solution)
+
+        backend (str): 'python', 'aot' or 'jit' (default: get_backend())
+
+    Returns:
+
+        function (function): solution function
+
+    """
+    backend = get_backend() if backend is None else backend
+    if backend == "aot":
+        return getattr(importlib.import_module(f"{__package__}.solution_{name}"), name)
+
+    module = importlib.import_module(f"{__package__}.{name}")
+    function = getattr(module, name)
+    if backend == "jit":
+        from numba import njit
+        from .signatures import SIGNATURES
+
+        # Compiled for the AOT signature, and called without the dispatcher:
+        # it finds the numba type of every argument on each call, which is
+        # slower than the python function for the named tuples of many
+        # fields. The compiled function converts the arguments to the types
+        # of the signature, as the aot modules do (e.g. the named tuples of C
+        # arrays to the named tuples of A arrays of SoilProfileNT). The entry
+        # point of the compiled function is not part of the public numba API:
+        # without it, the function is compiled for the types of the arguments
+        # and called with the dispatcher.
+        signature = tuple(SIGNATURES[name])
+        dispatcher = njit(signature, cache=True)(function)
+        compile_result = getattr(dispatcher, "overloads", {}).get(signature)
+        entry_point = getattr(compile_result, "entry_point", None)
+        if entry_point is None:
+            return njit(cache=True)(function)
+        return entry_point
+
+    return function
@@ -2,20 +2,20 @@ import numpy as np
 
 from numba import njit, f8, i8, b1
 from numba.pycc import CC
+from numba.extending import register_jitable
+
+from .signatures import SIGNATURES
+
 # temporary name for compiled module
 cc = CC("solution_biomass_accumulation")
 cc.verbose = False
 
 
-try:
-    from ..entities.crop import CropStructNT_type_sig
-except:
-    from entities.crop import CropStructNT_type_sig
-
 from typing import NamedTuple, Tuple
 
 
-@cc.export("biomass_accumulation", (CropStructNT_type_sig,i8,i8,f8,f8,f8,f8,f8,f8,f8,b1))
+@register_jitable
+@cc.export("biomass_accumulation", SIGNATURES["biomass_accumulation"])
 def biomass_accumulation(
     Crop: NamedTuple,
     NewCond_DAP: int,
@@ -1,51 +1,60 @@
-
-import os
 import numpy as np
+from numba.extending import register_jitable
+from numba import f8, i8, b1
+from numba.pycc import CC
 
-from ..entities.totalAvailableWater import TAW
-from ..entities.moistureDepletion import Dr
+from .signatures import SIGNATURES
 
-from ..entities.waterStressCoefficients import  Ksw
+# Sub-kernels are imported from source so that canopy_cover can also be
+# compiled as part of the whole-simulation loop
 from .adjust_CCx import adjust_CCx
+from .water_stress import water_stress
+from .root_zone_water_cache import cached_root_zone_water
+from .cc_development import cc_development
+from .update_CCx_CDC import update_CCx_CDC
+from .cc_required_time import cc_required_time
 
-if __name__ != "__main__":
-    if os.getenv("DEVELOPMENT"):
-        from .water_stress import water_stress
-        from .root_zone_water import root_zone_water
-        from .cc_development import cc_development
-        from .update_CCx_CDC import update_CCx_CDC
-        from .cc_required_time import cc_required_time
-    else:
-        from .solution_water_stress import water_stress
-        from .solution_root_zone_water import root_zone_water
-        from .solution_cc_development import cc_development
-        from .solution_update_CCx_CDC import update_CCx_CDC
-        from .solution_cc_required_time import cc_required_time
-else:
-    from .water_stress import water_stress
-    from .root_zone_water import root_zone_water
-    from .cc_development import cc_development
-    from .update_CCx_CDC import update_CCx_CDC
-    from .cc_required_time import cc_required_time
-
-from typing import NamedTuple, Tuple, TYPE_CHECKING
+from typing import Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     # Important: classes are only imported when types are checked, not in production.
-    from aquacrop.entities.initParamVariables import InitialCondition
     from aquacrop.entities.soilProfile import SoilProfileNT
     from aquacrop.entities.crop import CropStructNT
+    from numpy import ndarray
+
+# temporary name for compiled module
+cc = CC("solution_canopy_cover")
 
+
+@register_jitable
+@cc.export("canopy_cover", SIGNATURES["canopy_cover"])
 def canopy_cover(
     Crop: "CropStructNT",
     prof: "SoilProfileNT",
     Soil_zTop: float,
-    InitCond: "InitialCondition",
+    NewCond_DAP: int,
+    NewCond_DelayedCDs: float,
+    NewCond_GDDcum: float,
+    NewCond_DelayedGDDs: float,
+    NewCond_Zroot: float,
+    NewCond_th: "ndarray",
+    NewCond_CC: float,
+    NewCond_CC_NS: float,
+    NewCond_CCxAct: float,
+    NewCond_CCxAct_NS: float,
+    NewCond_CCxW: float,
+    NewCond_CCxW_NS: float,
+    NewCond_CC0adj: float,
+    NewCond_ProtectedSeed: bool,
+    NewCond_CropDead: bool,
+    NewCond_PrematSenes: bool,
+    NewCond_CCxEarlySen: float,
+    NewCond_tEarlySen: float,
     gdd: float,
     et0: float,
     growing_season: bool,
-    ):
-    # def CCCrop,Soil_Profile,Soil_zTop,InitCond,gdd,et0,growing_season):
+    root_zone_cache: "ndarray",
+    ) -> Tuple[float, float, float, float, float, float, float, float, bool, bool, bool, float, float, float, float]:
 
     """
     Function to simulate canopy growth/decline
@@ -61,7 +70,41 @@ def canopy_cover(
 
         Soil_zTop (float): top soil depth
 
-        InitCond (InitialCondition): InitCond object
+        NewCond_DAP (int): days after planting
+
+        NewCond_DelayedCDs (float): delayed calendar days
+
+        NewCond_GDDcum (float): cumulative growing degree days
+
+        NewCond_DelayedGDDs (float): delayed growing degree days
+
+        NewCond_Zroot (float): rooting depth
+
+        NewCond_th (numpy.array): soil water content
+
+        NewCond_CC (float): canopy cover on previous day
+
+        NewCond_CC_NS (float): canopy cover (no stress) on previous day
+
+        NewCond_CCxAct (float): actual maximum canopy cover
+
+        NewCond_CCxAct_NS (float): actual maximum canopy cover (no stress)
+
+        NewCond_CCxW (float): maximum canopy cover for withered canopy effects
+
+        NewCond_CCxW_NS (float): maximum canopy cover for withered canopy effects (no stress)
+
+        NewCond_CC0adj (float): adjusted initial canopy cover
+
+        NewCond_ProtectedSeed (bool): is the seedling protected
+
+        NewCond_CropDead (bool): has the crop died
+
+        NewCond_PrematSenes (bool): is the canopy in premature senescence
+
+        NewCond_CCxEarlySen (float): canopy cover at start of early senescence
+
+        NewCond_tEarlySen (float): days in early senescence
 
         gdd (float): Growing Degree Days
 
@@ -69,37 +112,64 @@ def canopy_cover(
 
         growing_season (bool): is it currently within the growing season (True, Flase)
 
+        root_zone_cache (numpy.array): root zone water results of the current day (updated in place)
+
     Returns:
 
-        NewCond (InitialCondition): updated InitCond object
+        NewCond_CCprev (float): canopy cover on previous day
+
+        NewCond_CC (float): updated canopy cover
+
+        NewCond_CC_NS (float): updated canopy cover (no stress)
+
+        NewCond_CCxAct (float): updated actual maximum canopy cover
+
+        NewCond_CCxAct_NS (float): updated actual maximum canopy cover (no stress)
+
+        NewCond_CCxW (float): updated maximum canopy cover for withered canopy effects
+
+        NewCond_CCxW_NS (float): updated maximum canopy cover for withered canopy effects (no stress)
+
+        NewCond_CC0adj (float): updated adjusted initial canopy cover
+
+        NewCond_ProtectedSeed (bool): updated seedling protection flag
+
+        NewCond_CropDead (bool): updated crop death flag
+
+        NewCond_PrematSenes (bool): updated premature senescence flag
+
+        NewCond_CCxEarlySen (float): updated canopy cover at start of early senescence
+
+        NewCond_tEarlySen (float): updated days in early senescence
+
+        NewCond_CCadj (float): canopy cover adjusted for micro-advective effects
+
+        NewCond_CCadj_NS (float): canopy cover (no stress) adjusted for micro-advective effects
 
 
     """
 
     # Function to simulate canopy growth/decline
 
-    InitCond_CC_NS = InitCond.canopy_cover_ns
-    InitCond_CC = InitCond.canopy_cover
-    InitCond_ProtectedSeed = InitCond.protected_seed
-    InitCond_CCxAct = InitCond.ccx_act
-    InitCond_CropDead = InitCond.crop_dead
-    InitCond_tEarlySen = InitCond.t_early_sen
-    InitCond_CCxW = InitCond.ccx_w
+    InitCond_CC_NS = NewCond_CC_NS
+    InitCond_CC = NewCond_CC
+    InitCond_ProtectedSeed = NewCond_ProtectedSeed
+    InitCond_CCxAct = NewCond_CCxAct
+    InitCond_CropDead = NewCond_CropDead
+    InitCond_tEarlySen = NewCond_tEarlySen
+    InitCond_CCxW = NewCond_CCxW
 
     ## Store initial conditions in a new structure for updating ##
-    NewCond = InitCond
-    NewCond.cc_prev = InitCond.canopy_cover
+    NewCond_CCprev = NewCond_CC
 
     ## Calculate canopy development (if in growing season) ##
     if growing_season == True:
         # Calculate root zone water content
-        taw = TAW()
-        root_zone_depletion = Dr()
-        # thRZ = RootZoneWater()
-        _, root_zone_depletion.Zt, root_zone_depletion.Rz, taw.Zt, taw.Rz, _,_,_,_,_,_ = root_zone_water(
+        _, Dr_Zt, Dr_Rz, TAW_Zt, TAW_Rz, _,_,_,_,_,_ = cached_root_zone_water(
+            root_zone_cache,
             prof,
-            float(NewCond.z_root),
-            NewCond.th,
+            float(NewCond_Zroot),
+            NewCond_th,
             Soil_zTop,
             float(Crop.Zmin),
             Crop.Aer,
@@ -108,25 +178,24 @@ def canopy_cover(
         # _,root_zone_depletion,taw,_ = root_zone_water(Soil_Profile,float(NewCond.z_root),NewCond.th,Soil_zTop,float(Crop.Zmin),Crop.Aer)
         # Check whether to use root zone or top soil depletions for calculating
         # water stress
-        if (root_zone_depletion.Rz / taw.Rz) <= (root_zone_depletion.Zt / taw.Zt):
+        if (Dr_Rz / TAW_Rz) <= (Dr_Zt / TAW_Zt):
             # Root zone is wetter than top soil, so use root zone value
-            root_zone_depletion = root_zone_depletion.Rz
-            taw = taw.Rz
+            root_zone_depletion = Dr_Rz
+            taw = TAW_Rz
         else:
             # Top soil is wetter than root zone, so use top soil values
-            root_zone_depletion = root_zone_depletion.Zt
-            taw = taw.Zt
+            root_zone_depletion = Dr_Zt
+            taw = TAW_Zt
 
         # Determine if water stress is occurring
         beta = True
-        water_stress_coef = Ksw()
-        water_stress_coef.exp, water_stress_coef.sto, water_stress_coef.sen, water_stress_coef.pol, water_stress_coef.sto_lin = water_stress(
+        Ksw_Exp, Ksw_Sto, Ksw_Sen, Ksw_Pol, Ksw_StoLin = water_stress(
             Crop.p_up,
             Crop.p_lo,
             Crop.ETadj,
             Crop.beta,
             Crop.fshape_w,
-            NewCond.t_early_sen,
+            NewCond_tEarlySen,
             root_zone_depletion,
             taw,
             et0,
@@ -138,79 +207,79 @@ def canopy_cover(
         # Get canopy cover growth time
         if Crop.CalendarType == 1:
             dtCC = 1
-            tCCadj = NewCond.dap - NewCond.delayed_cds
+            tCCadj = NewCond_DAP - NewCond_DelayedCDs
         elif Crop.CalendarType == 2:
             dtCC = gdd
-            tCCadj = NewCond.gdd_cum - NewCond.delayed_gdds
+            tCCadj = NewCond_GDDcum - NewCond_DelayedGDDs
 
         ## Canopy development (potential) ##
         if (tCCadj < Crop.Emergence) or (round(tCCadj) > Crop.Maturity):
             # No canopy development before emergence/germination or after
             # maturity
-            NewCond.canopy_cover_ns = 0
+            NewCond_CC_NS = 0
         elif tCCadj < Crop.CanopyDevEnd:
             # Canopy growth can occur
             if InitCond_CC_NS <= Crop.CC0:
                 # Very small initial canopy_cover.
-                NewCond.canopy_cover_ns = Crop.CC0 * np.exp(Crop.CGC * dtCC)
+                NewCond_CC_NS = Crop.CC0 * np.exp(Crop.CGC * dtCC)
                 # print(Crop.CC0,np.exp(Crop.CGC*dtCC))
             else:
                 # Canopy growing
                 tmp_tCC = tCCadj - Crop.Emergence
-                NewCond.canopy_cover_ns = cc_development(
+                NewCond_CC_NS = cc_development(
                     Crop.CC0, 0.98 * Crop.CCx, Crop.CGC, Crop.CDC, tmp_tCC, "Growth", Crop.CCx
                 )
 
             # Update maximum canopy cover size in growing season
-            NewCond.ccx_act_ns = NewCond.canopy_cover_ns
+            NewCond_CCxAct_NS = NewCond_CC_NS
         elif tCCadj > Crop.CanopyDevEnd:
             # No more canopy growth is possible or canopy in decline
             # Set CCx for calculation of withered canopy effects
-            NewCond.ccx_w_ns = NewCond.ccx_act_ns
+            NewCond_CCxW_NS = NewCond_CCxAct_NS
             if tCCadj < Crop.Senescence:
                 # Mid-season stage - no canopy growth
-                NewCond.canopy_cover_ns = InitCond_CC_NS
+                NewCond_CC_NS = InitCond_CC_NS
                 # Update maximum canopy cover size in growing season
-                NewCond.ccx_act_ns = NewCond.canopy_cover_ns
+                NewCond_CCxAct_NS = NewCond_CC_NS
             else:
                 # Late-season stage - canopy decline
                 tmp_tCC = tCCadj - Crop.Senescence
-                NewCond.canopy_cover_ns = cc_development(
+                NewCond_CC_NS = cc_development(
                     Crop.CC0,
-                    NewCond.ccx_act_ns,
+                    NewCond_CCxAct_NS,
                     Crop.CGC,
                     Crop.CDC,
                     tmp_tCC,
                     "Decline",
-                    NewCond.ccx_act_ns,
+                    NewCond_CCxAct_NS,
                 )
 
         ## Canopy development (actual) ##
         if (tCCadj < Crop.Emergence) or (round(tCCadj) > Crop.Maturity):
             # No canopy development before emergence/germination or after
             # maturity
-            NewCond.canopy_cover = 0
-            NewCond.cc0_adj = Crop.CC0
+            NewCond_CC = 0
+            NewCond_CC0adj = Crop.CC0
         elif tCCadj < Crop.CanopyDevEnd:
             # Canopy growth can occur
-            if InitCond_CC <= NewCond.cc0_adj or (
-                (InitCond_ProtectedSeed == True) and (InitCond_CC <= (1.25 * NewCond.cc0_adj))
+            if InitCond_CC <= NewCond_CC0adj or (
+                (InitCond_ProtectedSeed == True) and (InitCond_CC <= (1.25 * NewCond_CC0adj))
             ):
                 # Very small initial canopy_cover or seedling in protected phase of
                 # growth. In this case, assume no leaf water expansion stress
                 if InitCond_ProtectedSeed == True:
                     tmp_tCC = tCCadj - Crop.Emergence
-                    NewCond.canopy_cover = cc_development(
+                    NewCond_CC = cc_development(
                         Crop.CC0, Crop.CCx, Crop.CGC, Crop.CDC, tmp_tCC, "Growth", Crop.CCx
                     )
                     # Check if seed protection should be turned off
-                    if NewCond.canopy_cover > (1.25 * NewCond.cc0_adj):
+                    if NewCond_CC > (1.25 * NewCond_CC0adj):
                         # Turn off seed protection - lead expansion stress can
                         # occur on future time steps.
-                        NewCond.protected_seed = False
+                        NewCond_ProtectedSeed = False
 
                 else:
-                    NewCond.canopy_cover = NewCond.cc0_adj * np.exp(Crop.CGC * dtCC)
+                    NewCond_CC = NewCond_CC0adj * np.exp(Crop.CGC * dtCC)
 
             else:
                 # Canopy growing
@@ -218,13 +287,13 @@ def canopy_cover(
                 if InitCond_CC < (0.9799 * Crop.CCx):
                     # Adjust canopy growth coefficient for leaf expansion water
                     # stress effects
-                    CGCadj = Crop.CGC * water_stress_coef.exp
+                    CGCadj = Crop.CGC * Ksw_Exp
                     if CGCadj > 0:
 
                         # Adjust CCx for change in CGC
                         CCXadj = adjust_CCx(
                             InitCond_CC,
-                            NewCond.cc0_adj,
+                            NewCond_CC0adj,
                             Crop.CCx,
                             CGCadj,
                             Crop.CDC,
@@ -235,12 +304,12 @@ def canopy_cover(
                         )
                         if CCXadj < 0:
 
-                            NewCond.canopy_cover = InitCond_CC
+                            NewCond_CC = InitCond_CC
                         elif abs(InitCond_CC - (0.9799 * Crop.CCx)) < 0.001:
 
                             # Approaching maximum canopy cover size
                             tmp_tCC = tCCadj - Crop.Emergence
-                            NewCond.canopy_cover = cc_development(
+                            NewCond_CC = cc_development(
                                 Crop.CC0, Crop.CCx, Crop.CGC, Crop.CDC, tmp_tCC, "Growth", Crop.CCx
                             )
                         else:
@@ -248,15 +317,15 @@ def canopy_cover(
                             # Determine time required to reach canopy_cover on previous,
                             # day, given CGCAdj value
                             tReq = cc_required_time(
-                                InitCond_CC, NewCond.cc0_adj, CCXadj, CGCadj, Crop.CDC, "CGC"
+                                InitCond_CC, NewCond_CC0adj, CCXadj, CGCadj, Crop.CDC, "CGC"
                             )
                             if tReq > 0:
 
                                 # Calclate gdd's for canopy growth
                                 tmp_tCC = tReq + dtCC
                                 # Determine new canopy size
-                                NewCond.canopy_cover = cc_development(
-                                    NewCond.cc0_adj,
+                                NewCond_CC = cc_development(
+                                    NewCond_CC0adj,
                                     CCXadj,
                                     CGCadj,
                                     Crop.CDC,
@@ -264,94 +333,93 @@ def canopy_cover(
                                     "Growth",
                                     Crop.CCx,
                                 )
-                                # print(NewCond.dap,CCXadj,tReq)
+                                # print(NewCond_DAP,CCXadj,tReq)
 
                             else:
                                 # No canopy growth
-                                NewCond.canopy_cover = InitCond_CC
+                                NewCond_CC = InitCond_CC
 
                     else:
 
                         # No canopy growth
-                        NewCond.canopy_cover = InitCond_CC
+                        NewCond_CC = InitCond_CC
                         # Update CC0
-                        if NewCond.canopy_cover > NewCond.cc0_adj:
-                            NewCond.cc0_adj = Crop.CC0
+                        if NewCond_CC > NewCond_CC0adj:
+                            NewCond_CC0adj = Crop.CC0
                         else:
-                            NewCond.cc0_adj = NewCond.canopy_cover
+                            NewCond_CC0adj = NewCond_CC
 
                 else:
                     # Canopy approaching maximum size
                     tmp_tCC = tCCadj - Crop.Emergence
-                    NewCond.canopy_cover = cc_development(
+                    NewCond_CC = cc_development(
                         Crop.CC0, Crop.CCx, Crop.CGC, Crop.CDC, tmp_tCC, "Growth", Crop.CCx
                     )
-                    NewCond.cc0_adj = Crop.CC0
+                    NewCond_CC0adj = Crop.CC0
 
-            if NewCond.canopy_cover > InitCond_CCxAct:
+            if NewCond_CC > InitCond_CCxAct:
                 # Update actual maximum canopy cover size during growing season
-                NewCond.ccx_act = NewCond.canopy_cover
+                NewCond_CCxAct = NewCond_CC
 
         elif tCCadj > Crop.CanopyDevEnd:
 
             # No more canopy growth is possible or canopy is in decline
             if tCCadj < Crop.Senescence:
                 # Mid-season stage - no canopy growth
-                NewCond.canopy_cover = InitCond_CC
-                if NewCond.canopy_cover > InitCond_CCxAct:
+                NewCond_CC = InitCond_CC
+                if NewCond_CC > InitCond_CCxAct:
                     # Update actual maximum canopy cover size during growing
                     # season
-                    NewCond.ccx_act = NewCond.canopy_cover
+                    NewCond_CCxAct = NewCond_CC
 
             else:
                 # Late-season stage - canopy decline
                 # Adjust canopy decline coefficient for difference between actual
                 # and potential CCx
-                CDCadj = Crop.CDC * ((NewCond.ccx_act + 2.29) / (Crop.CCx + 2.29))
+                CDCadj = Crop.CDC * ((NewCond_CCxAct + 2.29) / (Crop.CCx + 2.29))
                 # Determine new canopy size
                 tmp_tCC = tCCadj - Crop.Senescence
-                NewCond.canopy_cover = cc_development(
-                    NewCond.cc0_adj,
-                    NewCond.ccx_act,
+                NewCond_CC = cc_development(
+                    NewCond_CC0adj,
+                    NewCond_CCxAct,
                     Crop.CGC,
                     CDCadj,
                     tmp_tCC,
                     "Decline",
-                    NewCond.ccx_act,
+                    NewCond_CCxAct,
                 )
 
             # Check for crop growth termination
-            if (NewCond.canopy_cover < 0.001) and (InitCond_CropDead == False):
+            if (NewCond_CC < 0.001) and (InitCond_CropDead == False):
                 # Crop has died
-                NewCond.canopy_cover = 0
-                NewCond.crop_dead = True
+                NewCond_CC = 0
+                NewCond_CropDead = True
 
         ## Canopy senescence due to water stress (actual) ##
         if tCCadj >= Crop.Emergence:
             if (tCCadj < Crop.Senescence) or (InitCond_tEarlySen > 0):
                 # Check for early canopy senescence  due to severe water
                 # stress.
-                if (water_stress_coef.sen < 1) and (InitCond_ProtectedSeed == False):
+                if (Ksw_Sen < 1) and (InitCond_ProtectedSeed == False):
 
                     # Early canopy senescence
-                    NewCond.premat_senes = True
+                    NewCond_PrematSenes = True
                     if InitCond_tEarlySen == 0:
                         # No prior early senescence
-                        NewCond.ccx_early_sen = InitCond_CC
+                        NewCond_CCxEarlySen = InitCond_CC
 
                     # Increment early senescence gdd counter
-                    NewCond.t_early_sen = InitCond_tEarlySen + dtCC
+                    NewCond_tEarlySen = InitCond_tEarlySen + dtCC
                     # Adjust canopy decline coefficient for water stress
                     beta = False
 
-                    water_stress_coef = Ksw()
-                    water_stress_coef.exp, water_stress_coef.sto, water_stress_coef.sen, water_stress_coef.pol, water_stress_coef.sto_lin = water_stress(
+                    Ksw_Exp, Ksw_Sto, Ksw_Sen, Ksw_Pol, Ksw_StoLin = water_stress(
                         Crop.p_up,
                         Crop.p_lo,
                         Crop.ETadj,
                         Crop.beta,
                         Crop.fshape_w,
-                        NewCond.t_early_sen,
+                        NewCond_tEarlySen,
                         root_zone_depletion,
                         taw,
                         et0,
@@ -359,28 +427,28 @@ def canopy_cover(
                     )
 
                     # water_stress_coef = water_stress(Crop, NewCond, root_zone_depletion, taw, et0, beta)
-                    if water_stress_coef.sen > 0.99999:
+                    if Ksw_Sen > 0.99999:
                         CDCadj = 0.0001
                     else:
-                        CDCadj = (1 - (water_stress_coef.sen ** 8)) * Crop.CDC
+                        CDCadj = (1 - (Ksw_Sen ** 8)) * Crop.CDC
 
                     # Get new canpy cover size after senescence
-                    if NewCond.ccx_early_sen < 0.001:
+                    if NewCond_CCxEarlySen < 0.001:
                         CCsen = 0
                     else:
                         # Get time required to reach canopy_cover at end of previous day, given
                         # CDCadj
-                        tReq = (np.log(1 + (1 - InitCond_CC / NewCond.ccx_early_sen) / 0.05)) / (
-                            (CDCadj * 3.33) / (NewCond.ccx_early_sen + 2.29)
+                        tReq = (np.log(1 + (1 - InitCond_CC / NewCond_CCxEarlySen) / 0.05)) / (
+                            (CDCadj * 3.33) / (NewCond_CCxEarlySen + 2.29)
                         )
                         # Calculate gdd's for canopy decline
                         tmp_tCC = tReq + dtCC
                         # Determine new canopy size
-                        CCsen = NewCond.ccx_early_sen * (
+                        CCsen = NewCond_CCxEarlySen * (
                             1
                             - 0.05
                             * (
-                                np.exp(tmp_tCC * ((CDCadj * 3.33) / (NewCond.ccx_early_sen + 2.29)))
+                                np.exp(tmp_tCC * ((CDCadj * 3.33) / (NewCond_CCxEarlySen + 2.29)))
                                 - 1
                             )
                         )
@@ -394,82 +462,101 @@ def canopy_cover(
                             CCsen = Crop.CCx
 
                         # canopy_cover cannot be greater than value on previous day
-                        NewCond.canopy_cover = CCsen
-                        if NewCond.canopy_cover > InitCond_CC:
-                            NewCond.canopy_cover = InitCond_CC
+                        NewCond_CC = CCsen
+                        if NewCond_CC > InitCond_CC:
+                            NewCond_CC = InitCond_CC
 
                         # Update maximum canopy cover size during growing
                         # season
-                        NewCond.ccx_act = NewCond.canopy_cover
+                        NewCond_CCxAct = NewCond_CC
                         # Update CC0 if current canopy_cover is less than initial canopy
                         # cover size at planting
-                        if NewCond.canopy_cover < Crop.CC0:
-                            NewCond.cc0_adj = NewCond.canopy_cover
+                        if NewCond_CC < Crop.CC0:
+                            NewCond_CC0adj = NewCond_CC
                         else:
-                            NewCond.cc0_adj = Crop.CC0
+                            NewCond_CC0adj = Crop.CC0
 
                     else:
                         # Update canopy_cover to account for canopy cover senescence due
                         # to water stress
-                        if CCsen < NewCond.canopy_cover:
-                            NewCond.canopy_cover = CCsen
+                        if CCsen < NewCond_CC:
+                            NewCond_CC = CCsen
 
                     # Check for crop growth termination
-                    if (NewCond.canopy_cover < 0.001) and (InitCond_CropDead == False):
+                    if (NewCond_CC < 0.001) and (InitCond_CropDead == False):
                         # Crop has died
-                        NewCond.canopy_cover = 0
-                        NewCond.crop_dead = True
+                        NewCond_CC = 0
+                        NewCond_CropDead = True
 
                 else:
                     # No water stress
-                    NewCond.premat_senes = False
+                    NewCond_PrematSenes = False
                     if (tCCadj > Crop.Senescence) and (InitCond_tEarlySen > 0):
                         # Rewatering of canopy in late season
                         # Get new values for CCx and CDC
                         tmp_tCC = tCCadj - dtCC - Crop.Senescence
                         CCXadj, CDCadj = update_CCx_CDC(InitCond_CC, Crop.CDC, Crop.CCx, tmp_tCC)
-                        NewCond.ccx_act = CCXadj
+                        NewCond_CCxAct = CCXadj
                         # Get new canopy_cover value for end of current day
                         tmp_tCC = tCCadj - Crop.Senescence
-                        NewCond.canopy_cover = cc_development(
-                            NewCond.cc0_adj, CCXadj, Crop.CGC, CDCadj, tmp_tCC, "Decline", CCXadj
+                        NewCond_CC = cc_development(
+                            NewCond_CC0adj, CCXadj, Crop.CGC, CDCadj, tmp_tCC, "Decline", CCXadj
                         )
                         # Check for crop growth termination
-                        if (NewCond.canopy_cover < 0.001) and (InitCond_CropDead == False):
-                            NewCond.canopy_cover = 0
-                            NewCond.crop_dead = True
+                        if (NewCond_CC < 0.001) and (InitCond_CropDead == False):
+                            NewCond_CC = 0
+                            NewCond_CropDead = True
 
                     # Reset early senescence counter
-                    NewCond.t_early_sen = 0
+                    NewCond_tEarlySen = 0
 
                 # Adjust CCx for effects of withered canopy
-                if NewCond.canopy_cover > InitCond_CCxW:
-                    NewCond.ccx_w = NewCond.canopy_cover
+                if NewCond_CC > InitCond_CCxW:
+                    NewCond_CCxW = NewCond_CC
 
         ## Calculate canopy size adjusted for micro-advective effects ##
         # Check to ensure potential canopy_cover is not slightly lower than actual
-        if NewCond.canopy_cover_ns < NewCond.canopy_cover:
-            NewCond.canopy_cover_ns = NewCond.canopy_cover
+        if NewCond_CC_NS < NewCond_CC:
+            NewCond_CC_NS = NewCond_CC
             if tCCadj < Crop.CanopyDevEnd:
-                NewCond.ccx_act_ns = NewCond.canopy_cover_ns
+                NewCond_CCxAct_NS = NewCond_CC_NS
 
         # Actual (with water stress)
-        NewCond.canopy_cover_adj = (1.72 * NewCond.canopy_cover) - (NewCond.canopy_cover ** 2) + (0.3 * (NewCond.canopy_cover ** 3))
+        NewCond_CCadj = (1.72 * NewCond_CC) - (NewCond_CC ** 2) + (0.3 * (NewCond_CC ** 3))
         # Potential (without water stress)
-        NewCond.canopy_cover_adj_ns = (
-            (1.72 * NewCond.canopy_cover_ns) - (NewCond.canopy_cover_ns ** 2) + (0.3 * (NewCond.canopy_cover_ns ** 3))
+        NewCond_CCadj_NS = (
+            (1.72 * NewCond_CC_NS) - (NewCond_CC_NS ** 2) + (0.3 * (NewCond_CC_NS ** 3))
         )
 
     else:
         # No canopy outside growing season - set various values to zero
-        NewCond.canopy_cover = 0
-        NewCond.canopy_cover_adj = 0
-        NewCond.canopy_cover_ns = 0
-        NewCond.canopy_cover_adj_ns = 0
-        NewCond.ccx_w = 0
-        NewCond.ccx_act = 0
-        NewCond.ccx_w_ns = 0
-        NewCond.ccx_act_ns = 0
-
-    return NewCond
-
+        NewCond_CC = 0
+        NewCond_CCadj = 0
+        NewCond_CC_NS = 0
+        NewCond_CCadj_NS = 0
+        NewCond_CCxW = 0
+        NewCond_CCxAct = 0
+        NewCond_CCxW_NS = 0
+        NewCond_CCxAct_NS = 0
+
+    return (
+        NewCond_CCprev,
+        NewCond_CC,
+        NewCond_CC_NS,
+        NewCond_CCxAct,
+        NewCond_CCxAct_NS,
+        NewCond_CCxW,
+        NewCond_CCxW_NS,
+        NewCond_CC0adj,
+        NewCond_ProtectedSeed,
+        NewCond_CropDead,
+        NewCond_PrematSenes,
+        NewCond_CCxEarlySen,
+        NewCond_tEarlySen,
+        NewCond_CCadj,
+        NewCond_CCadj_NS,
+    )
+
+
+if __name__ == "__main__":
+    cc.compile()
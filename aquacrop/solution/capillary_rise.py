@@ -1,23 +1,36 @@
 import numpy as np
+from numba.extending import register_jitable
+from numba import f8, i8, b1
+from numba.pycc import CC
+from .signatures import SIGNATURES
+from ..entities.initParamVariables import WC_CAPILLARY_RISE_ITERATIONS
 from typing import TYPE_CHECKING, Tuple
 
 if TYPE_CHECKING:
     # Important: classes are only imported when types are checked, not in production.
     from aquacrop.entities.soilProfile import SoilProfileNT
-    from aquacrop.entities.initParamVariables import InitialCondition
     from numpy import ndarray
 
 
 
 
+# temporary name for compiled module
+cc = CC("solution_capillary_rise")
+
+
+@register_jitable
+@cc.export("capillary_rise", SIGNATURES["capillary_rise"])
 def capillary_rise(
     prof: "SoilProfileNT",
     Soil_nLayer: int,
     Soil_fshape_cr: float,
-    NewCond: "InitialCondition",
+    NewCond_zGW: float,
+    NewCond_th: "ndarray",
+    NewCond_th_fc_Adj: "ndarray",
     FluxOut: "ndarray",
     water_table_presence: int,
-    ) -> Tuple["InitialCondition", float]:
+    WorkCounters: "ndarray",
+    ) -> Tuple["ndarray", float]:
     """
     Function to calculate capillary rise from a shallow groundwater table
 
@@ -34,16 +47,22 @@ def capillary_rise(
 
         Soil_fshape_cr (float): Capillary rise shape factor
 
-        NewCond (InitialCondition): InitialCondition object containing model paramaters
+        NewCond_zGW (float): groundwater depth
+
+        NewCond_th (numpy.array): soil water content (updated in place)
+
+        NewCond_th_fc_Adj (numpy.array): adjusted water content at field capacity
 
         FluxOut (numpy.array): Flux of water out of each soil compartment
 
         water_table_presence (int): water_table present (1:yes, 0:no)
 
+        WorkCounters (numpy.array): work counters (updated in place)
+
 
     Returns:
 
-        NewCond (InitialCondition): InitCond object containing updated model paramaters
+        NewCond_th (numpy.array): updated soil water content
 
         CrTot (float): Total Capillary rise
 
@@ -54,7 +73,7 @@ def capillary_rise(
     """
 
     ## Get groundwater table elevation on current day ##
-    z_gw = NewCond.z_gw
+    z_gw = NewCond_zGW
 
     ## Calculate capillary rise ##
     if water_table_presence == 0:  # No water table present
@@ -64,7 +83,6 @@ def capillary_rise(
         # Get maximum capillary rise for bottom compartment
         zBot = prof.dzsum[-1]
         zBotMid = prof.zMid[-1]
-        prof = prof
         if (prof.Ksat[-1] > 0) and (z_gw > 0) and ((z_gw - zBotMid) < 4):
             if zBotMid >= z_gw:
                 MaxCR = 99
@@ -76,62 +94,26 @@ def capillary_rise(
         else:
             MaxCR = 0
 
-        ######################### this needs fixing, will currently break####################
-
-        # # Find top of next soil layer that is not within modelled soil profile
-        zTopLayer = 0
-        for layeri in np.sort(np.unique(prof.Layer)):
-            # Calculate layer thickness
-            l_idx = np.argwhere(prof.Layer==layeri).flatten()
-
-            LayThk = prof.dz[l_idx].sum()
-            zTopLayer = zTopLayer+LayThk
-
-        # Check for restrictions on upward flow caused by properties of
-        # compartments that are not modelled in the soil water balance
-        layeri = prof.Layer[-1]
-
-        assert layeri == Soil_nLayer
-
-        while (zTopLayer < z_gw) and (layeri < Soil_nLayer):
-            # this needs fixing, will currently break
-
-            
-            compdf = prof.Layer[layeri]
-            if (compdf.Ksat > 0) and (z_gw > 0) and ((z_gw-zTopLayer) < 4):
-                if zTopLayer >= z_gw:
-                    LimCR = 99
-                else:
-                    LimCR = np.exp((np.log(z_gw-zTopLayer)-compdf.bCR)/compdf.aCR)
-                    if LimCR > 99:
-                        LimCR = 99
-
-            else:
-                LimCR = 0
-
-            if MaxCR > LimCR:
-                MaxCR = LimCR
-
-            zTopLayer = zTopLayer+compdf.dz
-
-            layeri = layeri+1 # could be that the increment should be at the end of the loop rather than at the start (bad indexing otherwise)
-
-        #####################################################################################
+        # Compartments below the modelled soil profile are not simulated, so
+        # the bottom compartment always belongs to the last soil layer and no
+        # further restriction on upward flow applies
+        assert prof.Layer[-1] == Soil_nLayer
 
         # Calculate capillary rise
         compi = len(prof.Comp) - 1  # Start at bottom of root zone
         WCr = 0  # Capillary rise counter
         while (round(MaxCR * 1000) > 0) and (compi > -1) and (round(FluxOut[compi] * 1000) == 0):
+            WorkCounters[WC_CAPILLARY_RISE_ITERATIONS] += 1
             # Proceed upwards until maximum capillary rise occurs, soil surface
             # is reached, or encounter a compartment where downward
             # drainage/infiltration has already occurred on current day
             # Find layer of current compartment
             # Calculate driving force
-            if (NewCond.th[compi] >= prof.th_wp[compi]) and (Soil_fshape_cr > 0):
+            if (NewCond_th[compi] >= prof.th_wp[compi]) and (Soil_fshape_cr > 0):
                 Df = 1 - (
                     (
-                        (NewCond.th[compi] - prof.th_wp[compi])
-                        / (NewCond.th_fc_Adj[compi] - prof.th_wp[compi])
+                        (NewCond_th[compi] - prof.th_wp[compi])
+                        / (NewCond_th_fc_Adj[compi] - prof.th_wp[compi])
                     )
                     ** Soil_fshape_cr
                 )
@@ -145,27 +127,27 @@ def capillary_rise(
 
             # Calculate relative hydraulic conductivity
             thThr = (prof.th_wp[compi] + prof.th_fc[compi]) / 2
-            if NewCond.th[compi] < thThr:
-                if (NewCond.th[compi] <= prof.th_wp[compi]) or (thThr <= prof.th_wp[compi]):
+            if NewCond_th[compi] < thThr:
+                if (NewCond_th[compi] <= prof.th_wp[compi]) or (thThr <= prof.th_wp[compi]):
                     Krel = 0
                 else:
-                    Krel = (NewCond.th[compi] - prof.th_wp[compi]) / (thThr - prof.th_wp[compi])
+                    Krel = (NewCond_th[compi] - prof.th_wp[compi]) / (thThr - prof.th_wp[compi])
 
             else:
                 Krel = 1
 
             # Check if room is available to store water from capillary rise
-            dth = round(NewCond.th_fc_Adj[compi] - NewCond.th[compi],4)
+            dth = round(NewCond_th_fc_Adj[compi] - NewCond_th[compi],4)
 
             # Store water if room is available
             if (dth > 0) and ((zBot - prof.dz[compi] / 2) < z_gw):
                 dthMax = Krel * Df * MaxCR / (1000 * prof.dz[compi])
                 if dth >= dthMax:
-                    NewCond.th[compi] = NewCond.th[compi] + dthMax
+                    NewCond_th[compi] = NewCond_th[compi] + dthMax
                     CRcomp = dthMax * 1000 * prof.dz[compi]
                     MaxCR = 0
                 else:
-                    NewCond.th[compi] = NewCond.th_fc_Adj[compi]
+                    NewCond_th[compi] = NewCond_th_fc_Adj[compi]
                     CRcomp = dth * 1000 * prof.dz[compi]
                     MaxCR = (Krel * MaxCR) - CRcomp
 
@@ -196,4 +178,8 @@ def capillary_rise(
         # Store total depth of capillary rise
         CrTot = WCr
 
-    return NewCond, CrTot
+    return NewCond_th, CrTot
+
+
+if __name__ == "__main__":
+    cc.compile()
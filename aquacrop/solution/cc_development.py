@@ -1,11 +1,13 @@
 import numpy as np
 from numba import njit, f8, i8, b1
 from numba.pycc import CC
+from numba.extending import register_jitable
 import sys
 # temporary name for compiled module
 cc = CC("solution_cc_development")
 
 
+@register_jitable
 @cc.export("cc_development", "f8(f8,f8,f8,f8,f8,unicode_type,f8)")
 def cc_development(
     CCo: float,
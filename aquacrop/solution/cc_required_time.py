@@ -2,12 +2,14 @@ import numpy as np
 
 from numba import njit, f8, i8, b1
 from numba.pycc import CC
+from numba.extending import register_jitable
 
 # temporary name for compiled module
 cc = CC("solution_cc_required_time")
 
 
 
+@register_jitable
 @cc.export("cc_required_time", "f8(f8,f8,f8,f8,f8,unicode_type)")
 def cc_required_time(
     cc_prev: float,
@@ -2,12 +2,11 @@ import numpy as np
 
 from numba import njit, f8, i8, b1
 from numba.pycc import CC
+from numba.extending import register_jitable
+
+from .signatures import SIGNATURES
 
 
-try:
-    from ..entities.soilProfile import SoilProfileNT_typ_sig
-except:
-    from entities.soilProfile import SoilProfileNT_typ_sig
 # temporary name for compiled module
 cc = CC("solution_check_groundwater_table")
 
@@ -23,7 +22,8 @@ if TYPE_CHECKING:
 
 
 
-@cc.export("check_groundwater_table", (SoilProfileNT_typ_sig,f8,f8[:],f8[:],i8,f8))
+@register_jitable
+@cc.export("check_groundwater_table", SIGNATURES["check_groundwater_table"])
 def check_groundwater_table(
     prof: "SoilProfileNT",
     NewCond_zGW: float,
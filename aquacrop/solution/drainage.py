@@ -2,12 +2,11 @@ import numpy as np
 
 from numba import njit, f8, i8, b1
 from numba.pycc import CC
-from typing import Tuple,TYPE_CHECKING
+from numba.extending import register_jitable
+
+from .signatures import SIGNATURES
 
-try:
-    from ..entities.soilProfile import SoilProfileNT_typ_sig
-except:
-    from entities.soilProfile import SoilProfileNT_typ_sig
+from typing import Tuple,TYPE_CHECKING
 
 # temporary name for compiled module
 cc = CC("solution_drainage")
@@ -20,7 +19,8 @@ if TYPE_CHECKING:
 
 
 
-@cc.export("drainage", (SoilProfileNT_typ_sig, f8[:], f8[:]))
+@register_jitable
+@cc.export("drainage", SIGNATURES["drainage"])
 def drainage(
     prof: "SoilProfileNT",
     th_init: "ndarray",
@@ -19,7 +19,7 @@ except:
 # temporary name for compiled module
 cc = CC("solution_evap_layer_water_content")
 
-@njit
+@njit(cache=True)
 @cc.export("evap_layer_water_content", (f8[:],f8,SoilProfileNT_typ_sig))
 def evap_layer_water_content(
     InitCond_th: "ndarray",
@@ -1,23 +1,37 @@
 import numpy as np
-from typing import TYPE_CHECKING
+from numba.extending import register_jitable
+from numba import f8, i8, b1
+from numba.pycc import CC
+from .signatures import SIGNATURES
+from typing import TYPE_CHECKING, Tuple
 
 
 
 if TYPE_CHECKING:
     # Important: classes are only imported when types are checked, not in production.
     from aquacrop.entities.soilProfile import SoilProfileNT
-    from aquacrop.entities.initParamVariables import InitialCondition
+    from numpy import ndarray
 
 
+# temporary name for compiled module
+cc = CC("solution_germination")
+
+
+@register_jitable
+@cc.export("germination", SIGNATURES["germination"])
 def germination(
-    InitCond: "InitialCondition",
+    NewCond_Germination: bool,
+    NewCond_ProtectedSeed: bool,
+    NewCond_DelayedCDs: float,
+    NewCond_DelayedGDDs: float,
+    NewCond_th: "ndarray",
     Soil_zGerm: float,
     prof: "SoilProfileNT",
     Crop_GermThr: float,
     Crop_PlantMethod: bool,
     gdd: float,
     growing_season: bool,
-    ) -> "InitialCondition":
+    ) -> Tuple[bool, bool, float, float]:
     """
     Function to check if crop has germinated
 
@@ -28,7 +42,15 @@ def germination(
     Arguments:
 
 
-        InitCond (InitialCondition): InitCond object containing model paramaters
+        NewCond_Germination (bool): has the crop germinated
+
+        NewCond_ProtectedSeed (bool): is the seedling protected
+
+        NewCond_DelayedCDs (float): delayed calendar days
+
+        NewCond_DelayedGDDs (float): delayed growing degree days
+
+        NewCond_th (numpy.array): soil water content
 
         Soil_zGerm (float): Soil depth affecting germination
 
@@ -46,23 +68,26 @@ def germination(
     Returns:
 
 
-        NewCond (InitialCondition): InitCond object containing updated model paramaters
+        NewCond_Germination (bool): updated germination flag
 
+        NewCond_ProtectedSeed (bool): updated seedling protection flag
 
+        NewCond_DelayedCDs (float): updated delayed calendar days
+
+        NewCond_DelayedGDDs (float): updated delayed growing degree days
 
 
 
 
 
-    """
 
-    ## Store initial conditions in new structure for updating ##
-    NewCond = InitCond
+
+    """
 
     ## Check for germination (if in growing season) ##
     if growing_season == True:
 
-        if (NewCond.germination == False):
+        if (NewCond_Germination == False):
             # Find compartments covered by top soil layer affecting germination
             comp_sto = np.argwhere(prof.dzsum >= Soil_zGerm).flatten()[0]
             # Calculate water content in top soil layer
@@ -78,7 +103,7 @@ def germination(
                     factor = 1
 
                 # Increment actual water storage (mm)
-                Wr = Wr + round(factor * 1000 * InitCond.th[ii] * prof.dz[ii], 3)
+                Wr = Wr + round(factor * 1000 * NewCond_th[ii] * prof.dz[ii], 3)
                 # Increment water storage at field capacity (mm)
                 WrFC = WrFC + round(factor * 1000 * prof.th_fc[ii] * prof.dz[ii], 3)
                 # Increment water storage at permanent wilting point (mm)
@@ -94,27 +119,35 @@ def germination(
             # Check if water content is above germination threshold
             if (WcProp >= Crop_GermThr):
                 # Crop has germinated
-                NewCond.germination = True
+                NewCond_Germination = True
                 # If crop sown as seedling, turn on seedling protection
                 if Crop_PlantMethod == True:
-                    NewCond.protected_seed = True
+                    NewCond_ProtectedSeed = True
                 else:
                     # Crop is transplanted so no protection
-                    NewCond.protected_seed = False
+                    NewCond_ProtectedSeed = False
 
             # Increment delayed growth time counters if germination is yet to
             # occur, and also set seed protection to False if yet to germinate
             else:
-                NewCond.delayed_cds = InitCond.delayed_cds + 1
-                NewCond.delayed_gdds = InitCond.delayed_gdds + gdd
-                NewCond.protected_seed = False
+                NewCond_DelayedCDs = NewCond_DelayedCDs + 1
+                NewCond_DelayedGDDs = NewCond_DelayedGDDs + gdd
+                NewCond_ProtectedSeed = False
 
     else:
         # Not in growing season so no germination calculation is performed.
-        NewCond.germination = False
-        NewCond.protected_seed = False
-        NewCond.delayed_cds = 0
-        NewCond.delayed_gdds = 0
+        NewCond_Germination = False
+        NewCond_ProtectedSeed = False
+        NewCond_DelayedCDs = 0
+        NewCond_DelayedGDDs = 0
+
+    return (
+        NewCond_Germination,
+        NewCond_ProtectedSeed,
+        NewCond_DelayedCDs,
+        NewCond_DelayedGDDs,
+    )
 
-    return NewCond
 
+if __name__ == "__main__":
+    cc.compile()
@@ -1,4 +1,8 @@
 import numpy as np
+from numba.extending import register_jitable
+from numba import f8, i8, b1
+from numba.pycc import CC
+from .signatures import SIGNATURES
 
 from typing import Tuple,TYPE_CHECKING
 
@@ -7,15 +11,22 @@ from typing import Tuple,TYPE_CHECKING
 if TYPE_CHECKING:
     # Important: classes are only imported when types are checked, not in production.
     from aquacrop.entities.soilProfile import SoilProfileNT
-    from aquacrop.entities.initParamVariables import InitialCondition
+    from numpy import ndarray
 
 
 
+# temporary name for compiled module
+cc = CC("solution_groundwater_inflow")
 
+
+@register_jitable
+@cc.export("groundwater_inflow", SIGNATURES["groundwater_inflow"])
 def groundwater_inflow(
     prof: "SoilProfileNT",
-    NewCond: "InitialCondition"
-    ) -> Tuple["InitialCondition",float]:
+    NewCond_WTinSoil: bool,
+    NewCond_zGW: float,
+    NewCond_th: "ndarray",
+    ) -> Tuple["ndarray",float]:
     """
     Function to calculate capillary rise in the presence of a shallow groundwater table
 
@@ -26,13 +37,17 @@ def groundwater_inflow(
 
         prof (SoilProfileNT): Soil profile parameters
 
-        NewCond (InitialCondition): model parameters
+        NewCond_WTinSoil (bool): is the water table within the soil profile
+
+        NewCond_zGW (float): groundwater depth
+
+        NewCond_th (numpy.array): soil water content (updated in place)
 
 
     Returns:
 
 
-        NewCond (InitialCondition): InitCond object containing updated model parameters
+        NewCond_th (numpy.array): updated soil water content
 
         GwIn (float): Groundwater inflow
 
@@ -43,26 +58,26 @@ def groundwater_inflow(
     GwIn = 0
 
     ## Perform calculations ##
-    if NewCond.wt_in_soil == True:
+    if NewCond_WTinSoil == True:
         # Water table in soil profile. Calculate horizontal inflow.
         # Get groundwater table elevation on current day
-        # print(f'Setting z_gw in groundwater_inflow.py as: {NewCond.z_gw}')
-        z_gw = NewCond.z_gw
+        z_gw = NewCond_zGW
 
         # Find compartment mid-points
         zMid = prof.zMid
-
         idx = np.argwhere(zMid >= z_gw).flatten()[0]
 
         for ii in range(idx, len(prof.Comp)):
             # Get soil layer
-            if NewCond.th[ii] < prof.th_s[ii]:
+            if NewCond_th[ii] < prof.th_s[ii]:
                 # Update water content
-                dth = prof.th_s[ii] - NewCond.th[ii]
-                NewCond.th[ii] = prof.th_s[ii]
+                dth = prof.th_s[ii] - NewCond_th[ii]
+                NewCond_th[ii] = prof.th_s[ii]
                 # Update groundwater inflow
                 GwIn = GwIn + (dth * 1000 * prof.dz[ii])
 
-    return NewCond, GwIn
+    return NewCond_th, GwIn
 
 
+if __name__ == "__main__":
+    cc.compile()
@@ -1,16 +1,29 @@
+from numba.extending import register_jitable
+from numba import f8, i8, b1
+from numba.pycc import CC
+from .signatures import SIGNATURES
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     # Important: classes are only imported when types are checked, not in production.
-    from aquacrop.entities.crop import Crop
-    from aquacrop.entities.initParamVariables import InitialCondition
+    from aquacrop.entities.crop import CropStructNT
 
 
+# temporary name for compiled module
+cc = CC("solution_growth_stage")
+
+
+@register_jitable
+@cc.export("growth_stage", SIGNATURES["growth_stage"])
 def growth_stage(
-    Crop: "Crop",
-    InitCond: "InitialCondition",
+    Crop: "CropStructNT",
+    NewCond_DAP: int,
+    NewCond_DelayedCDs: float,
+    NewCond_GDDcum: float,
+    NewCond_DelayedGDDs: float,
+    NewCond_GrowthStage: float,
     growing_season: bool,
-    ) -> "InitialCondition":
+    ) -> float:
     """
     Function to determine current growth stage of crop
 
@@ -18,45 +31,50 @@ def growth_stage(
 
     Arguments:
 
-        Crop (Crop): Crop object containing Crop paramaters
+        Crop (CropStructNT): NamedTuple containing Crop paramaters
 
-        InitCond (InitialCondition): InitCond object containing model paramaters
+        NewCond_DAP (int): days after planting
 
-        growing_season (bool): is growing season (True or Flase)
+        NewCond_DelayedCDs (float): delayed calendar days
 
+        NewCond_GDDcum (float): cumulative growing degree days
 
-    Returns:
+        NewCond_DelayedGDDs (float): delayed growing degree days
 
-        NewCond (InitialCondition): InitCond object containing updated model paramaters
+        NewCond_GrowthStage (float): growth stage on previous day
 
+        growing_season (bool): is growing season (True or Flase)
 
+    Returns:
 
-    """
+        NewCond_GrowthStage (float): updated growth stage
 
-    ## Store initial conditions in new structure for updating ##
-    NewCond = InitCond
+    """
 
     ## Get growth stage (if in growing season) ##
     if growing_season == True:
         # Adjust time for any delayed growth
         if Crop.CalendarType == 1:
-            tAdj = NewCond.dap - NewCond.delayed_cds
+            tAdj = NewCond_DAP - NewCond_DelayedCDs
         elif Crop.CalendarType == 2:
-            tAdj = NewCond.gdd_cum - NewCond.delayed_gdds
+            tAdj = NewCond_GDDcum - NewCond_DelayedGDDs
 
         # Update growth stage
         if tAdj <= Crop.Canopy10Pct:
-            NewCond.growth_stage = 1
+            NewCond_GrowthStage = 1
         elif tAdj <= Crop.MaxCanopy:
-            NewCond.growth_stage = 2
+            NewCond_GrowthStage = 2
         elif tAdj <= Crop.Senescence:
-            NewCond.growth_stage = 3
+            NewCond_GrowthStage = 3
         elif tAdj > Crop.Senescence:
-            NewCond.growth_stage = 4
+            NewCond_GrowthStage = 4
 
     else:
         # Not in growing season so growth stage is set to dummy value
-        NewCond.growth_stage = 0
+        NewCond_GrowthStage = 0
+
+    return NewCond_GrowthStage
 
-    return NewCond
 
+if __name__ == "__main__":
+    cc.compile()
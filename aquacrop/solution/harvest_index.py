@@ -1,56 +1,67 @@
-
-
-import os
 import numpy as np
-from ..entities.totalAvailableWater import TAW
-from ..entities.moistureDepletion import Dr
+from numba.extending import register_jitable
+from numba import f8, i8, b1
+from numba.pycc import CC
+from .signatures import SIGNATURES
 from ..entities.waterStressCoefficients import  KswNT
 from ..entities.temperatureStressCoefficients import   KstNT
 
-if __name__ != "__main__":
-    if os.getenv("DEVELOPMENT"):
-        from .water_stress import water_stress
-        from .root_zone_water import root_zone_water
-        from .temperature_stress import temperature_stress
-        from .HIadj_pre_anthesis import HIadj_pre_anthesis
-        from .HIadj_post_anthesis import HIadj_post_anthesis
-        from .HIadj_pollination import HIadj_pollination
-    else:
-        from .solution_water_stress import water_stress
-        from .solution_root_zone_water import root_zone_water
-        from .solution_temperature_stress import temperature_stress
-        from .solution_HIadj_pre_anthesis import HIadj_pre_anthesis
-        from .solution_HIadj_post_anthesis import HIadj_post_anthesis
-        from .solution_HIadj_pollination import HIadj_pollination
-else:
-    from .water_stress import water_stress
-    from .root_zone_water import root_zone_water
-    from .temperature_stress import temperature_stress
-    from .HIadj_pre_anthesis import HIadj_pre_anthesis
-    from .HIadj_post_anthesis import HIadj_post_anthesis
-    from .HIadj_pollination import HIadj_pollination
-
-from typing import TYPE_CHECKING
+# Sub-kernels are imported from source so that harvest_index can also be
+# compiled as part of the whole-simulation loop
+from .water_stress import water_stress
+from .root_zone_water_cache import cached_root_zone_water
+from .temperature_stress import temperature_stress
+from .HIadj_pre_anthesis import HIadj_pre_anthesis
+from .HIadj_post_anthesis import HIadj_post_anthesis
+from .HIadj_pollination import HIadj_pollination
+
+from typing import TYPE_CHECKING, Tuple
 
 if TYPE_CHECKING:
     # Important: classes are only imported when types are checked, not in production.
     from aquacrop.entities.crop import CropStructNT
-    from aquacrop.entities.initParamVariables import InitialCondition
     from aquacrop.entities.soilProfile import SoilProfileNT
+    from numpy import ndarray
+
 
 
 
+# temporary name for compiled module
+cc = CC("solution_harvest_index")
 
+
+@register_jitable
+@cc.export("harvest_index", SIGNATURES["harvest_index"])
 def harvest_index(
     prof: "SoilProfileNT",
     Soil_zTop: float,
     Crop: "CropStructNT",
-    InitCond: "InitialCondition",
+    NewCond_Zroot: float,
+    NewCond_th: "ndarray",
+    NewCond_tEarlySen: float,
+    NewCond_HIref: float,
+    NewCond_DAP: int,
+    NewCond_DelayedCDs: float,
+    NewCond_YieldForm: bool,
+    NewCond_PreAdj: bool,
+    NewCond_B: float,
+    NewCond_B_NS: float,
+    NewCond_CC: float,
+    NewCond_Fpre: float,
+    NewCond_Fpol: float,
+    NewCond_sCor1: float,
+    NewCond_sCor2: float,
+    NewCond_fpost_upp: float,
+    NewCond_fpost_dwn: float,
+    NewCond_Fpost: float,
+    NewCond_HI: float,
+    NewCond_HIadj: float,
     et0: float,
     temp_max: float,
     temp_min: float,
     growing_season: bool,
-    ) -> "InitialCondition":
+    root_zone_cache: "ndarray",
+    ) -> Tuple[bool, float, float, float, float, float, float, float, float, float]:
 
     """
     Function to simulate build up of harvest index
@@ -67,7 +78,45 @@ def harvest_index(
 
         Crop (CropStructNT): Crop parameters
 
-        InitCond (InitialCondition): InitCond object containing model paramaters
+        NewCond_Zroot (float): rooting depth
+
+        NewCond_th (numpy.array): soil water content
+
+        NewCond_tEarlySen (float): days in early senescence
+
+        NewCond_HIref (float): reference harvest index on current day
+
+        NewCond_DAP (int): days after planting
+
+        NewCond_DelayedCDs (float): delayed calendar days
+
+        NewCond_YieldForm (bool): is the crop in yield formation
+
+        NewCond_PreAdj (bool): has the pre-anthesis adjustment been made
+
+        NewCond_B (float): biomass
+
+        NewCond_B_NS (float): biomass (no stress)
+
+        NewCond_CC (float): canopy cover
+
+        NewCond_Fpre (float): pre-anthesis harvest index adjustment
+
+        NewCond_Fpol (float): pollination harvest index adjustment
+
+        NewCond_sCor1 (float): post-anthesis correction counter 1
+
+        NewCond_sCor2 (float): post-anthesis correction counter 2
+
+        NewCond_fpost_upp (float): post-anthesis upward adjustment
+
+        NewCond_fpost_dwn (float): post-anthesis downward adjustment
+
+        NewCond_Fpost (float): post-anthesis harvest index adjustment
+
+        NewCond_HI (float): harvest index on previous day
+
+        NewCond_HIadj (float): adjusted harvest index on previous day
 
         et0 (float): reference evapotranspiration on current day
 
@@ -77,34 +126,49 @@ def harvest_index(
 
         growing_season (bool): is growing season (True or Flase)
 
+        root_zone_cache (numpy.array): root zone water results of the current day (updated in place)
+
 
     Returns:
 
 
-        NewCond (InitialCondition): InitCond object containing updated model paramaters
+        NewCond_PreAdj (bool): updated pre-anthesis adjustment flag
 
+        NewCond_Fpre (float): updated pre-anthesis adjustment
 
+        NewCond_Fpol (float): updated pollination adjustment
 
-    """
+        NewCond_sCor1 (float): updated post-anthesis correction counter 1
+
+        NewCond_sCor2 (float): updated post-anthesis correction counter 2
 
-    ## Store initial conditions for updating ##
-    NewCond = InitCond
+        NewCond_fpost_upp (float): updated post-anthesis upward adjustment
 
-    InitCond_HI = InitCond.harvest_index
-    InitCond_HIadj = InitCond.harvest_index_adj
-    InitCond_PreAdj = InitCond.pre_adj
+        NewCond_fpost_dwn (float): updated post-anthesis downward adjustment
+
+        NewCond_Fpost (float): updated post-anthesis adjustment
+
+        NewCond_HI (float): harvest index on current day
+
+        NewCond_HIadj (float): adjusted harvest index on current day
+
+
+
+    """
+
+    InitCond_HI = NewCond_HI
+    InitCond_HIadj = NewCond_HIadj
+    InitCond_PreAdj = NewCond_PreAdj
 
     ## Calculate harvest index build up (if in growing season) ##
     if growing_season == True:
         # Calculate root zone water content
 
-        taw = TAW()
-        water_root_depletion = Dr()
-        # thRZ = RootZoneWater()
-        _, water_root_depletion.Zt, water_root_depletion.Rz, taw.Zt, taw.Rz, _,_,_,_,_,_, = root_zone_water(
+        _, Dr_Zt, Dr_Rz, TAW_Zt, TAW_Rz, _,_,_,_,_,_, = cached_root_zone_water(
+            root_zone_cache,
             prof,
-            float(NewCond.z_root),
-            NewCond.th,
+            float(NewCond_Zroot),
+            NewCond_th,
             Soil_zTop,
             float(Crop.Zmin),
             Crop.Aer,
@@ -113,14 +177,14 @@ def harvest_index(
         # _,water_root_depletion,taw,_ = root_zone_water(Soil_Profile,float(NewCond.z_root),NewCond.th,Soil_zTop,float(Crop.Zmin),Crop.Aer)
         # Check whether to use root zone or top soil depletions for calculating
         # water stress
-        if (water_root_depletion.Rz / taw.Rz) <= (water_root_depletion.Zt / taw.Zt):
+        if (Dr_Rz / TAW_Rz) <= (Dr_Zt / TAW_Zt):
             # Root zone is wetter than top soil, so use root zone value
-            water_root_depletion = water_root_depletion.Rz
-            taw = taw.Rz
+            water_root_depletion = Dr_Rz
+            taw = TAW_Rz
         else:
             # Top soil is wetter than root zone, so use top soil values
-            water_root_depletion = water_root_depletion.Zt
-            taw = taw.Zt
+            water_root_depletion = Dr_Zt
+            taw = TAW_Zt
 
         # Calculate water stress
         beta = True
@@ -132,7 +196,7 @@ def harvest_index(
             Crop.ETadj,
             Crop.beta,
             Crop.fshape_w,
-            NewCond.t_early_sen,
+            NewCond_tEarlySen,
             water_root_depletion,
             taw,
             et0,
@@ -143,31 +207,31 @@ def harvest_index(
         (Kst_PolH,Kst_PolC) = temperature_stress(Crop, temp_max, temp_min)
         Kst = KstNT(PolH=Kst_PolH,PolC=Kst_PolC)
         # Get reference harvest index on current day
-        HIi = NewCond.hi_ref
+        HIi = NewCond_HIref
 
         # Get time for harvest index build-up
-        HIt = NewCond.dap - NewCond.delayed_cds - Crop.HIstartCD - 1
+        HIt = NewCond_DAP - NewCond_DelayedCDs - Crop.HIstartCD - 1
 
         # Calculate harvest index
-        if (NewCond.yield_form == True) and (HIt >= 0):
-            # print(NewCond.dap)
+        if (NewCond_YieldForm == True) and (HIt >= 0):
+            # print(NewCond_DAP)
             # Root/tuber or fruit/grain crops
             if (Crop.CropType == 2) or (Crop.CropType == 3):
                 # Detemine adjustment for water stress before anthesis
                 if InitCond_PreAdj == False:
-                    InitCond.pre_adj = True
-                    NewCond.f_pre = HIadj_pre_anthesis(NewCond.biomass,
-                                                NewCond.biomass_ns,
-                                                NewCond.canopy_cover,
+                    NewCond_PreAdj = True
+                    NewCond_Fpre = HIadj_pre_anthesis(NewCond_B,
+                                                NewCond_B_NS,
+                                                NewCond_CC,
                                                 Crop.dHI_pre)
 
                 # Determine adjustment for crop pollination failure
                 if Crop.CropType == 3:  # Adjustment only for fruit/grain crops
                     if (HIt > 0) and (HIt <= Crop.FloweringCD):
 
-                        NewCond.f_pol = HIadj_pollination(
-                            NewCond.canopy_cover,
-                            NewCond.f_pol,
+                        NewCond_Fpol = HIadj_pollination(
+                            NewCond_CC,
+                            NewCond_Fpol,
                             Crop.FloweringCD,
                             Crop.CCmin,
                             Crop.exc,
@@ -176,31 +240,31 @@ def harvest_index(
                             HIt,
                         )
 
-                    HImax = NewCond.f_pol * Crop.HI0
+                    HImax = NewCond_Fpol * Crop.HI0
                 else:
                     # No pollination adjustment for root/tuber crops
                     HImax = Crop.HI0
 
                 # Determine adjustments for post-anthesis water stress
                 if HIt > 0:
-                    (NewCond.s_cor1,
-                    NewCond.s_cor2,
-                    NewCond.fpost_upp,
-                    NewCond.fpost_dwn,
-                    NewCond.f_post) = HIadj_post_anthesis(NewCond.delayed_cds,
-                                                        NewCond.s_cor1,
-                                                        NewCond.s_cor2,
-                                                        NewCond.dap,
-                                                        NewCond.f_pre,
-                                                        NewCond.canopy_cover,
-                                                        NewCond.fpost_upp,
-                                                        NewCond.fpost_dwn,
+                    (NewCond_sCor1,
+                    NewCond_sCor2,
+                    NewCond_fpost_upp,
+                    NewCond_fpost_dwn,
+                    NewCond_Fpost) = HIadj_post_anthesis(NewCond_DelayedCDs,
+                                                        NewCond_sCor1,
+                                                        NewCond_sCor2,
+                                                        NewCond_DAP,
+                                                        NewCond_Fpre,
+                                                        NewCond_CC,
+                                                        NewCond_fpost_upp,
+                                                        NewCond_fpost_dwn,
                                                         Crop, 
                                                         Ksw)
 
                 # Limit harvest_index to maximum allowable increase due to pre- and
                 # post-anthesis water stress combinations
-                HImult = NewCond.f_pre * NewCond.f_post
+                HImult = NewCond_Fpre * NewCond_Fpost
                 if HImult > 1 + (Crop.dHI0 / 100):
                     HImult = 1 + (Crop.dHI0 / 100)
 
@@ -223,13 +287,27 @@ def harvest_index(
             harvest_index_adj = InitCond_HIadj
 
         # Store final values for current time step
-        NewCond.harvest_index = HIi
-        NewCond.harvest_index_adj = harvest_index_adj
+        NewCond_HI = HIi
+        NewCond_HIadj = harvest_index_adj
 
     else:
         # No harvestable crop outside of a growing season
-        NewCond.harvest_index = 0
-        NewCond.harvest_index_adj = 0
-
-    # print([NewCond.dap , Crop.YldFormCD])
-    return NewCond
\ No newline at end of file
+        NewCond_HI = 0
+        NewCond_HIadj = 0
+
+    return (
+        NewCond_PreAdj,
+        NewCond_Fpre,
+        NewCond_Fpol,
+        NewCond_sCor1,
+        NewCond_sCor2,
+        NewCond_fpost_upp,
+        NewCond_fpost_dwn,
+        NewCond_Fpost,
+        NewCond_HI,
+        NewCond_HIadj,
+    )
+
+
+if __name__ == "__main__":
+    cc.compile()
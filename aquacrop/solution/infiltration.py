@@ -3,11 +3,14 @@ import numpy as np
 
 from numba import njit, f8, i8, b1
 from numba.pycc import CC
+from numba.extending import register_jitable
+
+from .signatures import SIGNATURES
 
 try:
-    from ..entities.soilProfile import SoilProfileNT_typ_sig
+    from ..entities.initParamVariables import WC_INFILTRATION_ITERATIONS
 except:
-    from entities.soilProfile import SoilProfileNT_typ_sig
+    from entities.initParamVariables import WC_INFILTRATION_ITERATIONS
     
 # temporary name for compiled module
 cc = CC("solution_infiltration")
@@ -19,7 +22,8 @@ if TYPE_CHECKING:
     from aquacrop.entities.soilProfile import SoilProfileNT
     from numpy import ndarray
 
-@cc.export("infiltration", (SoilProfileNT_typ_sig,f8,f8[:],f8[:],f8,f8,f8,b1,f8,f8[:],f8,f8,b1))
+@register_jitable
+@cc.export("infiltration", SIGNATURES["infiltration"])
 def infiltration(
      prof: "SoilProfileNT",
      NewCond_SurfaceStorage: float, 
@@ -34,6 +38,7 @@ def infiltration(
      DeepPerc0: float, 
      Runoff0: float, 
      growing_season: bool,
+     WorkCounters: "ndarray",
 ) -> Tuple["ndarray", float, float, float, float, "ndarray"]:
     """
     Function to infiltrate incoming water (rainfall and irrigation)
@@ -70,6 +75,8 @@ def infiltration(
 
         growing_season (bool): is growing season (True or Flase)
 
+        WorkCounters (numpy.array): work counters (updated in place)
+
 
     Returns:
 
@@ -169,6 +176,7 @@ def infiltration(
     ## Infiltrate incoming water ##
     if ToStore > 0:
         while (ToStore > 0) and (ii < Soil_nComp - 1):
+            WorkCounters[WC_INFILTRATION_ITERATIONS] += 1
             # Update compartment counter
             ii = ii + 1
             # Get soil layer
@@ -244,6 +252,7 @@ def infiltration(
             if excess > 0:
                 precomp = ii + 1
                 while (excess > 0) and (precomp != 0):
+                    WorkCounters[WC_INFILTRATION_ITERATIONS] += 1
                     # Keep storing in compartments above until soil surface is
                     # reached
                     # Update compartment counter
@@ -1,14 +1,9 @@
-import os
+from numba.extending import register_jitable
+from numba import f8, i8, b1
+from numba.pycc import CC
+from .signatures import SIGNATURES
 
-if __name__ != "__main__":
-    if os.getenv("DEVELOPMENT"):
-        from .root_zone_water import root_zone_water
-    else:
-        from .root_zone_water import root_zone_water
-
-else:
-   from .root_zone_water import root_zone_water
-   
+from .root_zone_water_cache import cached_root_zone_water
 
 
 from typing import TYPE_CHECKING, Tuple
@@ -19,8 +14,12 @@ if TYPE_CHECKING:
     from entities.soilProfile import SoilProfileNT
     from numpy import ndarray
 
-# @cc.export("_irrigation", (i8,f8[:],f8,f8,i8,f8[:],f8,f8,f8,f8,f8,f8[:],i8,i8,CropStructNT_type_sig,SoilProfileNT_typ_sig,f8,b1,f8,f8))
-# @njit
+# temporary name for compiled module
+cc = CC("solution_irrigation")
+
+
+@register_jitable
+@cc.export("irrigation", SIGNATURES["irrigation"])
 def irrigation(
     IrrMngt_IrrMethod: int,
     IrrMngt_SMT: float,
@@ -44,6 +43,7 @@ def irrigation(
     growing_season: bool,
     Rain: float,
     Runoff: float,
+    root_zone_cache: "ndarray",
     ) -> Tuple[float,float,float, float]:
     """
     Function to get irrigation depth for current day
@@ -97,6 +97,8 @@ def irrigation(
 
         Runoff (float): surface runoff on current day
 
+        root_zone_cache (numpy.array): root zone water results of the current day (updated in place)
+
 
     Returns:
 
@@ -131,7 +133,8 @@ def irrigation(
             thRZ_WP,
             thRZ_Dry,
             thRZ_Aer,
-        ) = root_zone_water(
+        ) = cached_root_zone_water(
+            root_zone_cache,
             prof,
             float(NewCond_Zroot),
             NewCond_th,
@@ -241,3 +244,6 @@ def irrigation(
 
     return NewCond_Depletion,NewCond_TAW,NewCond_IrrCum, Irr
 
+
+if __name__ == "__main__":
+    cc.compile()
@@ -1,23 +1,35 @@
 import numpy as np
+from numba.extending import register_jitable
+from numba import f8, i8, b1
+from numba.pycc import CC
+from .signatures import SIGNATURES
+
 
-    
 from typing import TYPE_CHECKING, Tuple
 
 if TYPE_CHECKING:
     # Important: classes are only imported when types are checked, not in production.
     from aquacrop.entities.soilProfile import SoilProfileNT
     from aquacrop.entities.crop import CropStructNT
-    from aquacrop.entities.initParamVariables import InitialCondition
-    from aquacrop.entities.irrigationManagement import IrrMngtStruct
+    from numpy import ndarray
+
 
+# temporary name for compiled module
+cc = CC("solution_pre_irrigation")
 
+
+@register_jitable
+@cc.export("pre_irrigation", SIGNATURES["pre_irrigation"])
 def pre_irrigation(
     prof: "SoilProfileNT",
     Crop: "CropStructNT",
-    InitCond: "InitialCondition",
+    NewCond_DAP: int,
+    NewCond_Zroot: float,
+    NewCond_th: "ndarray",
     growing_season: bool,
-    IrrMngt: "IrrMngtStruct",
-    ) -> Tuple["InitialCondition", float]:
+    IrrMngt_IrrMethod: int,
+    IrrMngt_NetIrrSMT: float,
+    ) -> Tuple["ndarray", float]:
     """
     Function to calculate pre-irrigation when in net irrigation mode
 
@@ -26,21 +38,27 @@ def pre_irrigation(
 
     Arguments:
 
-        prof (SoilProfile): Soil object containing soil paramaters
+        prof (SoilProfileNT): Soil profile paramaters
+
+        Crop (CropStructNT): Crop paramaters
 
-        Crop (CropStruct): Crop object containing Crop paramaters
+        NewCond_DAP (int): days after planting
 
-        InitCond (InitialCondition): InitCond object containing model paramaters
+        NewCond_Zroot (float): rooting depth
+
+        NewCond_th (numpy.array): soil water content (updated in place)
 
         growing_season (bool): is growing season (True or Flase)
 
-        IrrMngt (IrrMngtStruct): object containing irrigation management paramaters
+        IrrMngt_IrrMethod (int): irrigation method
+
+        IrrMngt_NetIrrSMT (float): net irrigation soil-moisture target
 
 
 
     Returns:
 
-        NewCond (InitialCondition): InitCond object containing updated model paramaters
+        NewCond_th (numpy.array): updated soil water content
 
         PreIrr (float): Pre-Irrigaiton applied on current day mm
 
@@ -48,18 +66,16 @@ def pre_irrigation(
 
 
     """
-    # Store initial conditions for updating ##
-    NewCond = InitCond
 
     ## Calculate pre-irrigation needs ##
     if growing_season == True:
-        if (IrrMngt.irrigation_method != 4) or (NewCond.dap != 1):
+        if (IrrMngt_IrrMethod != 4) or (NewCond_DAP != 1):
             # No pre-irrigation as not in net irrigation mode or not on first day
             # of the growing season
             PreIrr = 0
         else:
             # Determine compartments covered by the root zone
-            rootdepth = round(max(NewCond.z_root, Crop.Zmin), 2)
+            rootdepth = round(max(NewCond_Zroot, Crop.Zmin), 2)
 
             compRz = np.argwhere(prof.dzsum >= rootdepth).flatten()[0]
 
@@ -68,16 +84,19 @@ def pre_irrigation(
 
                 # Determine critical water content threshold
                 thCrit = prof.th_wp[ii] + (
-                    (IrrMngt.NetIrrSMT / 100) * (prof.th_fc[ii] - prof.th_wp[ii])
+                    (IrrMngt_NetIrrSMT / 100) * (prof.th_fc[ii] - prof.th_wp[ii])
                 )
 
                 # Check if pre-irrigation is required
-                if NewCond.th[ii] < thCrit:
-                    PreIrr = PreIrr + ((thCrit - NewCond.th[ii]) * 1000 * prof.dz[ii])
-                    NewCond.th[ii] = thCrit
+                if NewCond_th[ii] < thCrit:
+                    PreIrr = PreIrr + ((thCrit - NewCond_th[ii]) * 1000 * prof.dz[ii])
+                    NewCond_th[ii] = thCrit
 
     else:
         PreIrr = 0
 
-    return NewCond, PreIrr
+    return NewCond_th, PreIrr
+
 
+if __name__ == "__main__":
+    cc.compile()
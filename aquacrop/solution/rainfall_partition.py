@@ -2,12 +2,10 @@ import numpy as np
 
 from numba import njit, f8, i8, b1
 from numba.pycc import CC
+from numba.extending import register_jitable
+
+from .signatures import SIGNATURES
 
-try:
-    from ..entities.soilProfile import SoilProfileNT_typ_sig
-except:
-    from entities.soilProfile import SoilProfileNT_typ_sig
-    
 # temporary name for compiled module
 cc = CC("solution_rainfall_partition")
 
@@ -20,7 +18,8 @@ if TYPE_CHECKING:
     from numpy import ndarray
 
 
-@cc.export("rainfall_partition", (f8,f8[:],i8,f8,b1,f8,f8,f8,f8,f8,f8,SoilProfileNT_typ_sig))
+@register_jitable
+@cc.export("rainfall_partition", SIGNATURES["rainfall_partition"])
 def rainfall_partition(
     precipitation: float,
     InitCond_th: "ndarray",
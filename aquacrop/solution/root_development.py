@@ -2,15 +2,10 @@ import numpy as np
 
 from numba import njit, f8, i8, b1
 from numba.pycc import CC
+from numba.extending import register_jitable
 
-try:
-    from ..entities.soilProfile import SoilProfileNT_typ_sig
-    from ..entities.crop import CropStructNT_type_sig
+from .signatures import SIGNATURES
 
-except:
-    from entities.soilProfile import SoilProfileNT_typ_sig
-    from entities.crop import CropStructNT_type_sig
-    
 # temporary name for compiled module
 cc = CC("solution_root_development")
 
@@ -23,7 +18,8 @@ if TYPE_CHECKING:
     from numpy import ndarray
 
 
-@cc.export("root_development", (CropStructNT_type_sig,SoilProfileNT_typ_sig,f8,f8,f8,f8,f8,f8,f8[:],f8,f8,b1,f8,f8,f8,f8,b1,i8))
+@register_jitable
+@cc.export("root_development", SIGNATURES["root_development"])
 def root_development(
     Crop: "CropStructNT",
     prof: "SoilProfileNT",
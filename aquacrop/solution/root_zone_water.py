@@ -21,7 +21,7 @@ if TYPE_CHECKING:
 
 # temporary name for compiled module
 cc = CC("solution_root_zone_water")
-@njit
+@njit(cache=True)
 @cc.export("root_zone_water", (SoilProfileNT_typ_sig,f8,f8[:],f8,f8,f8))
 def root_zone_water(
     prof: "SoilProfileNT_typ_sig",
@@ -0,0 +1,127 @@
+import numpy as np
+from numba.extending import register_jitable
+
+from .root_zone_water import root_zone_water
+from ..entities.initParamVariables import WC_ROOT_ZONE_CALLS, WC_ROOT_ZONE_EVALUATIONS
+
+from typing import TYPE_CHECKING, Tuple
+
+if TYPE_CHECKING:
+    # Important: classes are only imported when types are checked, not in production.
+    from aquacrop.entities.soilProfile import SoilProfileNT
+    from numpy import ndarray
+
+
+# Layout of a root zone cache array: the key of the stored results, the 11
+# results of root_zone_water, the number of calls and of calculations, and
+# the water content the results were calculated for
+RZ_CACHE_VALID = 0
+RZ_CACHE_ZROOT = 1
+RZ_CACHE_ZMIN = 2
+RZ_CACHE_AER = 3
+RZ_CACHE_RESULTS = 4
+RZ_CACHE_CALLS = 15
+RZ_CACHE_EVALUATIONS = 16
+RZ_CACHE_TH = 17
+
+
+@register_jitable
+def new_root_zone_cache(nComp: int) -> "ndarray":
+    """
+    Function to create an empty root zone cache
+
+    Arguments:
+
+        nComp (int): number of soil compartments
+
+    Returns:
+
+        root_zone_cache (numpy.array): empty root zone cache
+
+    """
+    return np.zeros(RZ_CACHE_TH + nComp)
+
+
+@register_jitable
+def cached_root_zone_water(
+    root_zone_cache: "ndarray",
+    prof: "SoilProfileNT",
+    InitCond_Zroot: float,
+    InitCond_th: "ndarray",
+    Soil_zTop: float,
+    Crop_Zmin: float,
+    Crop_Aer: float,
+) -> Tuple[float, float, float, float, float, float, float, float, float, float, float]:
+    """
+    Function to get the results of root_zone_water, only calculating them
+    again if the rooting depth, the water content or the crop paramaters
+    have changed since the last call with the same cache
+
+    Arguments:
+
+        root_zone_cache (numpy.array): root zone cache (updated in place)
+
+        prof (SoilProfile): jit class Object containing soil paramaters
+
+        InitCond_Zroot (float): Initial rooting depth
+
+        InitCond_th (np.array): Initial water content
+
+        Soil_zTop (float): Top soil depth
+
+        Crop_Zmin (float): crop minimum rooting depth
+
+        Crop_Aer (int): number of aeration stress days
+
+    Returns:
+
+        results (tuple): results of root_zone_water (WrAct, Dr_Zt, Dr_Rz,
+            TAW_Zt, TAW_Rz, thRZ_Act, thRZ_S, thRZ_FC, thRZ_WP, thRZ_Dry, thRZ_Aer)
+
+    """
+    root_zone_cache[RZ_CACHE_CALLS] += 1
+    is_cached = (
+        root_zone_cache[RZ_CACHE_VALID] == 1
+        and root_zone_cache[RZ_CACHE_ZROOT] == InitCond_Zroot
+        and root_zone_cache[RZ_CACHE_ZMIN] == Crop_Zmin
+        and root_zone_cache[RZ_CACHE_AER] == Crop_Aer
+    )
+    if is_cached:
+        for ii in range(len(InitCond_th)):
+            if root_zone_cache[RZ_CACHE_TH + ii] != InitCond_th[ii]:
+                is_cached = False
+                break
+
+    if not is_cached:
+        results = root_zone_water(
+            prof, InitCond_Zroot, InitCond_th, Soil_zTop, Crop_Zmin, Crop_Aer
+        )
+        root_zone_cache[RZ_CACHE_EVALUATIONS] += 1
+        root_zone_cache[RZ_CACHE_VALID] = 1
+        root_zone_cache[RZ_CACHE_ZROOT] = InitCond_Zroot
+        root_zone_cache[RZ_CACHE_ZMIN] = Crop_Zmin
+        root_zone_cache[RZ_CACHE_AER] = Crop_Aer
+        for ii in range(11):
+            root_zone_cache[RZ_CACHE_RESULTS + ii] = results[ii]
+        for ii in range(len(InitCond_th)):
+            root_zone_cache[RZ_CACHE_TH + ii] = InitCond_th[ii]
+
+    c = root_zone_cache[RZ_CACHE_RESULTS:RZ_CACHE_TH]
+    return c[0], c[1], c[2], c[3], c[4], c[5], c[6], c[7], c[8], c[9], c[10]
+
+
+@register_jitable
+def count_root_zone_work(root_zone_cache: "ndarray", work_counters: "ndarray") -> None:
+    """
+    Function to add the calls and calculations of a root zone cache to the
+    work counters
+
+    Arguments:
+
+        root_zone_cache (numpy.array): root zone cache of the day
+
+        work_counters (numpy.array): work counters (updated in place)
+
+    """
+    work_counters[WC_ROOT_ZONE_CALLS] += root_zone_cache[RZ_CACHE_CALLS]
+    work_counters[WC_ROOT_ZONE_EVALUATIONS] += root_zone_cache[RZ_CACHE_EVALUATIONS]
@@ -0,0 +1,29 @@
+"""
+Signatures of the solution functions of each time step, exported by their
+AOT compiled modules (see aquacrop-compile) and used to compile them with
+the jit backend (see aquacrop.solution.backend).
+"""
+from numba import f8, i8, b1
+
+from ..entities.crop import CropStructNT_type_sig
+from ..entities.soilProfile import SoilProfileNT_typ_sig
+
+SIGNATURES = {
+    "check_groundwater_table": (SoilProfileNT_typ_sig,f8,f8[:],f8[:],i8,f8),
+    "root_development": (CropStructNT_type_sig,SoilProfileNT_typ_sig,f8,f8,f8,f8,f8,f8,f8[:],f8,f8,b1,f8,f8,f8,f8,b1,i8),
+    "pre_irrigation": (SoilProfileNT_typ_sig,CropStructNT_type_sig,i8,f8,f8[:],b1,i8,f8),
+    "drainage": (SoilProfileNT_typ_sig,f8[:],f8[:]),
+    "rainfall_partition": (f8,f8[:],i8,f8,b1,f8,f8,f8,f8,f8,f8,SoilProfileNT_typ_sig),
+    "irrigation": (i8,f8[:],f8,f8,i8,f8[:],f8,f8,f8,f8,f8,f8,f8,f8[:],i8,i8,CropStructNT_type_sig,SoilProfileNT_typ_sig,f8,b1,f8,f8,f8[:]),
+    "infiltration": (SoilProfileNT_typ_sig,f8,f8[:],f8[:],f8,f8,f8,b1,f8,f8[:],f8,f8,b1,f8[:]),
+    "capillary_rise": (SoilProfileNT_typ_sig,i8,f8,f8,f8[:],f8[:],f8[:],i8,f8[:]),
+    "germination": (b1,b1,f8,f8,f8[:],f8,SoilProfileNT_typ_sig,f8,i8,f8,b1),
+    "growth_stage": (CropStructNT_type_sig,i8,f8,f8,f8,f8,b1),
+    "canopy_cover": (CropStructNT_type_sig,SoilProfileNT_typ_sig,f8,i8,f8,f8,f8,f8,f8[:],f8,f8,f8,f8,f8,f8,f8,b1,b1,b1,f8,f8,f8,f8,b1,f8[:]),
+    "soil_evaporation": (i8,i8,i8,SoilProfileNT_typ_sig,f8,f8,f8,f8,f8,f8,f8,i8,f8,i8,f8,b1,f8,f8,i8,f8,f8,f8,f8[:],f8,f8,f8,f8,f8,f8,f8,b1,f8,f8,f8,f8,f8,f8,f8,b1,f8[:]),
+    "transpiration": (SoilProfileNT_typ_sig,i8,f8,CropStructNT_type_sig,i8,f8,i8,f8,f8,f8,f8,f8,f8,f8,f8,f8,f8,f8,f8,f8,f8[:],f8,f8[:],f8,f8,f8,f8,f8,f8,f8,f8,f8,b1,f8,f8[:]),
+    "groundwater_inflow": (SoilProfileNT_typ_sig,b1,f8,f8[:]),
+    "HIref_current_day": (f8,f8,i8,i8,b1,f8,f8,f8,f8,CropStructNT_type_sig,b1),
+    "biomass_accumulation": (CropStructNT_type_sig,i8,i8,f8,f8,f8,f8,f8,f8,f8,b1),
+    "harvest_index": (SoilProfileNT_typ_sig,f8,CropStructNT_type_sig,f8,f8[:],f8,f8,i8,f8,b1,b1,f8,f8,f8,f8,f8,f8,f8,f8,f8,f8,f8,f8,f8,f8,f8,b1,f8[:]),
+}
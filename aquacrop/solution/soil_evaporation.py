@@ -1,23 +1,27 @@
-import os
 import numpy as np
 
         
 from numba import njit, f8, i8, b1
 from numba.pycc import CC
+from numba.extending import register_jitable
+
+from .signatures import SIGNATURES
 
 try:
-    from ..entities.soilProfile import SoilProfileNT_typ_sig
+    from ..entities.initParamVariables import (
+        WC_EVAP_STAGE2_SUB_STEPS,
+        WC_EVAP_LAYER_EXPANSIONS,
+    )
 except:
-    from entities.soilProfile import SoilProfileNT_typ_sig
+    from entities.initParamVariables import (
+        WC_EVAP_STAGE2_SUB_STEPS,
+        WC_EVAP_LAYER_EXPANSIONS,
+    )
 
 
-if __name__ != "__main__":
-    if os.getenv("DEVELOPMENT"):
-        from .evap_layer_water_content import evap_layer_water_content
-    else:
-        from .solution_evap_layer_water_content import evap_layer_water_content
-else:
-    from .evap_layer_water_content import evap_layer_water_content
+# Jitted sub-kernel, imported from source so that soil_evaporation can also be
+# compiled as part of the whole-simulation loop
+from .evap_layer_water_content import evap_layer_water_content
 
 from typing import TYPE_CHECKING, Tuple
 
@@ -32,11 +36,8 @@ if TYPE_CHECKING:
 cc = CC("solution_soil_evaporation")
 
 
-@cc.export(
-    "soil_evaporation", (i8,i8,i8,SoilProfileNT_typ_sig,
-    f8,f8,f8,f8,f8,f8,f8,i8,f8,i8,f8,b1,f8,f8,i8,f8,f8,f8,f8[:],f8,f8,f8,f8,f8,f8,
-        f8,b1,f8,f8,f8,f8,f8,f8,f8,b1),
-)
+@register_jitable
+@cc.export("soil_evaporation", SIGNATURES["soil_evaporation"])
 def soil_evaporation(
     ClockStruct_EvapTimeSteps: int,
     ClockStruct_SimOffSeason: bool,
@@ -77,6 +78,7 @@ def soil_evaporation(
     Rain: float,
     Irr: float,
     growing_season: bool,
+    WorkCounters: "ndarray",
 ) -> Tuple[float, "ndarray", bool, float, float, float, float, float, float]:
 
     """
@@ -165,6 +167,8 @@ def soil_evaporation(
 
         growing_season (bool): is growing season (True or Flase)
 
+        WorkCounters (numpy.array): work counters (updated in place)
+
 
     Returns:
 
@@ -418,6 +422,7 @@ def soil_evaporation(
         Edt = ToExtract / ClockStruct_EvapTimeSteps
         # Loop sub-daily steps
         for jj in range(int(ClockStruct_EvapTimeSteps)):
+            WorkCounters[WC_EVAP_STAGE2_SUB_STEPS] += 1
             # Get current water storage (mm)
             Wevap_Sat, Wevap_Fc, Wevap_Wp, Wevap_Dry, Wevap_Act = evap_layer_water_content(
                 NewCond_th,
@@ -436,6 +441,7 @@ def soil_evaporation(
                     (Soil_EvapZmax - NewCond_EvapZ) / (Soil_EvapZmax - Soil_EvapZmin)
                 )
                 while (Wrel < Wcheck) and (NewCond_EvapZ < Soil_EvapZmax):
+                    WorkCounters[WC_EVAP_LAYER_EXPANSIONS] += 1
                     # Expand evaporation layer by 1 mm
                     NewCond_EvapZ = NewCond_EvapZ + 0.001
                     # Update water storage (mm) in evaporation layer
@@ -2,6 +2,7 @@ import numpy as np
 
 from numba import njit, f8, i8, b1
 from numba.pycc import CC
+from numba.extending import register_jitable
 
 try:
     from ..entities.crop import CropStructNT_type_sig
@@ -19,6 +20,7 @@ if TYPE_CHECKING:
 
 
 
+@register_jitable
 @cc.export("temperature_stress", (CropStructNT_type_sig,f8,f8))
 def temperature_stress(
     Crop: "CropStructNT",
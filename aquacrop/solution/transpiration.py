@@ -1,28 +1,16 @@
-
-import os
 import numpy as np
-from ..entities.totalAvailableWater import TAW
-from ..entities.moistureDepletion import Dr
-from ..entities.rootZoneWaterContent import RootZoneWater, thRZNT
-from ..entities.waterStressCoefficients import  Ksw,  KswNT
-
+from numba.extending import register_jitable
+from numba import f8, i8, b1
+from numba.pycc import CC
+from .signatures import SIGNATURES
+from ..entities.rootZoneWaterContent import thRZNT
 
-# This compiled function is called a few times inside other functions
+# Sub-kernels are imported from source so that transpiration can also be
+# compiled as part of the whole-simulation loop
+from .water_stress import water_stress
+from .root_zone_water_cache import cached_root_zone_water
+from .aeration_stress import aeration_stress
 
-if __name__ != "__main__":
-    if os.getenv("DEVELOPMENT"):
-        from .water_stress import water_stress
-        from .root_zone_water import root_zone_water
-        from .aeration_stress import aeration_stress
-    else:
-        from .solution_water_stress import water_stress
-        from .solution_root_zone_water import root_zone_water
-        from .solution_aeration_stress import aeration_stress
-else:
-    from .water_stress import water_stress
-    from .root_zone_water import root_zone_water
-    from .aeration_stress import aeration_stress
-     
 
 from typing import TYPE_CHECKING, Tuple
 
@@ -30,12 +18,17 @@ if TYPE_CHECKING:
     # Important: classes are only imported when types are checked, not in production.
     from aquacrop.entities.soilProfile import SoilProfileNT
     from aquacrop.entities.crop import CropStructNT
-    from aquacrop.entities.initParamVariables import InitialCondition
-    from aquacrop.entities.co2 import CO2
+    from numpy import ndarray
 
 
 
 
+# temporary name for compiled module
+cc = CC("solution_transpiration")
+
+
+@register_jitable
+@cc.export("transpiration", SIGNATURES["transpiration"])
 def transpiration(
     Soil_Profile: "SoilProfileNT",
     Soil_nComp: int,
@@ -43,12 +36,36 @@ def transpiration(
     Crop: "CropStructNT",
     IrrMngt_IrrMethod: int,
     IrrMngt_NetIrrSMT: float,
-    InitCond: "InitialCondition",
+    NewCond_DAP: int,
+    NewCond_DelayedCDs: float,
+    NewCond_AgeDays: float,
+    NewCond_AgeDays_NS: float,
+    NewCond_CC: float,
+    NewCond_CC_NS: float,
+    NewCond_CCadj: float,
+    NewCond_CCadj_NS: float,
+    NewCond_CCxW: float,
+    NewCond_CCxW_NS: float,
+    NewCond_CCprev: float,
+    NewCond_SurfaceStorage: float,
+    NewCond_DaySubmerged: float,
+    NewCond_AerDays: float,
+    NewCond_AerDaysComp: "ndarray",
+    NewCond_Zroot: float,
+    NewCond_th: "ndarray",
+    NewCond_tEarlySen: float,
+    NewCond_rCor: float,
+    NewCond_IrrNetCum: float,
+    NewCond_Depletion: float,
+    NewCond_TAW: float,
+    NewCond_TrRatio: float,
     et0: float,
-    CO2: "CO2",
+    CO2_CurrentConc: float,
+    CO2_RefConc: float,
     growing_season: bool,
     gdd: float,
-) -> Tuple[float,float,float,"InitialCondition",float]:
+    root_zone_cache: "ndarray",
+) -> Tuple[float, float, float, float, float, float, float, float, float, "ndarray", "ndarray", float, float, float, float, float, float]:
 
     """
     Function to calculate crop transpiration on current day
@@ -72,16 +89,64 @@ def transpiration(
 
         IrrMngt_NetIrrSMT (float): net irrigation soil-moisture target
 
-        InitCond (InitialCondition): InitCond object
+        NewCond_DAP (int): days after planting
+
+        NewCond_DelayedCDs (float): delayed calendar days
+
+        NewCond_AgeDays (float): canopy ageing days
+
+        NewCond_AgeDays_NS (float): canopy ageing days (no stress)
+
+        NewCond_CC (float): canopy cover
+
+        NewCond_CC_NS (float): canopy cover (no stress)
+
+        NewCond_CCadj (float): adjusted canopy cover
+
+        NewCond_CCadj_NS (float): adjusted canopy cover (no stress)
+
+        NewCond_CCxW (float): maximum canopy cover for withered canopy effects
+
+        NewCond_CCxW_NS (float): maximum canopy cover for withered canopy effects (no stress)
+
+        NewCond_CCprev (float): canopy cover on previous day
+
+        NewCond_SurfaceStorage (float): surface storage
+
+        NewCond_DaySubmerged (float): days submerged
+
+        NewCond_AerDays (float): aeration stress days
+
+        NewCond_AerDaysComp (numpy.array): aeration stress days in each compartment (updated in place)
+
+        NewCond_Zroot (float): rooting depth
+
+        NewCond_th (numpy.array): soil water content (updated in place)
+
+        NewCond_tEarlySen (float): days in early senescence
+
+        NewCond_rCor (float): root growth correction factor
+
+        NewCond_IrrNetCum (float): cumulative net irrigation
+
+        NewCond_Depletion (float): root zone depletion
+
+        NewCond_TAW (float): root zone total available water
+
+        NewCond_TrRatio (float): transpiration ratio
 
         et0 (float): reference evapotranspiration
 
-        CO2 (CO2): CO2
+        CO2_CurrentConc (float): current CO2 concentration
+
+        CO2_RefConc (float): reference CO2 concentration
 
         gdd (float): Growing Degree Days
 
         growing_season (bool): is it currently within the growing season (True, Flase)
 
+        root_zone_cache (numpy.array): root zone water results of the current day (updated in place)
+
     Returns:
 
 
@@ -91,10 +156,34 @@ def transpiration(
 
         TrPot0 (float): Potential Transpiration on current day
 
-        NewCond (InitialCondition): updated InitCond object
-
         IrrNet (float): Net Irrigation (if required)
 
+        NewCond_AgeDays (float): updated canopy ageing days
+
+        NewCond_AgeDays_NS (float): updated canopy ageing days (no stress)
+
+        NewCond_SurfaceStorage (float): updated surface storage
+
+        NewCond_DaySubmerged (float): updated days submerged
+
+        NewCond_AerDays (float): updated aeration stress days
+
+        NewCond_AerDaysComp (numpy.array): updated aeration stress days in each compartment
+
+        NewCond_th (numpy.array): updated soil water content
+
+        NewCond_Depletion (float): updated root zone depletion
+
+        NewCond_TAW (float): updated root zone total available water
+
+        NewCond_IrrNetCum (float): updated cumulative net irrigation
+
+        NewCond_CC (float): updated canopy cover
+
+        NewCond_TrRatio (float): updated transpiration ratio
+
+        NewCond_Tpot (float): potential transpiration, stored for irrigation calculations on next day
+
 
 
 
@@ -104,9 +193,7 @@ def transpiration(
     """
 
     ## Store initial conditions ##
-    NewCond = InitCond
-
-    InitCond_th = InitCond.th
+    InitCond_th = NewCond_th
 
     prof = Soil_Profile
 
@@ -115,39 +202,39 @@ def transpiration(
         ## Calculate potential transpiration ##
         # 1. No prior water stress
         # Update ageing days counter
-        DAPadj = NewCond.dap - NewCond.delayed_cds
+        DAPadj = NewCond_DAP - NewCond_DelayedCDs
         if DAPadj > Crop.MaxCanopyCD:
-            NewCond.age_days_ns = DAPadj - Crop.MaxCanopyCD
+            NewCond_AgeDays_NS = DAPadj - Crop.MaxCanopyCD
 
         # Update crop coefficient for ageing of canopy
-        if NewCond.age_days_ns > 5:
-            Kcb_NS = Crop.Kcb - ((NewCond.age_days_ns - 5) * (Crop.fage / 100)) * NewCond.ccx_w_ns
+        if NewCond_AgeDays_NS > 5:
+            Kcb_NS = Crop.Kcb - ((NewCond_AgeDays_NS - 5) * (Crop.fage / 100)) * NewCond_CCxW_NS
         else:
             Kcb_NS = Crop.Kcb
 
         # Update crop coefficient for CO2 concentration
-        CO2CurrentConc = CO2.current_concentration
-        CO2RefConc = CO2.ref_concentration
+        CO2CurrentConc = CO2_CurrentConc
+        CO2RefConc = CO2_RefConc
         if CO2CurrentConc > CO2RefConc:
             Kcb_NS = Kcb_NS * (1 - 0.05 * ((CO2CurrentConc - CO2RefConc) / (550 - CO2RefConc)))
 
         # Determine potential transpiration rate (no water stress)
-        TrPot_NS = Kcb_NS * (NewCond.canopy_cover_adj_ns) * et0
+        TrPot_NS = Kcb_NS * (NewCond_CCadj_NS) * et0
 
         # Correct potential transpiration for dying green canopy effects
-        if NewCond.canopy_cover_ns < NewCond.ccx_w_ns:
-            if (NewCond.ccx_w_ns > 0.001) and (NewCond.canopy_cover_ns > 0.001):
-                TrPot_NS = TrPot_NS * ((NewCond.canopy_cover_ns / NewCond.ccx_w_ns) ** Crop.a_Tr)
+        if NewCond_CC_NS < NewCond_CCxW_NS:
+            if (NewCond_CCxW_NS > 0.001) and (NewCond_CC_NS > 0.001):
+                TrPot_NS = TrPot_NS * ((NewCond_CC_NS / NewCond_CCxW_NS) ** Crop.a_Tr)
 
         # 2. Potential prior water stress and/or delayed development
         # Update ageing days counter
-        DAPadj = NewCond.dap - NewCond.delayed_cds
+        DAPadj = NewCond_DAP - NewCond_DelayedCDs
         if DAPadj > Crop.MaxCanopyCD:
-            NewCond.age_days = DAPadj - Crop.MaxCanopyCD
+            NewCond_AgeDays = DAPadj - Crop.MaxCanopyCD
 
         # Update crop coefficient for ageing of canopy
-        if NewCond.age_days > 5:
-            Kcb = Crop.Kcb - ((NewCond.age_days - 5) * (Crop.fage / 100)) * NewCond.ccx_w
+        if NewCond_AgeDays > 5:
+            Kcb = Crop.Kcb - ((NewCond_AgeDays - 5) * (Crop.fage / 100)) * NewCond_CCxW
         else:
             Kcb = Crop.Kcb
 
@@ -156,11 +243,11 @@ def transpiration(
             Kcb = Kcb * (1 - 0.05 * ((CO2CurrentConc - CO2RefConc) / (550 - CO2RefConc)))
 
         # Determine potential transpiration rate
-        TrPot0 = Kcb * (NewCond.canopy_cover_adj) * et0
+        TrPot0 = Kcb * (NewCond_CCadj) * et0
         # Correct potential transpiration for dying green canopy effects
-        if NewCond.canopy_cover < NewCond.ccx_w:
-            if (NewCond.ccx_w > 0.001) and (NewCond.canopy_cover > 0.001):
-                TrPot0 = TrPot0 * ((NewCond.canopy_cover / NewCond.ccx_w) ** Crop.a_Tr)
+        if NewCond_CC < NewCond_CCxW:
+            if (NewCond_CCxW > 0.001) and (NewCond_CC > 0.001):
+                TrPot0 = TrPot0 * ((NewCond_CC / NewCond_CCxW) ** Crop.a_Tr)
 
         # 3. Adjust potential transpiration for cold stress effects
         # Check if cold stress occurs on current day
@@ -194,26 +281,26 @@ def transpiration(
         TrPot0 = TrPot0 * KsCold
         TrPot_NS = TrPot_NS * KsCold
 
-        # print(TrPot0,NewCond.dap)
+        # print(TrPot0,NewCond_DAP)
 
         ## Calculate surface layer transpiration ##
-        if (NewCond.surface_storage > 0) and (NewCond.day_submerged < Crop.LagAer):
+        if (NewCond_SurfaceStorage > 0) and (NewCond_DaySubmerged < Crop.LagAer):
 
             # Update submergence days counter
-            NewCond.day_submerged = NewCond.day_submerged + 1
+            NewCond_DaySubmerged = NewCond_DaySubmerged + 1
             # Update anerobic conditions counter for each compartment
             for ii in range(int(Soil_nComp)):
                 # Increment aeration days counter for compartment ii
-                NewCond.aer_days_comp[ii] = NewCond.aer_days_comp[ii] + 1
-                if NewCond.aer_days_comp[ii] > Crop.LagAer:
-                    NewCond.aer_days_comp[ii] = Crop.LagAer
+                NewCond_AerDaysComp[ii] = NewCond_AerDaysComp[ii] + 1
+                if NewCond_AerDaysComp[ii] > Crop.LagAer:
+                    NewCond_AerDaysComp[ii] = Crop.LagAer
 
             # Reduce actual transpiration that is possible to account for
             # aeration stress due to extended submergence
-            fSub = 1 - (NewCond.day_submerged / Crop.LagAer)
-            if NewCond.surface_storage > (fSub * TrPot0):
+            fSub = 1 - (NewCond_DaySubmerged / Crop.LagAer)
+            if NewCond_SurfaceStorage > (fSub * TrPot0):
                 # Transpiration occurs from surface storage
-                NewCond.surface_storage = NewCond.surface_storage - (fSub * TrPot0)
+                NewCond_SurfaceStorage = NewCond_SurfaceStorage - (fSub * TrPot0)
                 TrAct0 = fSub * TrPot0
             else:
                 # No transpiration from surface storage
@@ -235,61 +322,57 @@ def transpiration(
             TrPot = TrPot0
             TrAct0 = 0
 
-        # print(TrPot,NewCond.dap)
+        # print(TrPot,NewCond_DAP)
 
         ## Update potential root zone transpiration for water stress ##
         # Determine root zone and top soil depletion, and root zone water
         # content
 
-        taw = TAW()
-        water_root_depletion = Dr()
-        thRZ = RootZoneWater()
         (
             _,
-            water_root_depletion.Zt,
-            water_root_depletion.Rz,
-            taw.Zt,
-            taw.Rz,
-            thRZ.Act,
-            thRZ.S,
-            thRZ.FC,
-            thRZ.WP,
-            thRZ.Dry,
-            thRZ.Aer,
-        ) = root_zone_water(
+            Dr_Zt,
+            Dr_Rz,
+            TAW_Zt,
+            TAW_Rz,
+            thRZ_Act,
+            thRZ_S,
+            thRZ_FC,
+            thRZ_WP,
+            thRZ_Dry,
+            thRZ_Aer,
+        ) = cached_root_zone_water(
+            root_zone_cache,
             prof,
-            float(NewCond.z_root),
-            NewCond.th,
+            float(NewCond_Zroot),
+            NewCond_th,
             Soil_zTop,
             float(Crop.Zmin),
             Crop.Aer,
         )
 
-        class_args = {key:value for key, value in thRZ.__dict__.items() if not key.startswith('__') and not callable(key)}
-        thRZ = thRZNT(**class_args)
+        thRZ = thRZNT(thRZ_Act, thRZ_S, thRZ_FC, thRZ_WP, thRZ_Dry, thRZ_Aer)
 
-        # _,water_root_depletion,taw,thRZ = root_zone_water(Soil_Profile,float(NewCond.z_root),NewCond.th,Soil_zTop,float(Crop.Zmin),Crop.Aer)
+        # _,water_root_depletion,taw,thRZ = root_zone_water(Soil_Profile,float(NewCond_Zroot),NewCond_th,Soil_zTop,float(Crop.Zmin),Crop.Aer)
         # Check whether to use root zone or top soil depletions for calculating
         # water stress
-        if (water_root_depletion.Rz / taw.Rz) <= (water_root_depletion.Zt / taw.Zt):
+        if (Dr_Rz / TAW_Rz) <= (Dr_Zt / TAW_Zt):
             # Root zone is wetter than top soil, so use root zone value
-            water_root_depletion = water_root_depletion.Rz
-            taw = taw.Rz
+            water_root_depletion = Dr_Rz
+            taw = TAW_Rz
         else:
             # Top soil is wetter than root zone, so use top soil values
-            water_root_depletion = water_root_depletion.Zt
-            taw = taw.Zt
+            water_root_depletion = Dr_Zt
+            taw = TAW_Zt
 
         # Calculate water stress coefficients
         beta = True
-        water_stress_coef = Ksw()
-        water_stress_coef.exp, water_stress_coef.sto, water_stress_coef.sen, water_stress_coef.pol, water_stress_coef.sto_lin = water_stress(
+        Ksw_Exp, Ksw_Sto, Ksw_Sen, Ksw_Pol, Ksw_StoLin = water_stress(
             Crop.p_up,
             Crop.p_lo,
             Crop.ETadj,
             Crop.beta,
             Crop.fshape_w,
-            NewCond.t_early_sen,
+            NewCond_tEarlySen,
             water_root_depletion,
             taw,
             et0,
@@ -298,9 +381,9 @@ def transpiration(
         # water_stress_coef = water_stress(Crop, NewCond, water_root_depletion, taw, et0, beta)
 
         # Calculate aeration stress coefficients
-        Ksa_Aer, NewCond.aer_days = aeration_stress(NewCond.aer_days, Crop.LagAer, thRZ)
+        Ksa_Aer, NewCond_AerDays = aeration_stress(NewCond_AerDays, Crop.LagAer, thRZ)
         # Maximum stress effect
-        Ks = min(water_stress_coef.sto_lin, Ksa_Aer)
+        Ks = min(Ksw_StoLin, Ksa_Aer)
         # Update potential transpiration in root zone
         if IrrMngt_IrrMethod != 4:
             # No adjustment to TrPot for water stress when in net irrigation mode
@@ -308,7 +391,7 @@ def transpiration(
 
         ## Determine compartments covered by root zone ##
         # Compartments covered by the root zone
-        rootdepth = round(max(float(NewCond.z_root), float(Crop.Zmin)), 2)
+        rootdepth = round(max(float(NewCond_Zroot), float(Crop.Zmin)), 2)
         comp_sto = min(np.sum(Soil_Profile.dzsum < rootdepth) + 1, int(Soil_nComp))
         RootFact = np.zeros(int(Soil_nComp))
         # Determine fraction of each compartment covered by root zone
@@ -331,16 +414,16 @@ def transpiration(
             for ii in range(comp_sto):
                 SxCompTop = SxCompBot
                 if Soil_Profile.dzsum[ii] <= rootdepth:
-                    SxCompBot = Crop.SxBot * NewCond.r_cor + (
-                        (Crop.SxTop - Crop.SxBot * NewCond.r_cor)
+                    SxCompBot = Crop.SxBot * NewCond_rCor + (
+                        (Crop.SxTop - Crop.SxBot * NewCond_rCor)
                         * ((rootdepth - Soil_Profile.dzsum[ii]) / rootdepth)
                     )
                 else:
-                    SxCompBot = Crop.SxBot * NewCond.r_cor
+                    SxCompBot = Crop.SxBot * NewCond_rCor
 
                 SxComp[ii] = (SxCompTop + SxCompBot) / 2
 
-        # print(TrPot,NewCond.dap)
+        # print(TrPot,NewCond_DAP)
         ## Extract water ##
         ToExtract = TrPot
         comp = -1
@@ -361,12 +444,12 @@ def transpiration(
             thCrit = prof.th_fc[comp] - (thTAW * p_up_sto)
 
             # Check for soil water stress
-            if NewCond.th[comp] >= thCrit:
+            if NewCond_th[comp] >= thCrit:
                 # No water stress effects on transpiration
                 KsComp = 1
-            elif NewCond.th[comp] > prof.th_wp[comp]:
+            elif NewCond_th[comp] > prof.th_wp[comp]:
                 # Transpiration from compartment is affected by water stress
-                Wrel = (prof.th_fc[comp] - NewCond.th[comp]) / (prof.th_fc[comp] - prof.th_wp[comp])
+                Wrel = (prof.th_fc[comp] - NewCond_th[comp]) / (prof.th_fc[comp] - prof.th_wp[comp])
                 pRel = (Wrel - Crop.p_up[1]) / (Crop.p_lo[1] - Crop.p_up[1])
                 if pRel <= 0:
                     KsComp = 1
@@ -388,34 +471,34 @@ def transpiration(
                 KsComp = 0
 
             # Adjust compartment stress factor for aeration stress
-            if NewCond.day_submerged >= Crop.LagAer:
+            if NewCond_DaySubmerged >= Crop.LagAer:
                 # Full aeration stress - no transpiration possible from
                 # compartment
                 AerComp = 0
-            elif NewCond.th[comp] > (prof.th_s[comp] - (Crop.Aer / 100)):
+            elif NewCond_th[comp] > (prof.th_s[comp] - (Crop.Aer / 100)):
                 # Increment aeration stress days counter
-                NewCond.aer_days_comp[comp] = NewCond.aer_days_comp[comp] + 1
-                if NewCond.aer_days_comp[comp] >= Crop.LagAer:
-                    NewCond.aer_days_comp[comp] = Crop.LagAer
+                NewCond_AerDaysComp[comp] = NewCond_AerDaysComp[comp] + 1
+                if NewCond_AerDaysComp[comp] >= Crop.LagAer:
+                    NewCond_AerDaysComp[comp] = Crop.LagAer
                     fAer = 0
                 else:
                     fAer = 1
 
                 # Calculate aeration stress factor
-                AerComp = (prof.th_s[comp] - NewCond.th[comp]) / (
+                AerComp = (prof.th_s[comp] - NewCond_th[comp]) / (
                     prof.th_s[comp] - (prof.th_s[comp] - (Crop.Aer / 100))
                 )
                 if AerComp < 0:
                     AerComp = 0
 
-                AerComp = (fAer + (NewCond.aer_days_comp[comp] - 1) * AerComp) / (
-                    fAer + NewCond.aer_days_comp[comp] - 1
+                AerComp = (fAer + (NewCond_AerDaysComp[comp] - 1) * AerComp) / (
+                    fAer + NewCond_AerDaysComp[comp] - 1
                 )
             else:
                 # No aeration stress as number of submerged days does not
                 # exceed threshold for initiation of aeration stress
                 AerComp = 1
-                NewCond.aer_days_comp[comp] = 0
+                NewCond_AerDaysComp[comp] = 0
 
             # Extract water
             ThToExtract = (ToExtract / 1000) / Soil_Profile.dz[comp]
@@ -444,7 +527,7 @@ def transpiration(
                     Sink = 0
 
             # Update water content in compartment
-            NewCond.th[comp] = InitCond_th[comp] - Sink
+            NewCond_th[comp] = InitCond_th[comp] - Sink
             # Update amount of water to extract
             ToExtract = ToExtract - (Sink * 1000 * prof.dz[comp])
             # Update actual transpiration
@@ -456,37 +539,35 @@ def transpiration(
             IrrNet = 0
             # Get root zone water content
 
-            taw = TAW()
-            water_root_depletion = Dr()
-            thRZ = RootZoneWater()
             (
                 _,
-                water_root_depletion.Zt,
-                water_root_depletion.Rz,
-                taw.Zt,
-                taw.Rz,
-                thRZ.Act,
-                thRZ.S,
-                thRZ.FC,
-                thRZ.WP,
-                thRZ.Dry,
-                thRZ.Aer,
-            ) = root_zone_water(
+                Dr_Zt,
+                Dr_Rz,
+                TAW_Zt,
+                TAW_Rz,
+                thRZ_Act,
+                thRZ_S,
+                thRZ_FC,
+                thRZ_WP,
+                thRZ_Dry,
+                thRZ_Aer,
+            ) = cached_root_zone_water(
+                root_zone_cache,
                 prof,
-                float(NewCond.z_root),
-                NewCond.th,
+                float(NewCond_Zroot),
+                NewCond_th,
                 Soil_zTop,
                 float(Crop.Zmin),
                 Crop.Aer,
             )
 
-            # _,_Dr,_TAW,thRZ = root_zone_water(Soil_Profile,float(NewCond.z_root),NewCond.th,Soil_zTop,float(Crop.Zmin),Crop.Aer)
-            NewCond.depletion = water_root_depletion.Rz
-            NewCond.taw = taw.Rz
+            # _,_Dr,_TAW,thRZ = root_zone_water(Soil_Profile,float(NewCond_Zroot),NewCond_th,Soil_zTop,float(Crop.Zmin),Crop.Aer)
+            NewCond_Depletion = Dr_Rz
+            NewCond_TAW = TAW_Rz
             # Determine critical water content for net irrigation
-            thCrit = thRZ.WP + ((IrrMngt_NetIrrSMT / 100) * (thRZ.FC - thRZ.WP))
+            thCrit = thRZ_WP + ((IrrMngt_NetIrrSMT / 100) * (thRZ_FC - thRZ_WP))
             # Check if root zone water content is below net irrigation trigger
-            if thRZ.Act < thCrit:
+            if thRZ_Act < thCrit:
                 # Initialise layer counter
                 prelayer = 0
                 for ii in range(comp_sto):
@@ -503,44 +584,44 @@ def transpiration(
 
                     # Determine necessary change in water content in
                     # compartments to reach critical water content
-                    dWC = RootFact[ii] * (thCrit - NewCond.th[ii]) * 1000 * prof.dz[ii]
+                    dWC = RootFact[ii] * (thCrit - NewCond_th[ii]) * 1000 * prof.dz[ii]
                     # Update water content
-                    NewCond.th[ii] = NewCond.th[ii] + (dWC / (1000 * prof.dz[ii]))
+                    NewCond_th[ii] = NewCond_th[ii] + (dWC / (1000 * prof.dz[ii]))
                     # Update net irrigation counter
                     IrrNet = IrrNet + dWC
 
             # Update net irrigation counter for the growing season
-            NewCond.irr_net_cum = NewCond.irr_net_cum + IrrNet
+            NewCond_IrrNetCum = NewCond_IrrNetCum + IrrNet
         elif (IrrMngt_IrrMethod == 4) and (TrPot <= 0):
             # No net irrigation as potential transpiration is zero
             IrrNet = 0
         else:
             # No net irrigation as not in net irrigation mode
             IrrNet = 0
-            NewCond.irr_net_cum = 0
+            NewCond_IrrNetCum = 0
 
         ## Add any surface transpiration to root zone total ##
         TrAct = TrAct + TrAct0
 
         ## Feedback with canopy cover development ##
         # If actual transpiration is zero then no canopy cover growth can occur
-        if ((NewCond.canopy_cover - NewCond.cc_prev) > 0.005) and (TrAct == 0):
-            NewCond.canopy_cover = NewCond.cc_prev
+        if ((NewCond_CC - NewCond_CCprev) > 0.005) and (TrAct == 0):
+            NewCond_CC = NewCond_CCprev
 
         ## Update transpiration ratio ##
         if TrPot0 > 0:
             if TrAct < TrPot0:
-                NewCond.tr_ratio = TrAct / TrPot0
+                NewCond_TrRatio = TrAct / TrPot0
             else:
-                NewCond.tr_ratio = 1
+                NewCond_TrRatio = 1
 
         else:
-            NewCond.tr_ratio = 1
+            NewCond_TrRatio = 1
 
-        if NewCond.tr_ratio < 0:
-            NewCond.tr_ratio = 0
-        elif NewCond.tr_ratio > 1:
-            NewCond.tr_ratio = 1
+        if NewCond_TrRatio < 0:
+            NewCond_TrRatio = 0
+        elif NewCond_TrRatio > 1:
+            NewCond_TrRatio = 1
 
     else:
         # No transpiration if not in growing season
@@ -549,9 +630,31 @@ def transpiration(
         TrPot_NS = 0
         # No irrigation if not in growing season
         IrrNet = 0
-        NewCond.irr_net_cum = 0
+        NewCond_IrrNetCum = 0
 
     ## Store potential transpiration for irrigation calculations on next day ##
-    NewCond.t_pot = TrPot0
-
-    return TrAct, TrPot_NS, TrPot0, NewCond, IrrNet
\ No newline at end of file
+    NewCond_Tpot = TrPot0
+
+    return (
+        TrAct,
+        TrPot_NS,
+        TrPot0,
+        IrrNet,
+        NewCond_AgeDays,
+        NewCond_AgeDays_NS,
+        NewCond_SurfaceStorage,
+        NewCond_DaySubmerged,
+        NewCond_AerDays,
+        NewCond_AerDaysComp,
+        NewCond_th,
+        NewCond_Depletion,
+        NewCond_TAW,
+        NewCond_IrrNetCum,
+        NewCond_CC,
+        NewCond_TrRatio,
+        NewCond_Tpot,
+    )
+
+
+if __name__ == "__main__":
+    cc.compile()
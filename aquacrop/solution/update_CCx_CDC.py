@@ -2,6 +2,7 @@ import numpy as np
 
 from numba import njit, f8, i8, b1
 from numba.pycc import CC
+from numba.extending import register_jitable
 
 # temporary name for compiled module
 cc = CC("solution_update_CCx_CDC")
@@ -9,6 +10,7 @@ cc = CC("solution_update_CCx_CDC")
 from typing import Tuple
 
 
+@register_jitable
 @cc.export("update_CCx_CDC", "(f8,f8,f8,f8)")
 def update_CCx_CDC(
     cc_prev: float,
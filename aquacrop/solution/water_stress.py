@@ -14,7 +14,7 @@ if TYPE_CHECKING:
 # temporary name for compiled module
 cc = CC("solution_water_stress")
 
-@njit
+@njit(cache=True)
 @cc.export("water_stress", "(f8[:],f8[:],f8,f8,f8[:],f8,f8,f8,f8,f8)")
 def water_stress(
     Crop_p_up: "ndarray",
@@ -1,6 +1,6 @@
 def check_model_is_finished(
-    step_end_time: str,
-    simulation_end_date: str,
+    step_end_day: int,
+    simulation_end_day: int,
     model_is_finished: bool,
     season_counter: int,
     n_seasons: int,
@@ -12,9 +12,9 @@ def check_model_is_finished(
 
     Arguments:
 
-        step_end_time (str):  date of next step
+        step_end_day (int):  day of next step (days since simulation start)
 
-        simulation_end_date (str):  date of end of simulation
+        simulation_end_day (int):  day of end of simulation
 
         model_is_finished (bool):  is model finished
 
@@ -32,10 +32,10 @@ def check_model_is_finished(
     """
 
     # Check if current time-step is the last
-    current_time = step_end_time
-    if current_time < simulation_end_date:
+    current_day = step_end_day
+    if current_day < simulation_end_day:
         model_is_finished = False
-    elif current_time >= simulation_end_date:
+    elif current_day >= simulation_end_day:
         model_is_finished = True
 
     # Check if at the end of last growing season ##
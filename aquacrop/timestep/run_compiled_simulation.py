@@ -0,0 +1,749 @@
+"""
+Whole-simulation loop compiled with numba.
+
+The daily loop, the season resets and the 21 solution stages of a time step
+(time_step, shared with solution_single_time_step) are run in a single
+compiled call. The model state (InitialCondition) is its float64 buffer: the scalar fields, see
+InitCond_scalar_fields in initParamVariables, followed by the soil
+compartment arrays.
+"""
+import copy
+import typing
+
+import numpy as np
+from numba import njit, float64, int64, boolean, types
+from numba.typed import List
+
+from ..entities import initParamVariables as ipv
+from ..entities.crop import CropStructNT, crop_struct_to_named_tuple
+from ..entities.fieldManagement import FieldMngtNT, spec as field_mngt_spec
+from ..entities.irrigationManagement import IrrMngtNT, spec as irr_mngt_spec
+from .reset_initial_conditions import update_crop_parameters
+from .time_step import reset_state, time_step
+
+from typing import Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Important: classes are only imported when types are checked, not in production.
+    from numpy import ndarray
+    from aquacrop.entities.clockStruct import ClockStruct
+    from aquacrop.entities.initParamVariables import InitialCondition
+    from aquacrop.entities.paramStruct import ParamStruct
+    from aquacrop.entities.output import Output
+    from aquacrop.entities.soilProfile import SoilProfileNT
+
+
+soil_params_spec = [
+    ("nComp", int64),
+    ("nLayer", int64),
+    ("z_top", float64),
+    ("fshape_cr", float64),
+    ("z_germ", float64),
+    ("cn", float64),
+    ("adj_cn", int64),
+    ("z_cn", float64),
+    ("evap_z_min", float64),
+    ("evap_z_max", float64),
+    ("rew", float64),
+    ("kex", float64),
+    ("fwcc", float64),
+    ("f_wrel_exp", float64),
+    ("f_evap", float64),
+]
+
+SoilParamsNT = typing.NamedTuple("SoilParamsNT", soil_params_spec)
+
+# Everything the compiled loop needs to know about a field (one model)
+FieldParamsNT = typing.NamedTuple(
+    "FieldParamsNT",
+    [
+        ("prof", "SoilProfileNT"),
+        ("soil", SoilParamsNT),
+        ("crops", "List"),  # CropStructNT of each season
+        ("fallow_crop", CropStructNT),
+        ("irr_mngt", IrrMngtNT),
+        ("fallow_irr_mngt", IrrMngtNT),
+        ("field_mngt", FieldMngtNT),
+        ("fallow_field_mngt", FieldMngtNT),
+        ("water_table", int),
+        ("z_gw", np.ndarray),
+        ("evap_time_steps", int),
+        ("sim_off_season", bool),
+        ("planting_day", np.ndarray),  # days since simulation start
+        ("harvest_day", np.ndarray),  # days since simulation start
+        ("co2_conc", np.ndarray),  # before the first season, then of each season
+        ("co2_ref", float),
+        ("season_ok", np.ndarray),  # False if the season reset failed
+        ("gdd", np.ndarray),  # gdd's of each day, with the crop of its season
+    ],
+)
+
+# Columns of the weather array passed to the compiled loop
+WEATHER_MIN_TEMP = 0
+WEATHER_MAX_TEMP = 1
+WEATHER_PRECIPITATION = 2
+WEATHER_ET0 = 3
+
+# Columns of the final stats array filled by the compiled loop
+STATS_RECORDED = 0
+STATS_STEP = 1
+STATS_DRY_YIELD = 2
+STATS_FRESH_YIELD = 3
+STATS_YIELD_POT = 4
+STATS_IRR_TOT = 5
+N_STATS = 6
+
+# Status of a field in the compiled loop
+STATUS_RUNNING = -1
+STATUS_FINISHED = 0
+STATUS_SEASON_FAILED = 1
+STATUS_PLANTING_OUT_OF_RANGE = 2
+
+
+def to_named_tuple(nt_class, spec, obj):
+    """
+    Copy the attributes of a (python) parameter object into a NamedTuple,
+    casting every field to the type given in its numba spec so that the
+    NamedTuples of different seasons share a single numba type.
+
+    Arguments:
+
+        nt_class (NamedTuple): NamedTuple class to build
+
+        spec (list): numba spec of the NamedTuple, [(name, type), ...]
+
+        obj (object): object holding the parameter values
+
+
+    Returns:
+
+        nt (NamedTuple): parameter values cast to the spec types
+
+    """
+    values = {}
+    for name, numba_type in spec:
+        value = getattr(obj, name)
+        if isinstance(numba_type, types.Array):
+            value = np.ascontiguousarray(value, dtype=numba_type.dtype.name)
+        elif numba_type == float64:
+            value = float(value)
+        elif numba_type == int64:
+            value = int(value)
+        elif numba_type == boolean:
+            value = bool(value)
+        values[name] = value
+
+    return nt_class(**values)
+
+
+@njit(cache=True)
+def new_typed_list(item):
+    """
+    Typed list holding item. Building typed lists in (cached) compiled code
+    avoids compiling the typed list methods again in every python process.
+    """
+    items = List()
+    items.append(item)
+    return items
+
+
+@njit(cache=True)
+def typed_list_append(items, item):
+    """
+    Append item to a typed list built with new_typed_list
+    """
+    items.append(item)
+
+
+def to_typed_list(values: list) -> "List":
+    """
+    Copy a (non-empty) python list into a numba typed list
+    """
+    items = new_typed_list(values[0])
+    for value in values[1:]:
+        typed_list_append(items, value)
+
+    return items
+
+
+@njit(cache=True)
+def advance_field(
+    state: "ndarray",
+    th: "ndarray",
+    th_fc_adj: "ndarray",
+    aer_days_comp: "ndarray",
+    thini: "ndarray",
+    weather: "ndarray",
+    field: "FieldParamsNT",
+    time_step_counter: int,
+    season_counter: int,
+    water_storage: "ndarray",
+    water_flux: "ndarray",
+    crop_growth: "ndarray",
+    final_stats: "ndarray",
+    first_row: int,
+) -> Tuple["ndarray", "ndarray", "ndarray", int, int, int]:
+    """
+    Simulate one day of a field and move its clock to the next time step
+    (see AquaCropModel._perform_timestep and update_time).
+
+    Arguments:
+
+        state (numpy.ndarray): scalar model state (updated in place)
+
+        th (numpy.ndarray): soil water content
+
+        th_fc_adj (numpy.ndarray): adjusted water content at field capacity
+
+        aer_days_comp (numpy.ndarray): aeration stress days of each compartment
+
+        thini (numpy.ndarray): initial soil water content (updated in place)
+
+        weather (numpy.ndarray): min temp, max temp, precipitation and et0 of each day
+
+        field (FieldParamsNT): paramaters of the field
+
+        time_step_counter (int): time step to simulate
+
+        season_counter (int): season of the time step
+
+        water_storage (numpy.ndarray): water storage outputs (updated in place)
+
+        water_flux (numpy.ndarray): water flux outputs (updated in place)
+
+        crop_growth (numpy.ndarray): crop growth outputs (updated in place)
+
+        final_stats (numpy.ndarray): final stats of each season (updated in place)
+
+        first_row (int): time step of the first row of the daily outputs
+
+
+    Returns:
+
+        th (numpy.ndarray): updated soil water content
+
+        th_fc_adj (numpy.ndarray): updated adjusted water content at field capacity
+
+        aer_days_comp (numpy.ndarray): updated aeration stress days of each compartment
+
+        time_step_counter (int): next time step (last one if the field is finished)
+
+        season_counter (int): season of the next time step
+
+        status (int): STATUS_RUNNING, STATUS_FINISHED or the reason the field stopped early
+
+    """
+    t = time_step_counter
+    s = season_counter
+    n_steps = weather.shape[0]
+    n_seasons = field.planting_day.shape[0]
+
+    # Check if growing season is active on current time step
+    if s >= 0:
+        growing_season = (
+            (field.planting_day[s] <= t)
+            and (field.harvest_day[s] >= t)
+            and (state[ipv.CROP_MATURE] == 0)
+            and (state[ipv.CROP_DEAD] == 0)
+        )
+        crop = field.crops[s]
+        irr = field.irr_mngt
+        if growing_season:
+            field_mngt = field.field_mngt
+        else:
+            field_mngt = field.fallow_field_mngt
+    else:
+        growing_season = False
+        crop = field.fallow_crop
+        irr = field.fallow_irr_mngt
+        field_mngt = field.fallow_field_mngt
+
+    if field.water_table == 1:
+        GroundWater = field.z_gw[t]
+    else:
+        GroundWater = 0.0
+
+    if s >= 0:
+        harvest_day = field.harvest_day[s]
+    else:
+        harvest_day = -1
+
+    th, th_fc_adj, aer_days_comp, IrrTot, season_finished = time_step(
+        state,
+        th,
+        th_fc_adj,
+        aer_days_comp,
+        thini,
+        weather[t, WEATHER_MIN_TEMP],
+        weather[t, WEATHER_MAX_TEMP],
+        weather[t, WEATHER_PRECIPITATION],
+        weather[t, WEATHER_ET0],
+        field.gdd[t],
+        t,
+        s,
+        harvest_day,
+        growing_season,
+        crop,
+        irr,
+        field_mngt,
+        field.prof,
+        field.soil,
+        field.water_table,
+        GroundWater,
+        field.evap_time_steps,
+        field.sim_off_season,
+        field.co2_conc[s + 1],
+        field.co2_ref,
+        water_storage,
+        water_flux,
+        crop_growth,
+        t - first_row,
+    )
+
+    # Final output (if at end of growing season)
+    if season_finished:
+        final_stats[s, STATS_RECORDED] = 1
+        final_stats[s, STATS_STEP] = t
+        final_stats[s, STATS_DRY_YIELD] = state[ipv.DRYYIELD]
+        final_stats[s, STATS_FRESH_YIELD] = state[ipv.FRESHYIELD]
+        final_stats[s, STATS_YIELD_POT] = state[ipv.YIELDPOT]
+        final_stats[s, STATS_IRR_TOT] = IrrTot
+
+    # Check model termination
+    if (t + 1 >= n_steps - 1) or (
+        (state[ipv.HARVEST_FLAG] == 1) and (s == n_seasons - 1)
+    ):
+        return th, th_fc_adj, aer_days_comp, t, s, STATUS_FINISHED
+
+    # Update time step
+    reset = False
+    if (state[ipv.HARVEST_FLAG] == 1) and (field.sim_off_season == False):
+        # Advance time to the start of the next growing season
+        if s < n_seasons - 1:
+            s = s + 1
+            t = field.planting_day[s]
+            if (t < 0) or (t >= n_steps - 1):
+                return th, th_fc_adj, aer_days_comp, t, s, STATUS_PLANTING_OUT_OF_RANGE
+            reset = True
+    else:
+        t = t + 1
+        if s < n_seasons - 1:
+            # Check if upcoming day is the start of a new growing season
+            if t == field.planting_day[s + 1]:
+                s = s + 1
+                reset = True
+
+    if reset:
+        if field.season_ok[s] == False:
+            return th, th_fc_adj, aer_days_comp, t, s, STATUS_SEASON_FAILED
+        # Reset initial conditions for start of growing season
+        reset_state(
+            state,
+            th,
+            aer_days_comp,
+            thini,
+            field.crops[s].HI0,
+            field.sim_off_season,
+            field.field_mngt,
+        )
+
+    return th, th_fc_adj, aer_days_comp, t, s, STATUS_RUNNING
+
+
+@njit(cache=True)
+def compiled_batch_loop(
+    states: "ndarray",
+    weather: "ndarray",
+    fields: "List",
+    time_step_counter: "ndarray",
+    season_counter: "ndarray",
+    status: "ndarray",
+    water_storage: "ndarray",
+    water_flux: "ndarray",
+    crop_growth: "ndarray",
+    final_stats: "ndarray",
+    first_row: int,
+    end_step: int,
+) -> None:
+    """
+    Run N fields sharing one weather series until all of them are finished,
+    or have reached end_step. Their state is stored along the first axis of
+    every array.
+
+    The loop is not vectorised over the fields: each iteration calls
+    advance_field for every running field in turn, and the fields are not
+    on the same day, as each one jumps to its own planting days (when the
+    off-season is not simulated). The batch saves the python overhead of
+    running the fields one by one, not the cost of their time steps.
+
+    Arguments:
+
+        states (numpy.ndarray): (N, state_size(nComp)) InitialCondition buffer of each field (updated in place)
+
+        weather (numpy.ndarray): min temp, max temp, precipitation and et0 of each day
+
+        fields (List): paramaters (FieldParamsNT) of each field
+
+        time_step_counter (numpy.ndarray): time step of each field (updated in place)
+
+        season_counter (numpy.ndarray): season of each field (updated in place)
+
+        status (numpy.ndarray): STATUS_RUNNING for fields to simulate, exit status on return
+
+        water_storage (numpy.ndarray): (N, n_rows, 3 + nComp) water storage outputs (updated in place)
+
+        water_flux (numpy.ndarray): (N, n_rows, 16) water flux outputs (updated in place)
+
+        crop_growth (numpy.ndarray): (N, n_rows, 15) crop growth outputs (updated in place)
+
+        final_stats (numpy.ndarray): (N, n_seasons, N_STATS) final stats of each season (updated in place)
+
+        first_row (int): time step of the first row of the daily outputs
+
+        end_step (int): time step at which fields stop (after the last row of the daily outputs)
+
+
+    """
+    n_fields = states.shape[0]
+    n_comp = (states.shape[1] - ipv.N_SCALARS) // ipv.N_ARRAYS
+    aer_days_comp_start = ipv.N_SCALARS + ipv.AER_DAYS_COMP_ARRAY * n_comp
+    th_fc_adj_start = ipv.N_SCALARS + ipv.TH_FC_ADJ_ARRAY * n_comp
+    th_start = ipv.N_SCALARS + ipv.TH_ARRAY * n_comp
+    thini_start = ipv.N_SCALARS + ipv.THINI_ARRAY * n_comp
+    n_running = 0
+    for i in range(n_fields):
+        if status[i] == STATUS_RUNNING:
+            n_running += 1
+
+    while n_running > 0:
+        n_advanced = 0
+        for i in range(n_fields):
+            if status[i] != STATUS_RUNNING or time_step_counter[i] >= end_step:
+                continue
+
+            n_advanced += 1
+            buffer = states[i]
+            th_i, th_fc_adj_i, aer_days_comp_i, t, s, status_i = advance_field(
+                buffer[: ipv.N_SCALARS],
+                buffer[th_start : th_start + n_comp].copy(),
+                buffer[th_fc_adj_start : th_fc_adj_start + n_comp].copy(),
+                buffer[aer_days_comp_start : aer_days_comp_start + n_comp].copy(),
+                buffer[thini_start : thini_start + n_comp],
+                weather,
+                fields[i],
+                time_step_counter[i],
+                season_counter[i],
+                water_storage[i],
+                water_flux[i],
+                crop_growth[i],
+                final_stats[i],
+                first_row,
+            )
+            buffer[th_start : th_start + n_comp] = th_i
+            buffer[th_fc_adj_start : th_fc_adj_start + n_comp] = th_fc_adj_i
+            buffer[aer_days_comp_start : aer_days_comp_start + n_comp] = aer_days_comp_i
+            time_step_counter[i] = t
+            season_counter[i] = s
+            status[i] = status_i
+
+            if status_i != STATUS_RUNNING:
+                n_running -= 1
+
+        # The running fields have all reached end_step
+        if n_advanced == 0:
+            break
+
+
+def _prepare_field(
+    clock_struct: "ClockStruct",
+    init_cond: "InitialCondition",
+    param_struct: "ParamStruct",
+) -> Tuple["FieldParamsNT", list, dict]:
+    """
+    Build the compiled paramaters of a field.
+
+    Crop and CO2 updates done by reset_initial_conditions only depend on the
+    planting date, so they are computed upfront for every season that the
+    loop will reset.
+
+    Arguments:
+
+        clock_struct (ClockStruct):  model time paramaters
+
+        init_cond (InitialCondition):  containing current variables+counters
+
+        param_struct (ParamStruct):  contains model paramaters
+
+
+    Returns:
+
+        field (FieldParamsNT): compiled paramaters of the field
+
+        season_crops (list): CropStruct of each season, as they will be after their reset
+
+        season_errors (dict): exception raised while resetting a season, by season
+
+    """
+    Soil = param_struct.Soil
+    CO2 = param_struct.CO2
+    n_seasons = clock_struct.n_seasons
+    start_season = clock_struct.season_counter
+
+    # Season calendar in days since the start of the simulation
+    planting_day = clock_struct.planting_days
+    harvest_day = clock_struct.harvest_days
+
+    season_crops = list(param_struct.Seasonal_Crop_List)
+    co2_conc = np.full(n_seasons + 1, float(CO2.current_concentration))
+    season_ok = np.ones(n_seasons, dtype=np.bool_)
+    season_errors = {}
+    co2_copy = copy.copy(CO2)
+    for season in range(start_season + 1, n_seasons):
+        crop_copy = copy.copy(param_struct.Seasonal_Crop_List[season])
+        try:
+            co2_conc[season + 1] = update_crop_parameters(
+                crop_copy,
+                co2_copy,
+                param_struct.co2_table,
+                clock_struct.planting_dates[season],
+                int(planting_day[season]),
+                param_struct.gdd_table,
+            )
+        except Exception as error:  # pylint: disable=broad-except
+            season_ok[season] = False
+            season_errors[season] = error
+        season_crops[season] = crop_copy
+
+    # Fallow crop used before the first season
+    if start_season == -1:
+        param_struct.Fallow_Crop.Aer = 5
+        param_struct.Fallow_Crop.Zmin = 0.3
+
+    field = FieldParamsNT(
+        prof=Soil.Profile,
+        soil=to_named_tuple(SoilParamsNT, soil_params_spec, Soil),
+        crops=to_typed_list(
+            [crop_struct_to_named_tuple(crop) for crop in season_crops]
+        ),
+        fallow_crop=crop_struct_to_named_tuple(param_struct.Fallow_Crop),
+        irr_mngt=to_named_tuple(IrrMngtNT, irr_mngt_spec, param_struct.IrrMngt),
+        fallow_irr_mngt=to_named_tuple(IrrMngtNT, irr_mngt_spec, param_struct.FallowIrrMngt),
+        field_mngt=to_named_tuple(FieldMngtNT, field_mngt_spec, param_struct.FieldMngt),
+        fallow_field_mngt=to_named_tuple(
+            FieldMngtNT, field_mngt_spec, param_struct.FallowFieldMngt
+        ),
+        water_table=int(param_struct.water_table),
+        z_gw=np.asarray(param_struct.z_gw, dtype=np.float64),
+        evap_time_steps=int(clock_struct.evap_time_steps),
+        sim_off_season=bool(clock_struct.sim_off_season),
+        planting_day=planting_day,
+        harvest_day=harvest_day,
+        co2_conc=co2_conc,
+        co2_ref=float(CO2.ref_concentration),
+        season_ok=season_ok,
+        gdd=param_struct.season_gdd,
+    )
+
+    return field, season_crops, season_errors
+
+
+def _write_back_field(
+    clock_struct: "ClockStruct",
+    init_cond: "InitialCondition",
+    param_struct: "ParamStruct",
+    outputs: "Output",
+    field: "FieldParamsNT",
+    season_crops: list,
+    buffer: "ndarray",
+    final_stats: "ndarray",
+    time_step_counter: int,
+    season_counter: int,
+) -> None:
+    """
+    Copy the compiled state of a field back into its python structures
+    (the daily outputs are copied by the caller)
+    """
+    t = time_step_counter
+    s = season_counter
+    start_season = clock_struct.season_counter
+
+    init_cond.buffer[:] = buffer
+
+    # Crop and CO2 of the seasons reset by the loop
+    for season in range(start_season + 1, s + 1):
+        param_struct.Seasonal_Crop_List[season] = season_crops[season]
+        param_struct.Seasonal_Crop_NT_List[season] = None
+    if s > start_season:
+        param_struct.CO2.current_concentration = field.co2_conc[s + 1]
+
+    # Final stats
+    for season in range(clock_struct.n_seasons):
+        if final_stats[season, STATS_RECORDED] == 1:
+            step = int(final_stats[season, STATS_STEP])
+            outputs.final_stats[season] = (
+                season,
+                param_struct.CropChoices[season],
+                clock_struct.date(step + 1),
+                step,
+                final_stats[season, STATS_DRY_YIELD],
+                final_stats[season, STATS_FRESH_YIELD],
+                final_stats[season, STATS_YIELD_POT],
+                final_stats[season, STATS_IRR_TOT],
+            )
+
+    # Update clock
+    clock_struct.season_counter = s
+    if t + 1 < clock_struct.n_steps:
+        clock_struct.time_step_counter = t
+
+
+def run_compiled_batch(
+    clock_structs: "list",
+    init_conds: "list",
+    param_structs: "list",
+    weather: "ndarray",
+    outputs: "list",
+) -> None:
+    """
+    Run N initialised models that share the same weather and simulation
+    period till termination, in a single compiled loop (see
+    compiled_batch_loop). Every structure is updated in place, as
+    run_compiled_simulation does for a single model. The daily outputs of the
+    models are kept in the rows of (N, chunk_rows, ...) arrays written by the
+    loop.
+
+    Arguments:
+
+        clock_structs (list):  ClockStruct of each model
+
+        init_conds (list):  InitialCondition of each model
+
+        param_structs (list):  ParamStruct of each model
+
+        weather (numpy.ndarray):  weather data for simulation period
+
+        outputs (list):  Output of each model
+
+
+    """
+    n_fields = len(clock_structs)
+    n_seasons = max(clock_struct.n_seasons for clock_struct in clock_structs)
+
+    fields = []
+    season_crops = []
+    season_errors = []
+    for clock_struct, init_cond, param_struct in zip(clock_structs, init_conds, param_structs):
+        field, crops, errors = _prepare_field(clock_struct, init_cond, param_struct)
+        fields.append(field)
+        season_crops.append(crops)
+        season_errors.append(errors)
+
+    states = np.stack([init_cond.buffer for init_cond in init_conds])
+
+    time_step_counter = np.array([c.time_step_counter for c in clock_structs], dtype=np.int64)
+    season_counter = np.array([c.season_counter for c in clock_structs], dtype=np.int64)
+    status = np.full(n_fields, STATUS_RUNNING, dtype=np.int64)
+
+    final_stats = np.zeros((n_fields, n_seasons, N_STATS))
+    weather = np.ascontiguousarray(weather[:, :4], dtype=np.float64)
+    fields_list = to_typed_list(fields)
+
+    # The daily outputs are simulated one chunk of chunk_rows time steps at a
+    # time (a single chunk, unless they are written to disk by an OutputSink)
+    chunk_rows = outputs[0].chunk_rows
+    if any(o.chunk_rows != chunk_rows for o in outputs):
+        raise ValueError("All the models of a batch must have the same output chunk size.")
+
+    # Rows of any step already run in python are kept
+    water_storage = np.empty((n_fields,) + outputs[0].water_storage.shape)
+    water_flux = np.empty((n_fields,) + outputs[0].water_flux.shape)
+    crop_growth = np.empty((n_fields,) + outputs[0].crop_growth.shape)
+    for i in range(n_fields):
+        outputs[i].use_arrays(water_storage[i], water_flux[i], crop_growth[i])
+
+    running = np.flatnonzero(status == STATUS_RUNNING)
+    while len(running) > 0:
+        first_row = int(time_step_counter[running].min()) // chunk_rows * chunk_rows
+        end_step = first_row + chunk_rows
+        for i in running:
+            if time_step_counter[i] < end_step:
+                # Moves the outputs of the model to the chunk
+                outputs[i].row(first_row)
+
+        compiled_batch_loop(
+            states,
+            weather,
+            fields_list,
+            time_step_counter,
+            season_counter,
+            status,
+            water_storage,
+            water_flux,
+            crop_growth,
+            final_stats,
+            first_row,
+            end_step,
+        )
+        running = np.flatnonzero(status == STATUS_RUNNING)
+
+    for i in range(n_fields):
+        _write_back_field(
+            clock_structs[i],
+            init_conds[i],
+            param_structs[i],
+            outputs[i],
+            fields[i],
+            season_crops[i],
+            states[i],
+            final_stats[i],
+            int(time_step_counter[i]),
+            int(season_counter[i]),
+        )
+
+    for i in range(n_fields):
+        if status[i] == STATUS_SEASON_FAILED:
+            raise season_errors[i][int(season_counter[i])]
+        if status[i] == STATUS_PLANTING_OUT_OF_RANGE:
+            raise KeyError(clock_structs[i].planting_dates[int(season_counter[i])])
+        clock_structs[i].model_is_finished = True
+
+
+def run_compiled_simulation(
+    clock_struct: "ClockStruct",
+    init_cond: "InitialCondition",
+    param_struct: "ParamStruct",
+    weather: "ndarray",
+    outputs: "Output",
+) -> Tuple["ClockStruct", "InitialCondition", "ParamStruct", "Output"]:
+    """
+    Run the simulation till termination with the compiled loop. Gives the
+    same results as calling solution_single_time_step and update_time until
+    the model is finished with the aot or jit backend, and the same up to
+    round-off with the python backend (see aquacrop.timestep.time_step).
+
+    Arguments:
+
+        clock_struct (ClockStruct):  model time paramaters
+
+        init_cond (InitialCondition):  containing current variables+counters
+
+        param_struct (ParamStruct):  contains model paramaters
+
+        weather (numpy.ndarray):  weather data for simulation period
+
+        outputs (Output):  object to store outputs
+
+    Returns:
+
+        clock_struct (ClockStruct):  model time paramaters
+
+        init_cond (InitialCondition):  containing updated simulation variables+counters
+
+        param_struct (ParamStruct):  contains model paramaters
+
+        outputs (Output):  object to store outputs
+
+    """
+    run_compiled_batch([clock_struct], [init_cond], [param_struct], weather, [outputs])
+
+    return clock_struct, init_cond, param_struct, outputs
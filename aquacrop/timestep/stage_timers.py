@@ -0,0 +1,113 @@
+import time
+import types
+
+from typing import Callable, Dict
+
+from . import run_single_timestep
+from .time_step import time_step, with_solution_functions
+
+# Solution function called by each stage of time_step
+STAGES = {
+    "check_groundwater_table": "1. Check for groundwater table",
+    "root_development": "2. Root development",
+    "pre_irrigation": "3. Pre-irrigation",
+    "drainage": "4. Drainage",
+    "rainfall_partition": "5. Surface runoff",
+    "irrigation": "6. Irrigation",
+    "infiltration": "7. Infiltration",
+    "capillary_rise": "8. Capillary rise",
+    "germination": "9. Check germination",
+    "growth_stage": "10. Update growth stage",
+    "canopy_cover": "11. Canopy cover development",
+    "soil_evaporation": "12. Soil evaporation",
+    "transpiration": "13. Crop transpiration",
+    "groundwater_inflow": "14. Groundwater inflow",
+    "HIref_current_day": "15. Reference harvest index",
+    "biomass_accumulation": "16. Biomass accumulation",
+    "harvest_index": "17. Harvest index",
+    "cached_root_zone_water": "20. Root zone water",
+}
+
+TIME_STEP = "Time step"
+
+
+class StageTimers:
+    """
+    Accumulated wall time and number of calls of each stage of
+    solution_single_time_step.
+
+    The stages are timed by a copy of solution_single_time_step that calls a
+    copy of time_step with timed versions of the solution functions, so
+    they are unchanged (no overhead when the timers are not used). The
+    stages without a solution function (the growing degree days, read from
+    ParamStruct.season_gdd, and 18, 19 and 21) are included in the time
+    of the whole time step only.
+
+    Attributes:
+
+        times (dict): wall time (seconds) of each stage and of the whole time step
+
+        calls (dict): number of calls of each stage and of the whole time step
+
+        solution_single_time_step (function): solution_single_time_step with
+            timed stages
+
+    """
+
+    def __init__(self):
+        self.times: Dict[str, float] = dict.fromkeys([TIME_STEP, *STAGES.values()], 0.0)
+        self.calls: Dict[str, int] = dict.fromkeys([TIME_STEP, *STAGES.values()], 0)
+
+        solution_functions = run_single_timestep.time_step_function().__globals__
+        timed_time_step = with_solution_functions(
+            time_step,
+            {
+                function_name: self._timed(solution_functions[function_name], stage)
+                for function_name, stage in STAGES.items()
+            },
+        )
+
+        namespace = dict(vars(run_single_timestep))
+        namespace["time_step_function"] = lambda: timed_time_step
+        function = run_single_timestep.solution_single_time_step
+        self.solution_single_time_step = self._timed(
+            types.FunctionType(
+                function.__code__,
+                namespace,
+                function.__name__,
+                function.__defaults__,
+                function.__closure__,
+            ),
+            TIME_STEP,
+        )
+
+    def _timed(self, function: Callable, stage: str) -> Callable:
+        """
+        Function that adds its wall time and call to the stage
+        """
+        times = self.times
+        calls = self.calls
+        perf_counter = time.perf_counter
+
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            result = function(*args, **kwargs)
+            times[stage] += perf_counter() - start
+            calls[stage] += 1
+            return result
+
+        return timed
+
+    def totals(self) -> Dict[str, Dict[str, float]]:
+        """
+        Accumulated wall time and number of calls of each stage
+
+        Returns:
+
+            totals (dict): {stage: {"time": seconds, "calls": calls}}
+
+        """
+        return {
+            stage: {"time": self.times[stage], "calls": self.calls[stage]}
+            for stage in self.times
+        }
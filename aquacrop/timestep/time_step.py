@@ -0,0 +1,875 @@
+"""
+Solution of a single time step, shared by the python loop
+(solution_single_time_step) and the compiled loop (run_compiled_simulation).
+
+The functions work on the float64 buffer of InitialCondition (see
+initParamVariables) and are register_jitable: the compiled loop compiles them
+with the solution functions imported here, and the python loop calls a copy
+of time_step that uses the solution functions of the backend (see
+with_solution_functions and aquacrop.solution.backend). The compiled loop and
+the python loop with the aot or jit backend run the same compiled solution
+functions, and give the same results. With the python backend, numpy and the
+interpreter round some results differently (to the last bit), and the
+differences can grow over a simulation, e.g. when a threshold such as an
+irrigation soil moisture target is reached on a different day.
+"""
+import types
+
+import numpy as np
+from numba.extending import register_jitable
+
+from ..entities import initParamVariables as ipv
+from ..solution.check_groundwater_table import check_groundwater_table
+from ..solution.root_development import root_development
+from ..solution.pre_irrigation import pre_irrigation
+from ..solution.drainage import drainage
+from ..solution.rainfall_partition import rainfall_partition
+from ..solution.irrigation import irrigation
+from ..solution.infiltration import infiltration
+from ..solution.capillary_rise import capillary_rise
+from ..solution.germination import germination
+from ..solution.growth_stage import growth_stage
+from ..solution.canopy_cover import canopy_cover
+from ..solution.soil_evaporation import soil_evaporation
+from ..solution.transpiration import transpiration
+from ..solution.groundwater_inflow import groundwater_inflow
+from ..solution.HIref_current_day import HIref_current_day
+from ..solution.biomass_accumulation import biomass_accumulation
+from ..solution.harvest_index import harvest_index
+from ..solution.root_zone_water_cache import (
+    new_root_zone_cache,
+    cached_root_zone_water,
+    count_root_zone_work,
+)
+
+from typing import Callable, Dict, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Important: classes are only imported when types are checked, not in production.
+    from numpy import ndarray
+    from aquacrop.entities.crop import CropStructNT
+    from aquacrop.entities.fieldManagement import FieldMngtNT
+    from aquacrop.entities.irrigationManagement import IrrMngtNT
+    from aquacrop.entities.soilProfile import SoilProfileNT
+    from aquacrop.timestep.run_compiled_simulation import SoilParamsNT
+
+
+# Solution functions of the backends called by time_step (see
+# aquacrop.solution.backend)
+SOLUTION_FUNCTIONS = (
+    "check_groundwater_table",
+    "root_development",
+    "pre_irrigation",
+    "drainage",
+    "rainfall_partition",
+    "irrigation",
+    "infiltration",
+    "capillary_rise",
+    "germination",
+    "growth_stage",
+    "canopy_cover",
+    "soil_evaporation",
+    "transpiration",
+    "groundwater_inflow",
+    "HIref_current_day",
+    "biomass_accumulation",
+    "harvest_index",
+)
+
+
+def with_solution_functions(function: Callable, solution_functions: Dict[str, Callable]) -> Callable:
+    """
+    Copy of a function of this module that calls other solution functions
+    (e.g. those of a backend, or timed ones), to be called from python
+
+    Arguments:
+
+        function (function): function of this module (e.g. time_step)
+
+        solution_functions (dict): solution functions to call instead, by name
+
+    Returns:
+
+        function (function): copy of the function
+
+    """
+    namespace = dict(function.__globals__)
+    namespace.update(solution_functions)
+    return types.FunctionType(
+        function.__code__,
+        namespace,
+        function.__name__,
+        function.__defaults__,
+        function.__closure__,
+    )
+
+
+@register_jitable
+def reset_state(
+    state: "ndarray",
+    th: "ndarray",
+    aer_days_comp: "ndarray",
+    thini: "ndarray",
+    HI0: float,
+    sim_off_season: bool,
+    field_mngt: "FieldMngtNT",
+) -> None:
+    """
+    Function to reset the model state for the start of a growing season
+    (see reset_initial_conditions)
+
+    Arguments:
+
+        state (numpy.ndarray): scalar model state (updated in place)
+
+        th (numpy.ndarray): soil water content (updated in place)
+
+        aer_days_comp (numpy.ndarray): aeration stress days of each compartment (updated in place)
+
+        thini (numpy.ndarray): initial soil water content
+
+        HI0 (float): reference harvest index of the new season crop
+
+        sim_off_season (bool): simulate off-season or not
+
+        field_mngt (FieldMngtNT): field management of the growing season
+
+
+    """
+    # Reset counters
+    state[ipv.SEASON_RESETS] += 1
+    state[ipv.AGE_DAYS] = 0
+    state[ipv.AGE_DAYS_NS] = 0
+    state[ipv.AER_DAYS] = 0
+    state[ipv.IRR_CUM] = 0
+    state[ipv.DELAYED_GDDS] = 0
+    state[ipv.DELAYED_CDS] = 0
+    state[ipv.PCT_LAG_PHASE] = 0
+    state[ipv.T_EARLY_SEN] = 0
+    state[ipv.GDD_CUM] = 0
+    state[ipv.DAY_SUBMERGED] = 0
+    state[ipv.IRR_NET_CUM] = 0
+    state[ipv.DAP] = 0
+    aer_days_comp[:] = 0
+
+    # Reset states
+    state[ipv.PRE_ADJ] = 0
+    state[ipv.CROP_MATURE] = 0
+    state[ipv.CROP_DEAD] = 0
+    state[ipv.GERMINATION] = 0
+    state[ipv.PREMAT_SENES] = 0
+    state[ipv.HARVEST_FLAG] = 0
+
+    # Harvest index
+    state[ipv.STAGE] = 1
+    state[ipv.F_PRE] = 1
+    state[ipv.F_POST] = 1
+    state[ipv.FPOST_DWN] = 1
+    state[ipv.FPOST_UPP] = 1
+
+    state[ipv.H1_COR_ASUM] = 0
+    state[ipv.H1_COR_BSUM] = 0
+    state[ipv.F_POL] = 0
+    state[ipv.S_COR1] = 0
+    state[ipv.S_COR2] = 0
+
+    # Growth stage
+    state[ipv.GROWTH_STAGE] = 0
+
+    # Transpiration
+    state[ipv.TR_RATIO] = 1
+
+    # crop growth
+    state[ipv.R_COR] = 1
+
+    state[ipv.CANOPY_COVER] = 0
+    state[ipv.CANOPY_COVER_ADJ] = 0
+    state[ipv.CANOPY_COVER_NS] = 0
+    state[ipv.CANOPY_COVER_ADJ_NS] = 0
+    state[ipv.BIOMASS] = 0
+    state[ipv.BIOMASS_NS] = 0
+    state[ipv.HARVEST_INDEX] = 0
+    state[ipv.HARVEST_INDEX_ADJ] = 0
+    state[ipv.CCX_ACT] = 0
+    state[ipv.CCX_ACT_NS] = 0
+    state[ipv.CCX_W] = 0
+    state[ipv.CCX_W_NS] = 0
+    state[ipv.CCX_EARLY_SEN] = 0
+    state[ipv.CC_PREV] = 0
+    state[ipv.PROTECTED_SEED] = 0
+    state[ipv.SUMET0EARLYSEN] = 0
+    state[ipv.HIFINAL] = HI0
+    state[ipv.DRYYIELD] = 0
+    state[ipv.FRESHYIELD] = 0
+
+    # Reset soil water conditions (if not running off-season)
+    if sim_off_season == False:
+        # Reset water content to starting conditions
+        th[:] = thini
+        # Reset surface storage
+        if (field_mngt.bunds) and (field_mngt.z_bund > 0.001):
+            # Get initial storage between surface bunds
+            state[ipv.SURFACE_STORAGE] = min(field_mngt.bund_water, field_mngt.z_bund)
+        else:
+            # No surface bunds
+            state[ipv.SURFACE_STORAGE] = 0
+
+
+@register_jitable
+def time_step(
+    state: "ndarray",
+    th: "ndarray",
+    th_fc_adj: "ndarray",
+    aer_days_comp: "ndarray",
+    thini: "ndarray",
+    temp_min: float,
+    temp_max: float,
+    precipitation: float,
+    et0: float,
+    gdd_step: float,
+    time_step_counter: int,
+    season_counter: int,
+    harvest_day: int,
+    growing_season: bool,
+    Crop: "CropStructNT",
+    IrrMngt: "IrrMngtNT",
+    FieldMngt: "FieldMngtNT",
+    prof: "SoilProfileNT",
+    Soil: "SoilParamsNT",
+    water_table: int,
+    GroundWater: float,
+    evap_time_steps: int,
+    sim_off_season: bool,
+    co2_conc: float,
+    co2_ref: float,
+    water_storage: "ndarray",
+    water_flux: "ndarray",
+    crop_growth: "ndarray",
+    row_day: int,
+) -> Tuple["ndarray", "ndarray", "ndarray", float, bool]:
+    """
+    Function to run the 21 solution stages for a single day, write the daily
+    outputs and check if the growing season has ended
+
+    Arguments:
+
+        state (numpy.ndarray): scalar model state (updated in place)
+
+        th (numpy.ndarray): soil water content
+
+        th_fc_adj (numpy.ndarray): adjusted water content at field capacity
+
+        aer_days_comp (numpy.ndarray): aeration stress days of each compartment
+
+        thini (numpy.ndarray): initial soil water content (updated in place)
+
+        temp_min (float): minimum temperature of the day
+
+        temp_max (float): maximum temperature of the day
+
+        precipitation (float): precipitation of the day
+
+        et0 (float): reference evapotranspiration of the day
+
+        gdd_step (float): growing degree days of the day, with the crop of the current season
+
+        time_step_counter (int): current time step
+
+        season_counter (int): current season (-1 before the first season)
+
+        harvest_day (int): latest harvest day of the current season
+
+        growing_season (bool): is growing season (True or Flase)
+
+        Crop (CropStructNT): crop paramaters of the current season
+
+        IrrMngt (IrrMngtNT): irrigation management paramaters
+
+        FieldMngt (FieldMngtNT): field management paramaters
+
+        prof (SoilProfileNT): soil profile paramaters
+
+        Soil (SoilParamsNT): soil paramaters
+
+        water_table (int): water table present (1=yes, 0=no)
+
+        GroundWater (float): groundwater depth of the day
+
+        evap_time_steps (int): number of time-steps (per day) for soil evaporation
+
+        sim_off_season (bool): simulate off-season or not
+
+        co2_conc (float): current CO2 concentration
+
+        co2_ref (float): reference CO2 concentration
+
+        water_storage (numpy.ndarray): water storage outputs (updated in place)
+
+        water_flux (numpy.ndarray): water flux outputs (updated in place)
+
+        crop_growth (numpy.ndarray): crop growth outputs (updated in place)
+
+        row_day (int): row of the time step in the daily outputs
+
+
+    Returns:
+
+        th (numpy.ndarray): updated soil water content
+
+        th_fc_adj (numpy.ndarray): updated adjusted water content at field capacity
+
+        aer_days_comp (numpy.ndarray): updated aeration stress days of each compartment
+
+        IrrTot (float): total seasonal irrigation
+
+        season_finished (bool): the growing season has ended (its final outputs are to be stored)
+
+    """
+    # Increment time counters %%
+    if growing_season == True:
+        # Calendar days after planting
+        state[ipv.DAP] = state[ipv.DAP] + 1
+        # Growing degree days after planting (precomputed for every day)
+        gdd = gdd_step
+        # Update cumulative gdd counter
+        state[ipv.GDD] = gdd
+        state[ipv.GDD_CUM] = state[ipv.GDD_CUM] + gdd
+        state[ipv.GROWING_SEASON] = 1
+    else:
+        state[ipv.GROWING_SEASON] = 0
+        # Calendar days after planting
+        state[ipv.DAP] = 0
+        # Growing degree days after planting
+        gdd = 0.3
+        state[ipv.GDD_CUM] = 0
+
+    dap = int(state[ipv.DAP])
+
+    # save current timestep counter
+    state[ipv.TIME_STEP_COUNTER] = time_step_counter
+    state[ipv.PRECIPITATION] = precipitation
+    state[ipv.TEMP_MAX] = temp_max
+    state[ipv.TEMP_MIN] = temp_min
+    state[ipv.ET0] = et0
+
+    # Root zone water results of the day, shared by the stages that need them
+    root_zone_cache = new_root_zone_cache(Soil.nComp)
+    # Work counters of the solution functions (view of the state)
+    work_counters = state[ipv.WORK_COUNTERS : ipv.WORK_COUNTERS + ipv.N_WORK_COUNTERS]
+
+    # 1. Check for groundwater table
+    if water_table == 1:
+        th_fc_adj, wt_in_soil, z_gw = check_groundwater_table(
+            prof, state[ipv.Z_GW], th, th_fc_adj, water_table, GroundWater
+        )
+        state[ipv.WT_IN_SOIL] = wt_in_soil
+        state[ipv.Z_GW] = z_gw
+    else:
+        # No water table: stored as NaN, read as None from InitialCondition
+        state[ipv.WT_IN_SOIL] = np.nan
+        state[ipv.Z_GW] = np.nan
+
+    # 2. Root development
+    state[ipv.Z_ROOT], state[ipv.R_COR] = root_development(
+        Crop,
+        prof,
+        dap,
+        state[ipv.Z_ROOT],
+        state[ipv.DELAYED_CDS],
+        state[ipv.GDD_CUM],
+        state[ipv.DELAYED_GDDS],
+        state[ipv.TR_RATIO],
+        th,
+        state[ipv.CANOPY_COVER],
+        state[ipv.CANOPY_COVER_NS],
+        state[ipv.GERMINATION] == 1,
+        state[ipv.R_COR],
+        state[ipv.T_POT],
+        state[ipv.Z_GW],
+        gdd,
+        growing_season,
+        water_table,
+    )
+
+    # 3. Pre-irrigation
+    th, PreIrr = pre_irrigation(
+        prof,
+        Crop,
+        dap,
+        state[ipv.Z_ROOT],
+        th,
+        growing_season,
+        IrrMngt.irrigation_method,
+        IrrMngt.NetIrrSMT,
+    )
+    # The soil water content at the start of a season is the initial one
+    # (when the off-season is not simulated), which the pre-irrigation
+    # also raises for the next seasons
+    if PreIrr > 0 and (sim_off_season == False or time_step_counter == 0):
+        thini[:] = th
+
+    # 4. Drainage
+    th, DeepPerc, FluxOut = drainage(prof, th, th_fc_adj)
+
+    # 5. Surface runoff
+    Runoff, Infl, state[ipv.DAY_SUBMERGED] = rainfall_partition(
+        precipitation,
+        th,
+        state[ipv.DAY_SUBMERGED],
+        FieldMngt.sr_inhb,
+        FieldMngt.bunds,
+        FieldMngt.z_bund,
+        FieldMngt.curve_number_adj_pct,
+        Soil.cn,
+        Soil.adj_cn,
+        Soil.z_cn,
+        Soil.nComp,
+        prof,
+    )
+
+    # 6. Irrigation
+    state[ipv.DEPLETION], state[ipv.TAW], state[ipv.IRR_CUM], Irr = irrigation(
+        IrrMngt.irrigation_method,
+        IrrMngt.SMT,
+        IrrMngt.AppEff,
+        IrrMngt.MaxIrr,
+        IrrMngt.IrrInterval,
+        IrrMngt.Schedule,
+        IrrMngt.depth,
+        IrrMngt.MaxIrrSeason,
+        state[ipv.GROWTH_STAGE],
+        state[ipv.IRR_CUM],
+        state[ipv.E_POT],
+        state[ipv.T_POT],
+        state[ipv.Z_ROOT],
+        th,
+        dap,
+        time_step_counter,
+        Crop,
+        prof,
+        Soil.z_top,
+        growing_season,
+        precipitation,
+        Runoff,
+        root_zone_cache,
+    )
+
+    # 7. Infiltration
+    (
+        th,
+        state[ipv.SURFACE_STORAGE],
+        DeepPerc,
+        Runoff,
+        Infl,
+        FluxOut,
+    ) = infiltration(
+        prof,
+        state[ipv.SURFACE_STORAGE],
+        th_fc_adj,
+        th,
+        Infl,
+        Irr,
+        IrrMngt.AppEff,
+        FieldMngt.bunds,
+        FieldMngt.z_bund,
+        FluxOut,
+        DeepPerc,
+        Runoff,
+        growing_season,
+        work_counters,
+    )
+
+    # 8. Capillary Rise
+    th, CR = capillary_rise(
+        prof,
+        Soil.nLayer,
+        Soil.fshape_cr,
+        state[ipv.Z_GW],
+        th,
+        th_fc_adj,
+        FluxOut,
+        water_table,
+        work_counters,
+    )
+
+    # 9. Check germination
+    (
+        state[ipv.GERMINATION],
+        state[ipv.PROTECTED_SEED],
+        state[ipv.DELAYED_CDS],
+        state[ipv.DELAYED_GDDS],
+    ) = germination(
+        state[ipv.GERMINATION] == 1,
+        state[ipv.PROTECTED_SEED] == 1,
+        state[ipv.DELAYED_CDS],
+        state[ipv.DELAYED_GDDS],
+        th,
+        Soil.z_germ,
+        prof,
+        Crop.GermThr,
+        Crop.PlantMethod,
+        gdd,
+        growing_season,
+    )
+
+    # 10. Update growth stage
+    state[ipv.GROWTH_STAGE] = growth_stage(
+        Crop,
+        dap,
+        state[ipv.DELAYED_CDS],
+        state[ipv.GDD_CUM],
+        state[ipv.DELAYED_GDDS],
+        state[ipv.GROWTH_STAGE],
+        growing_season,
+    )
+
+    # 11. Canopy cover development
+    (
+        state[ipv.CC_PREV],
+        state[ipv.CANOPY_COVER],
+        state[ipv.CANOPY_COVER_NS],
+        state[ipv.CCX_ACT],
+        state[ipv.CCX_ACT_NS],
+        state[ipv.CCX_W],
+        state[ipv.CCX_W_NS],
+        state[ipv.CC0_ADJ],
+        state[ipv.PROTECTED_SEED],
+        state[ipv.CROP_DEAD],
+        state[ipv.PREMAT_SENES],
+        state[ipv.CCX_EARLY_SEN],
+        state[ipv.T_EARLY_SEN],
+        state[ipv.CANOPY_COVER_ADJ],
+        state[ipv.CANOPY_COVER_ADJ_NS],
+    ) = canopy_cover(
+        Crop,
+        prof,
+        Soil.z_top,
+        dap,
+        state[ipv.DELAYED_CDS],
+        state[ipv.GDD_CUM],
+        state[ipv.DELAYED_GDDS],
+        state[ipv.Z_ROOT],
+        th,
+        state[ipv.CANOPY_COVER],
+        state[ipv.CANOPY_COVER_NS],
+        state[ipv.CCX_ACT],
+        state[ipv.CCX_ACT_NS],
+        state[ipv.CCX_W],
+        state[ipv.CCX_W_NS],
+        state[ipv.CC0_ADJ],
+        state[ipv.PROTECTED_SEED] == 1,
+        state[ipv.CROP_DEAD] == 1,
+        state[ipv.PREMAT_SENES] == 1,
+        state[ipv.CCX_EARLY_SEN],
+        state[ipv.T_EARLY_SEN],
+        gdd,
+        et0,
+        growing_season,
+        root_zone_cache,
+    )
+
+    # 12. Soil evaporation
+    (
+        state[ipv.E_POT],
+        th,
+        state[ipv.STAGE2],
+        state[ipv.W_STAGE_2],
+        state[ipv.W_SURF],
+        state[ipv.SURFACE_STORAGE],
+        state[ipv.EVAP_Z],
+        Es,
+        EsPot,
+    ) = soil_evaporation(
+        evap_time_steps,
+        sim_off_season,
+        time_step_counter,
+        prof,
+        Soil.evap_z_min,
+        Soil.evap_z_max,
+        Soil.rew,
+        Soil.kex,
+        Soil.fwcc,
+        Soil.f_wrel_exp,
+        Soil.f_evap,
+        Crop.CalendarType,
+        Crop.Senescence,
+        IrrMngt.irrigation_method,
+        IrrMngt.WetSurf,
+        FieldMngt.mulches,
+        FieldMngt.f_mulch,
+        FieldMngt.mulch_pct,
+        dap,
+        state[ipv.W_SURF],
+        state[ipv.EVAP_Z],
+        state[ipv.STAGE2] == 1,
+        th,
+        state[ipv.DELAYED_CDS],
+        state[ipv.GDD_CUM],
+        state[ipv.DELAYED_GDDS],
+        state[ipv.CCX_W],
+        state[ipv.CANOPY_COVER_ADJ],
+        state[ipv.CCX_ACT],
+        state[ipv.CANOPY_COVER],
+        state[ipv.PREMAT_SENES] == 1,
+        state[ipv.SURFACE_STORAGE],
+        state[ipv.W_STAGE_2],
+        state[ipv.E_POT],
+        et0,
+        Infl,
+        precipitation,
+        Irr,
+        growing_season,
+        work_counters,
+    )
+
+    # 13. Crop transpiration
+    (
+        Tr,
+        TrPot_NS,
+        TrPot,
+        IrrNet,
+        state[ipv.AGE_DAYS],
+        state[ipv.AGE_DAYS_NS],
+        state[ipv.SURFACE_STORAGE],
+        state[ipv.DAY_SUBMERGED],
+        state[ipv.AER_DAYS],
+        aer_days_comp,
+        th,
+        state[ipv.DEPLETION],
+        state[ipv.TAW],
+        state[ipv.IRR_NET_CUM],
+        state[ipv.CANOPY_COVER],
+        state[ipv.TR_RATIO],
+        state[ipv.T_POT],
+    ) = transpiration(
+        prof,
+        Soil.nComp,
+        Soil.z_top,
+        Crop,
+        IrrMngt.irrigation_method,
+        IrrMngt.NetIrrSMT,
+        dap,
+        state[ipv.DELAYED_CDS],
+        state[ipv.AGE_DAYS],
+        state[ipv.AGE_DAYS_NS],
+        state[ipv.CANOPY_COVER],
+        state[ipv.CANOPY_COVER_NS],
+        state[ipv.CANOPY_COVER_ADJ],
+        state[ipv.CANOPY_COVER_ADJ_NS],
+        state[ipv.CCX_W],
+        state[ipv.CCX_W_NS],
+        state[ipv.CC_PREV],
+        state[ipv.SURFACE_STORAGE],
+        state[ipv.DAY_SUBMERGED],
+        state[ipv.AER_DAYS],
+        aer_days_comp,
+        state[ipv.Z_ROOT],
+        th,
+        state[ipv.T_EARLY_SEN],
+        state[ipv.R_COR],
+        state[ipv.IRR_NET_CUM],
+        state[ipv.DEPLETION],
+        state[ipv.TAW],
+        state[ipv.TR_RATIO],
+        et0,
+        co2_conc,
+        co2_ref,
+        growing_season,
+        gdd,
+        root_zone_cache,
+    )
+
+    # 14. Groundwater inflow
+    th, GwIn = groundwater_inflow(
+        prof, state[ipv.WT_IN_SOIL] == 1, state[ipv.Z_GW], th
+    )
+
+    # 15. Reference harvest index
+    (
+        state[ipv.HI_REF],
+        state[ipv.YIELD_FORM],
+        state[ipv.PCT_LAG_PHASE],
+    ) = HIref_current_day(
+        state[ipv.HI_REF],
+        state[ipv.HIFINAL],
+        dap,
+        state[ipv.DELAYED_CDS],
+        state[ipv.YIELD_FORM] == 1,
+        state[ipv.PCT_LAG_PHASE],
+        state[ipv.CANOPY_COVER],
+        state[ipv.CC_PREV],
+        state[ipv.CCX_W],
+        Crop,
+        growing_season,
+    )
+
+    # 16. Biomass accumulation
+    state[ipv.BIOMASS], state[ipv.BIOMASS_NS] = biomass_accumulation(
+        Crop,
+        dap,
+        state[ipv.DELAYED_CDS],
+        state[ipv.HI_REF],
+        state[ipv.PCT_LAG_PHASE],
+        state[ipv.BIOMASS],
+        state[ipv.BIOMASS_NS],
+        Tr,
+        TrPot_NS,
+        et0,
+        growing_season,
+    )
+
+    # 17. Harvest index
+    (
+        state[ipv.PRE_ADJ],
+        state[ipv.F_PRE],
+        state[ipv.F_POL],
+        state[ipv.S_COR1],
+        state[ipv.S_COR2],
+        state[ipv.FPOST_UPP],
+        state[ipv.FPOST_DWN],
+        state[ipv.F_POST],
+        state[ipv.HARVEST_INDEX],
+        state[ipv.HARVEST_INDEX_ADJ],
+    ) = harvest_index(
+        prof,
+        Soil.z_top,
+        Crop,
+        state[ipv.Z_ROOT],
+        th,
+        state[ipv.T_EARLY_SEN],
+        state[ipv.HI_REF],
+        dap,
+        state[ipv.DELAYED_CDS],
+        state[ipv.YIELD_FORM] == 1,
+        state[ipv.PRE_ADJ] == 1,
+        state[ipv.BIOMASS],
+        state[ipv.BIOMASS_NS],
+        state[ipv.CANOPY_COVER],
+        state[ipv.F_PRE],
+        state[ipv.F_POL],
+        state[ipv.S_COR1],
+        state[ipv.S_COR2],
+        state[ipv.FPOST_UPP],
+        state[ipv.FPOST_DWN],
+        state[ipv.F_POST],
+        state[ipv.HARVEST_INDEX],
+        state[ipv.HARVEST_INDEX_ADJ],
+        et0,
+        temp_max,
+        temp_min,
+        growing_season,
+        root_zone_cache,
+    )
+
+    # 18. Yield potential
+    state[ipv.YIELDPOT] = (state[ipv.BIOMASS_NS] / 100) * state[ipv.HARVEST_INDEX]
+
+    # 19. Crop yield_ (dry and fresh)
+    if growing_season == True:
+        # Calculate crop yield_ (tonne/ha)
+        state[ipv.DRYYIELD] = (state[ipv.BIOMASS] / 100) * state[ipv.HARVEST_INDEX_ADJ]
+        if Crop.YldWC == 0:
+            # No yield water content: as a division by zero (inf, or nan without yield)
+            state[ipv.FRESHYIELD] = state[ipv.DRYYIELD] * np.inf
+        else:
+            state[ipv.FRESHYIELD] = state[ipv.DRYYIELD] / (Crop.YldWC / 100)
+        # Check if crop has reached maturity
+        if ((Crop.CalendarType == 1) and (dap >= Crop.Maturity)) or (
+            (Crop.CalendarType == 2) and (state[ipv.GDD_CUM] >= Crop.Maturity)
+        ):
+            # Crop has reached maturity
+            state[ipv.CROP_MATURE] = 1
+    else:
+        # Crop yield_ is zero outside of growing season
+        state[ipv.DRYYIELD] = 0
+        state[ipv.FRESHYIELD] = 0
+
+    # 20. Root zone water
+    Wr, _, Dr_Rz, _, TAW_Rz, _, _, _, _, _, _ = cached_root_zone_water(
+        root_zone_cache,
+        prof,
+        state[ipv.Z_ROOT],
+        th,
+        Soil.z_top,
+        Crop.Zmin,
+        Crop.Aer,
+    )
+    count_root_zone_work(root_zone_cache, work_counters)
+
+    # 21. Update net irrigation to add any pre irrigation
+    IrrNet = IrrNet + PreIrr
+    state[ipv.IRR_NET_CUM] = state[ipv.IRR_NET_CUM] + PreIrr
+
+    # Irrigation
+    if growing_season == True:
+        if IrrMngt.irrigation_method == 4:
+            # Net irrigation
+            IrrDay = IrrNet
+            IrrTot = state[ipv.IRR_NET_CUM]
+        else:
+            # Irrigation
+            IrrDay = Irr
+            IrrTot = state[ipv.IRR_CUM]
+    else:
+        IrrDay = 0.0
+        IrrTot = 0.0
+
+        state[ipv.DEPLETION] = Dr_Rz
+        state[ipv.TAW] = TAW_Rz
+
+    # Update model outputs %%
+
+    # Water contents
+    water_storage[row_day, 0] = time_step_counter
+    water_storage[row_day, 1] = growing_season
+    water_storage[row_day, 2] = dap
+    water_storage[row_day, 3:] = th
+
+    # Water fluxes
+    water_flux[row_day, 0] = time_step_counter
+    water_flux[row_day, 1] = season_counter
+    water_flux[row_day, 2] = dap
+    water_flux[row_day, 3] = Wr
+    water_flux[row_day, 4] = state[ipv.Z_GW]
+    water_flux[row_day, 5] = state[ipv.SURFACE_STORAGE]
+    water_flux[row_day, 6] = IrrDay
+    water_flux[row_day, 7] = Infl
+    water_flux[row_day, 8] = Runoff
+    water_flux[row_day, 9] = DeepPerc
+    water_flux[row_day, 10] = CR
+    water_flux[row_day, 11] = GwIn
+    water_flux[row_day, 12] = Es
+    water_flux[row_day, 13] = EsPot
+    water_flux[row_day, 14] = Tr
+    water_flux[row_day, 15] = TrPot
+
+    # Crop growth
+    crop_growth[row_day, 0] = time_step_counter
+    crop_growth[row_day, 1] = season_counter
+    crop_growth[row_day, 2] = dap
+    crop_growth[row_day, 3] = gdd
+    crop_growth[row_day, 4] = state[ipv.GDD_CUM]
+    crop_growth[row_day, 5] = state[ipv.Z_ROOT]
+    crop_growth[row_day, 6] = state[ipv.CANOPY_COVER]
+    crop_growth[row_day, 7] = state[ipv.CANOPY_COVER_NS]
+    crop_growth[row_day, 8] = state[ipv.BIOMASS]
+    crop_growth[row_day, 9] = state[ipv.BIOMASS_NS]
+    crop_growth[row_day, 10] = state[ipv.HARVEST_INDEX]
+    crop_growth[row_day, 11] = state[ipv.HARVEST_INDEX_ADJ]
+    crop_growth[row_day, 12] = state[ipv.DRYYIELD]
+    crop_growth[row_day, 13] = state[ipv.FRESHYIELD]
+    crop_growth[row_day, 14] = state[ipv.YIELDPOT]
+
+    # Final output (if at end of growing season)
+    season_finished = False
+    if season_counter > -1:
+        if (
+            (state[ipv.CROP_MATURE] == 1)
+            or (state[ipv.CROP_DEAD] == 1)
+            or (harvest_day == time_step_counter + 1)
+        ) and (state[ipv.HARVEST_FLAG] == 0):
+            season_finished = True
+            # Set harvest flag
+            state[ipv.HARVEST_FLAG] = 1
+
+    return th, th_fc_adj, aer_days_comp, IrrTot, season_finished
@@ -55,19 +55,12 @@ def update_time(
             if clock_struct.season_counter < clock_struct.n_seasons - 1:
                 # Update growing season counter
                 clock_struct.season_counter = clock_struct.season_counter + 1
-                # Update time-step counter
-
-                clock_struct.time_step_counter = clock_struct.time_span.get_loc(
-                    clock_struct.planting_dates[clock_struct.season_counter]
-                )
-                # Update start time of time-step
-                clock_struct.step_start_time = clock_struct.time_span[
-                    clock_struct.time_step_counter
-                ]
-                # Update end time of time-step
-                clock_struct.step_end_time = clock_struct.time_span[
-                    clock_struct.time_step_counter + 1
-                ]
+                # Update time-step counter (the start and end times of the
+                # time-step follow from it)
+                planting_day = clock_struct.planting_days[clock_struct.season_counter]
+                if not 0 <= planting_day < clock_struct.n_steps:
+                    raise KeyError(clock_struct.planting_dates[clock_struct.season_counter])
+                clock_struct.time_step_counter = int(planting_day)
                 # Reset initial conditions for start of growing season
                 init_cond, param_struct = reset_initial_conditions(
                     clock_struct, init_cond, param_struct, weather, crop
@@ -76,23 +69,14 @@ def update_time(
         else:
             # Simulation considers off-season, so progress by one time-step
             # (one day)
-            # Time-step counter
+            # Time-step counter (day at the start of the time step)
             clock_struct.time_step_counter = clock_struct.time_step_counter + 1
-            # Start of time step (beginning of current day)
-            # clock_struct.time_span = pd.Series(clock_struct.time_span)
-            clock_struct.step_start_time = clock_struct.time_span[
-                clock_struct.time_step_counter
-            ]
-            # End of time step (beginning of next day)
-            clock_struct.step_end_time = clock_struct.time_span[
-                clock_struct.time_step_counter + 1
-            ]
             # Check if it is not the last growing season
             if clock_struct.season_counter < clock_struct.n_seasons - 1:
                 # Check if upcoming day is the start of a new growing season
                 if (
-                    clock_struct.step_start_time
-                    == clock_struct.planting_dates[clock_struct.season_counter + 1]
+                    clock_struct.time_step_counter
+                    == clock_struct.planting_days[clock_struct.season_counter + 1]
                 ):
                     # Update growing season counter
                     clock_struct.season_counter = clock_struct.season_counter + 1
@@ -27,18 +27,15 @@ def prepare_gdd(weather_df, sim_start, sim_end, gdd, crop, sum_fun):
     sim_start_date=pd.to_datetime(sim_start)
     sim_end_date=pd.to_datetime(sim_end)
 
-    # add gdd as column
     assert len(gdd) == len(weather_df), "The length of 'gdd' does not match the number of rows in 'weather_df', check planting date is on or after simulation start date in first year."
-    weather_df['gdd']=gdd
+    gdd = np.asarray(gdd, dtype=np.float64)
+    dates = weather_df['Date'].to_numpy()
 
     # Convert mm/dd formatted dates to datetime objects
     def parse_mmdd_to_datetime(mmdd_date, year):
         mm, dd = map(int, mmdd_date.split('/'))
         return pd.to_datetime(f'{year}-{mm:02d}-{dd:02d}')
 
-    # Initialize the season counter
-    season_counter = 1
-
     current_year = sim_start_date.year
     planting_date=crop.planting_date
 
@@ -46,80 +43,63 @@ def prepare_gdd(weather_df, sim_start, sim_end, gdd, crop, sum_fun):
     first_planting_date = parse_mmdd_to_datetime(planting_date, current_year)
     if first_planting_date < sim_start_date:
         current_year += 1
-        first_planting_date = parse_mmdd_to_datetime(planting_date, current_year)
-
-    # Loop through each year to assign seasons
-    while first_planting_date <= sim_end_date:
-        # Determine the end date of the season (a day before the next planting date)
-        next_planting_date = parse_mmdd_to_datetime(planting_date, current_year + 1)
-        season_end_date = next_planting_date - pd.Timedelta(days=1)
-
-        # If the season end date is beyond the simulation end date, truncate it
-        if season_end_date > sim_end_date:
-            season_end_date = sim_end_date
-
-        # Update the 'season' column for the current season
-        weather_df.loc[(weather_df['Date'] >= first_planting_date) & (weather_df['Date'] <= season_end_date), 'season'] = season_counter
 
-        # Increment the season counter
-        season_counter += 1
-
-        # Move to the next year
+    # Each season lasts from a planting date to the day before the next one
+    # (or to the simulation end date)
+    planting_dates = []
+    while parse_mmdd_to_datetime(planting_date, current_year) <= sim_end_date:
+        planting_dates.append(parse_mmdd_to_datetime(planting_date, current_year))
         current_year += 1
-        first_planting_date = next_planting_date
+    season_end_dates = [
+        min(next_planting_date - pd.Timedelta(days=1), sim_end_date)
+        for next_planting_date in planting_dates[1:]
+        + [parse_mmdd_to_datetime(planting_date, current_year)]
+    ]
+
+    # first row and number of rows of each season in the weather data
+    season_start = np.searchsorted(dates, pd.DatetimeIndex(planting_dates).values, side='left')
+    season_stop = np.searchsorted(dates, pd.DatetimeIndex(season_end_dates).values, side='right')
+    season_length = season_stop - season_start
+    season_start = season_start[season_length > 0]
+    season_length = season_length[season_length > 0]
 
     # List of growth stages
     growth_stages = [
         'Emergence', 'Canopy10Pct', 'MaxRooting', 'MaxCanopy', 'CanopyDevEnd',
-        'Senescence', 'Maturity', 'HIstart', 'HIend', 'YieldFormation'
+        'Senescence', 'Maturity', 'HIstart', 'HIend'
     ]
     if crop.CropType == 3:
-        growth_stages.extend(['FloweringEnd', 'FloweringDuration'])
-
-    # Create dictionary of lists to store yearly GDD values for each growth stage
-    # i.e. create as many lists as there are elements in 'growth_stages',
-    # named with the values in 'growth_stages' in a dictionary
-    gdd_lists = {f'{stage}': [] for stage in growth_stages}
-
-    # get list of season numbers to iterate across
-    seasons=weather_df['season'].unique()
-
-    # iterate across seasons, calculating GDD to each CD growth stage
-    # per season and storing in the gdd_lists lists
-    for season in seasons:
-        # filter to current season
-        season_data = weather_df[weather_df['season']==season]
-
-        # get cumulative GDD for current season
-        gdd_cum=np.cumsum(season_data['gdd'])
-
-        # Find GDD equivalent for each crop calendar day growth stage
-        gdd_lists['Emergence'].append(gdd_cum.iloc[int(crop.EmergenceCD)])
-        gdd_lists['Canopy10Pct'].append(gdd_cum.iloc[int(crop.Canopy10PctCD)])
-        gdd_lists['MaxRooting'].append(gdd_cum.iloc[int(crop.MaxRootingCD)])
-        gdd_lists['MaxCanopy'].append(gdd_cum.iloc[int(crop.MaxCanopyCD)])
-        gdd_lists['CanopyDevEnd'].append(gdd_cum.iloc[int(crop.CanopyDevEndCD)])
-        gdd_lists['Senescence'].append(gdd_cum.iloc[int(crop.SenescenceCD)])
-        gdd_lists['Maturity'].append(gdd_cum.iloc[int(crop.MaturityCD)])
-        gdd_lists['HIstart'].append(gdd_cum.iloc[int(crop.HIstartCD)])
-        gdd_lists['HIend'].append(gdd_cum.iloc[int(crop.HIendCD)])
-        gdd_lists['YieldFormation'].append(crop.HIend - crop.HIstart)
-
-        # Duration of flowering (gdd's) - (fruit/grain crops only)
-        if crop.CropType == 3:
-            flowering_end=gdd_cum.iloc[int(crop.FloweringEndCD)]
-            # gdd's from sowing to end of flowering
-            gdd_lists['FloweringEnd'].append(flowering_end)
-            # Duration of flowering (gdd's)
-            gdd_lists['FloweringDuration'].append(flowering_end - crop.HIstart)
+        growth_stages.append('FloweringEnd')
+    stage_days = np.array(
+        [int(getattr(crop, f'{stage}CD')) for stage in growth_stages], dtype=np.int64
+    )
+    if np.any(stage_days >= season_length.min()):
+        raise IndexError(
+            "A season of the simulation is shorter than the crop calendar "
+            f"({season_length.min()} days), it cannot be converted to growing degree days."
+        )
+
+    # cumulative GDD of every season, one row per season (padded with zeros),
+    # and GDD equivalent of each crop calendar day growth stage per season
+    days = np.arange(season_length.max())
+    in_season = days < season_length[:, None]
+    rows = np.minimum(season_start[:, None] + days, len(gdd) - 1)
+    gdd_cum = np.cumsum(np.where(in_season, gdd[rows], 0.0), axis=1)
+    gdd_stages = dict(zip(growth_stages, gdd_cum[:, stage_days].T))
+
+    n_seasons = len(season_start)
+    gdd_stages['YieldFormation'] = np.full(n_seasons, crop.HIend - crop.HIstart)
+    # Duration of flowering (gdd's) - (fruit/grain crops only)
+    if crop.CropType == 3:
+        gdd_stages['FloweringDuration'] = gdd_stages['FloweringEnd'] - crop.HIstart
 
-    # calculate mean/median of GDD growth stages using dictionary logic,
+    # calculate mean/median of GDD growth stages across seasons,
     # set the attribute to update the crop object
     if sum_fun == 'mean':
-        for stage, values in gdd_lists.items():
+        for stage, values in gdd_stages.items():
             setattr(crop, stage, np.mean(values))
     elif sum_fun == 'median':
-        for stage, values in gdd_lists.items():
+        for stage, values in gdd_stages.items():
             setattr(crop, stage, np.median(values))
 
-    return crop
\ No newline at end of file
+    return crop
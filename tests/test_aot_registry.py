@@ -0,0 +1,67 @@
+import os
+os.environ['DEVELOPMENT'] = 'True'
+import contextlib
+import io
+import unittest
+from unittest import mock
+
+from aquacrop.solution import backend
+from aquacrop.scripts.aot_registry import (
+    environment_key,
+    is_up_to_date,
+    source_hash,
+    source_modules,
+)
+
+
+class TestAOTRegistry(unittest.TestCase):
+    """
+    Compiled modules are only used if they match the environment and sources
+    """
+
+    _module = "aquacrop.solution.canopy_cover"
+
+    def test_source_modules(self):
+        """
+        The sources of a module include the aquacrop modules it imports
+        """
+        sources = source_modules(self._module)
+        self.assertIn(self._module, sources)
+        self.assertIn("aquacrop.solution.water_stress", sources)
+        self.assertIn("aquacrop.entities.soilProfile", sources)
+        self.assertNotIn("numpy", sources)
+
+    def test_outdated_entries(self):
+        """
+        Entries of another environment or sources are not up to date
+        """
+        sources = source_modules(self._module)
+        entry = {
+            "environment": environment_key(),
+            "sources": sources,
+            "source_hash": source_hash(sources),
+        }
+        self.assertFalse(is_up_to_date(self._module, {}))
+        self.assertFalse(
+            is_up_to_date(self._module, {self._module: dict(entry, environment="python-2.7")})
+        )
+        self.assertFalse(
+            is_up_to_date(self._module, {self._module: dict(entry, source_hash="0")})
+        )
+
+    def test_fallback_message(self):
+        """
+        Without the compiled modules, the python backend is used and the
+        aquacrop-compile command is printed
+        """
+        stderr = io.StringIO()
+        with mock.patch.dict(os.environ), mock.patch(
+            "aquacrop.scripts.aot_registry.aot_is_available", return_value=False
+        ), contextlib.redirect_stderr(stderr):
+            os.environ.pop("DEVELOPMENT")
+            self.assertEqual(backend._resolve_backend(None), "python")
+        self.assertIn("aquacrop-compile", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import os
+os.environ['DEVELOPMENT'] = 'True'
+import unittest
+import subprocess
+import sys
+
+from aquacrop.scripts.aot_registry import aot_is_available
+
+
+# Simulation run in a new interpreter for each backend (timed after the
+# solution functions are loaded)
+SIMULATION = """
+import time
+from aquacrop import AquaCropModel, Soil, Crop, InitialWaterContent
+from aquacrop.utils import prepare_weather, get_filepath
+from aquacrop.solution.backend import get_backend
+import aquacrop.timestep.run_single_timestep
+
+start = time.perf_counter()
+model_os = AquaCropModel(
+    sim_start_time="1979/10/01",
+    sim_end_time="1985/05/30",
+    weather_df=prepare_weather(get_filepath("tunis_climate.txt")),
+    soil=Soil(soil_type="SandyLoam"),
+    crop=Crop("Wheat", planting_date="10/01"),
+    initial_water_content=InitialWaterContent(value=["FC"]),
+)
+model_os.run_model(till_termination=True)
+assert get_backend() == "{backend}"
+print(time.perf_counter() - start)
+print(model_os.get_simulation_results()["Dry yield (tonne/ha)"].round(4).tolist())
+"""
+
+
+class TestBackendSpeed(unittest.TestCase):
+    """
+    Speed tests of the python, aot and jit backends
+    """
+
+    def _run(self, backend):
+        """
+        Time of a simulation with the backend, in a new interpreter, and its yields
+        """
+        env = dict(os.environ, AQUACROP_BACKEND=backend)
+        result = subprocess.run(
+            [sys.executable, "-c", SIMULATION.format(backend=backend)],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        execution_time, yields = result.stdout.strip().splitlines()[-2:]
+        return float(execution_time), yields
+
+    def test_backends(self):
+        """
+        Speed test of each backend (the jit backend is timed after its cache is built)
+        """
+        backends = ["python", "jit"]
+        if aot_is_available():
+            backends.append("aot")
+
+        self._run("jit")
+        timings = {}
+        yields = {}
+        for backend in backends:
+            timings[backend], yields[backend] = self._run(backend)
+            print(f"{backend} backend execution time is = ", timings[backend])
+
+        # The timings are only reported (see aquacrop.scripts.benchmark to compare them
+        # with a baseline)
+        for backend in backends:
+            self.assertEqual(yields[backend], yields["python"])
+
+    def test_backend_resolved_on_first_use(self):
+        """
+        Importing aquacrop does not resolve the backend (nor load the solution functions)
+        """
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import aquacrop, aquacrop.timestep.run_single_timestep\n"
+                "from aquacrop.solution import backend\n"
+                "print(backend._backend)",
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(result.stdout.strip().splitlines()[-1], "None")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import os
+os.environ['DEVELOPMENT'] = 'True'
+import unittest
+
+from aquacrop.scripts.benchmark import BENCHMARKS, compare, run_benchmarks
+
+
+class TestBenchmark(unittest.TestCase):
+    """
+    Tests of the benchmark suite
+    """
+
+    _baseline = {
+        "python": {"initialize": 0.10, "multi_season": 20.0},
+        "jit": {"initialize": 0.10},
+    }
+
+    def test_regressions(self):
+        """
+        Only the benchmarks slower than the baseline by more than the threshold
+        are regressions
+        """
+        results = {
+            "python": {"initialize": 0.13, "multi_season": 21.0, "outputs": 1.0},
+            "jit": {"initialize": 0.11},
+            "aot": {"initialize": 1.0},
+        }
+        regressions = compare(results, self._baseline, threshold=0.2)
+
+        self.assertEqual(regressions, [("python", "initialize", 0.10, 0.13)])
+        self.assertEqual(compare(results, self._baseline, threshold=0.5), [])
+
+    def test_run_benchmarks(self):
+        """
+        Benchmarks return a time in seconds
+        """
+        self.assertIn("multi_season", BENCHMARKS)
+        results = run_benchmarks(["initialize", "step_per_day"], repeat=1)
+
+        self.assertEqual(list(results), ["initialize", "step_per_day"])
+        self.assertTrue(all(seconds > 0 for seconds in results.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
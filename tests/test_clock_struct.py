@@ -0,0 +1,76 @@
+import os
+os.environ['DEVELOPMENT'] = 'True'
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from aquacrop import AquaCropModel, Soil, Crop, InitialWaterContent
+from aquacrop.utils import prepare_weather, get_filepath
+
+
+class TestClockStruct(unittest.TestCase):
+    """
+    The clock runs on days since the simulation start, dates are only used at the edges
+    """
+
+    _weather_data = prepare_weather(get_filepath("tunis_climate.txt"))
+
+    def _model(self):
+        return AquaCropModel(
+            sim_start_time=f"{1979}/09/01",
+            sim_end_time=f"{1982}/05/30",
+            weather_df=self._weather_data,
+            soil=Soil(soil_type="SandyLoam"),
+            crop=Crop("Wheat", planting_date="10/01"),
+            initial_water_content=InitialWaterContent(value=["FC"]),
+        )
+
+    def test_season_days(self):
+        """
+        The planting and harvest days are the days of the planting and harvest dates
+        """
+        model_os = self._model()
+        model_os._initialize()
+        clock_struct = model_os._clock_struct
+
+        self.assertEqual(clock_struct.planting_days.dtype, np.int64)
+        self.assertEqual(list(clock_struct.planting_days), [30, 396, 761])
+        for day, date in zip(clock_struct.harvest_days, clock_struct.harvest_dates):
+            self.assertEqual(clock_struct.date(day), date)
+            self.assertEqual(clock_struct.day(date), day)
+        self.assertEqual(clock_struct.simulation_end_day, len(clock_struct.time_span) - 1)
+
+    def test_step_times(self):
+        """
+        The dates of the time step follow the time step counter
+        """
+        model_os = self._model()
+        model_os.run_model(num_steps=40)
+        clock_struct = model_os._clock_struct
+
+        self.assertEqual(clock_struct.time_step_counter, 40)
+        self.assertEqual(clock_struct.step_start_time, pd.Timestamp("1979/10/11"))
+        self.assertEqual(clock_struct.step_end_time, pd.Timestamp("1979/10/12"))
+        self.assertEqual(clock_struct.season_counter, 0)
+
+    def test_harvest_date(self):
+        """
+        The harvest dates of the final stats are dates
+        """
+        model_os = self._model()
+        model_os.run_model(till_termination=True)
+        final_stats = model_os.get_simulation_results()
+
+        self.assertEqual(len(final_stats), 3)
+        self.assertTrue(
+            pd.api.types.is_datetime64_any_dtype(final_stats["Harvest Date (YYYY/MM/DD)"])
+        )
+        self.assertEqual(
+            list(final_stats["Harvest Date (Step)"]),
+            [model_os._clock_struct.day(date) - 1 for date in final_stats["Harvest Date (YYYY/MM/DD)"]],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
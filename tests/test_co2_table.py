@@ -0,0 +1,60 @@
+import os
+os.environ['DEVELOPMENT'] = 'True'
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from aquacrop import Crop, CO2
+from aquacrop.entities.co2 import CO2Table, co2_table, crop_co2_adjustment
+
+
+class TestCO2Table(unittest.TestCase):
+    """
+    CO2 concentration and crop adjustments of each year
+    """
+
+    _wheat = Crop("Wheat", planting_date="10/01")
+
+    def test_default_data(self):
+        """
+        The default data is read once, and its table is shared
+        """
+        self.assertIs(CO2().co2_data, CO2().co2_data)
+        self.assertIs(co2_table(CO2()), co2_table(CO2()))
+        self.assertIsNot(co2_table(CO2()), co2_table(CO2(ref_concentration=320.0)))
+
+    def test_crop_co2_adjustment(self):
+        """
+        The adjustments of many concentrations are those of each concentration
+        """
+        CO2conc = np.array([300.0, 369.41, 400.0, 550.0, 700.0, 2000.0, 2500.0])
+        crop = Crop("Wheat", planting_date="10/01")
+        for WP in [15.0, 30.0, 45.0]:
+            crop.WP = WP
+            fCO2 = crop_co2_adjustment(CO2conc, 369.41, crop)
+            self.assertEqual(
+                fCO2.tolist(), [crop_co2_adjustment(conc, 369.41, crop) for conc in CO2conc]
+            )
+        self.assertEqual(crop_co2_adjustment(369.41, 369.41, self._wheat), 1.0)
+
+    def test_co2_table(self):
+        """
+        The concentrations are interpolated for each year (the first and last
+        ones are kept before and after the data)
+        """
+        table = CO2Table(np.array([1980, 1990]), np.array([340.0, 360.0]), 369.41)
+        self.assertEqual(table.concentration(1985), 350.0)
+        self.assertEqual(table.concentration(1970), 340.0)
+        self.assertEqual(table.concentration(2000), 360.0)
+        self.assertEqual(
+            table.crop_adjustment(self._wheat, 1985),
+            crop_co2_adjustment(350.0, 369.41, self._wheat),
+        )
+
+        co2 = CO2(co2_data=pd.DataFrame({"year": [1980, 1990], "ppm": [340.0, 360.0]}))
+        np.testing.assert_array_equal(co2_table(co2).ppm, table.ppm)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,223 @@
+import os
+os.environ['DEVELOPMENT'] = 'True'
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from aquacrop import AquaCropModel, Soil, Crop, InitialWaterContent, IrrigationManagement
+from aquacrop.utils import prepare_weather, get_filepath
+
+
+class TestCompiledSimulation(unittest.TestCase):
+    """
+    The compiled simulation loop must give the same results as the python loop:
+    the same with the aot and jit backends, and the same up to round-off with
+    the python backend
+    """
+
+    _weather_file_path = get_filepath("tunis_climate.txt")
+
+    _weather_data = prepare_weather(_weather_file_path)
+
+    def _run_model(self, compiled, **kwargs):
+        model = AquaCropModel(
+            sim_start_time=f"{1979}/08/01",
+            sim_end_time=f"{1983}/05/30",
+            weather_df=self._weather_data,
+            soil=Soil(soil_type="SandyLoam"),
+            crop=Crop("Wheat", planting_date="10/01"),
+            initial_water_content=InitialWaterContent(value=["FC"]),
+            **kwargs,
+        )
+        model.run_model(till_termination=True, compiled=compiled)
+        return model
+
+    def _assert_same_outputs(self, model_py, model_compiled, exact=False):
+        for getter in ["get_water_flux", "get_water_storage", "get_crop_growth"]:
+            pd.testing.assert_frame_equal(
+                getattr(model_py, getter)(),
+                getattr(model_compiled, getter)(),
+                check_exact=exact,
+                rtol=1e-9,
+            )
+
+        pd.testing.assert_frame_equal(
+            model_py.get_simulation_results(),
+            model_compiled.get_simulation_results(),
+            check_dtype=False,
+            check_exact=exact,
+        )
+
+        np.testing.assert_allclose(model_py._init_cond.th, model_compiled._init_cond.th)
+        self.assertEqual(
+            model_py._clock_struct.time_step_counter,
+            model_compiled._clock_struct.time_step_counter,
+        )
+
+    def test_rainfed(self):
+        """
+        Rainfed simulation over several seasons, starting before the first season
+        """
+        self._assert_same_outputs(self._run_model(False), self._run_model(True))
+
+    def test_net_irrigation(self):
+        """
+        Net irrigation mode (pre-irrigation on the first day of every season)
+        """
+        irrigation_management = IrrigationManagement(irrigation_method=4, NetIrrSMT=70)
+        self._assert_same_outputs(
+            self._run_model(False, irrigation_management=irrigation_management),
+            self._run_model(True, irrigation_management=irrigation_management),
+        )
+
+    def test_pre_irrigation(self):
+        """
+        The pre-irrigation of the first season also raises the initial water
+        content of the next seasons
+        """
+        for compiled in [False, True]:
+            model = AquaCropModel(
+                sim_start_time=f"{1979}/10/01",
+                sim_end_time=f"{1985}/05/30",
+                weather_df=self._weather_data,
+                soil=Soil(soil_type="SandyLoam"),
+                crop=Crop("Maize", planting_date="05/01"),
+                initial_water_content=InitialWaterContent(value=["WP"]),
+                irrigation_management=IrrigationManagement(irrigation_method=4, NetIrrSMT=70),
+            )
+            model.run_model(till_termination=True, compiled=compiled)
+            np.testing.assert_allclose(
+                model.get_simulation_results()["Seasonal irrigation (mm)"],
+                [628.0, 636.2, 651.0, 670.4, 657.5],
+                atol=0.05,
+            )
+
+    def test_gdd_crop(self):
+        """
+        Crop in growing degree days without a yield water content (inf fresh yield)
+        """
+        models = []
+        for compiled in [False, True]:
+            model = AquaCropModel(
+                sim_start_time=f"{1982}/05/01",
+                sim_end_time=f"{1985}/10/30",
+                weather_df=prepare_weather(get_filepath("champion_climate.txt")),
+                soil=Soil(soil_type="SandyLoam"),
+                crop=Crop("MaizeChampionGDD", planting_date="05/01"),
+                initial_water_content=InitialWaterContent(value=["FC"]),
+            )
+            model.run_model(till_termination=True, compiled=compiled)
+            models.append(model)
+
+        self._assert_same_outputs(*models)
+        self.assertTrue(
+            np.isinf(models[1].get_simulation_results()["Fresh yield (tonne/ha)"]).all()
+        )
+
+    def _assert_same_as_jit_backend(self, **kwargs):
+        """
+        Runs the python loop with the jit backend and the compiled loop
+        """
+        models = []
+        for compiled in [False, True]:
+            model = AquaCropModel(
+                initial_water_content=InitialWaterContent(value=["FC"]), **kwargs
+            )
+            with mock.patch("aquacrop.solution.backend._backend", "jit"):
+                model.run_model(till_termination=True, compiled=compiled)
+            models.append(model)
+
+        self._assert_same_outputs(*models, exact=True)
+
+    def test_same_as_jit_backend_gdd_irrigation(self):
+        """
+        Crop in growing degree days on a clay soil irrigated at a soil moisture
+        threshold (the python backend rounds the soil evaporation differently)
+        """
+        self._assert_same_as_jit_backend(
+            sim_start_time=f"{1982}/05/01",
+            sim_end_time=f"{1985}/10/30",
+            weather_df=prepare_weather(get_filepath("champion_climate.txt")),
+            soil=Soil(soil_type="Clay"),
+            crop=Crop("MaizeChampionGDD", planting_date="05/01"),
+            irrigation_management=IrrigationManagement(irrigation_method=1, SMT=[40] * 4),
+        )
+
+    def test_same_as_jit_backend_switch_gdd(self):
+        """
+        Crop in calendar days switched to growing degree days on a clay soil
+        """
+        self._assert_same_as_jit_backend(
+            sim_start_time=f"{1979}/10/01",
+            sim_end_time=f"{1982}/05/30",
+            weather_df=self._weather_data,
+            soil=Soil(soil_type="Clay"),
+            crop=Crop("Wheat", planting_date="10/01", SwitchGDD=1),
+        )
+
+    def test_run_batch(self):
+        """
+        A batch of fields gives the same results as running each field on its own
+        """
+        def make_models():
+            return [
+                AquaCropModel(
+                    sim_start_time=f"{1979}/08/01",
+                    sim_end_time=f"{1983}/05/30",
+                    weather_df=self._weather_data,
+                    soil=Soil(soil_type=soil_type),
+                    crop=Crop("Wheat", planting_date="10/01"),
+                    initial_water_content=InitialWaterContent(value=["FC"]),
+                    irrigation_management=IrrigationManagement(
+                        irrigation_method=1, SMT=[smt] * 4
+                    ),
+                )
+                for soil_type in ["SandyLoam", "Loam"]
+                for smt in [30, 70]
+            ]
+
+        batch_models = make_models()
+        AquaCropModel.run_batch(batch_models)
+
+        for model_batch, model in zip(batch_models, make_models()):
+            model.run_model(till_termination=True, compiled=True)
+            self._assert_same_outputs(model, model_batch)
+
+    def test_run_batch_requires_same_weather(self):
+        """
+        All the fields of a batch share one weather series
+        """
+        models = [
+            AquaCropModel(
+                sim_start_time=f"{1979}/08/01",
+                sim_end_time=f"{1980}/05/30",
+                weather_df=weather_df,
+                soil=Soil(soil_type="SandyLoam"),
+                crop=Crop("Wheat", planting_date="10/01"),
+                initial_water_content=InitialWaterContent(value=["FC"]),
+            )
+            for weather_df in [self._weather_data, self._weather_data.assign(Precipitation=0.0)]
+        ]
+        with self.assertRaises(ValueError):
+            AquaCropModel.run_batch(models)
+
+    def test_compiled_requires_till_termination(self):
+        """
+        The compiled loop always runs the simulation to completion
+        """
+        model = AquaCropModel(
+            sim_start_time=f"{1979}/08/01",
+            sim_end_time=f"{1980}/05/30",
+            weather_df=self._weather_data,
+            soil=Soil(soil_type="SandyLoam"),
+            crop=Crop("Wheat", planting_date="10/01"),
+            initial_water_content=InitialWaterContent(value=["FC"]),
+        )
+        with self.assertRaises(ValueError):
+            model.run_model(num_steps=10, compiled=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import os
+os.environ['DEVELOPMENT'] = 'True'
+import unittest
+
+from aquacrop import AquaCropModel, Soil, Crop, InitialWaterContent
+from aquacrop.entities.crop import crop_struct_to_named_tuple
+from aquacrop.utils import prepare_weather, get_filepath
+
+
+class TestCropStructCache(unittest.TestCase):
+    """
+    The CropStructNT of each season is built once and follows the crop paramaters
+    """
+
+    _weather_file_path = get_filepath("tunis_climate.txt")
+
+    _weather_data = prepare_weather(_weather_file_path)
+
+    def test_cache_follows_season_reset(self):
+        """
+        The cached crop of every simulated season matches its CropStruct
+        (updated with the CO2 concentration of the season)
+        """
+        model = AquaCropModel(
+            sim_start_time=f"{1979}/08/01",
+            sim_end_time=f"{1982}/05/30",
+            weather_df=self._weather_data,
+            soil=Soil(soil_type="SandyLoam"),
+            crop=Crop("Wheat", planting_date="10/01"),
+            initial_water_content=InitialWaterContent(value=["FC"]),
+        )
+        model.run_model(num_steps=100)
+        param_struct = model._param_struct
+        first_season_crop = param_struct.Seasonal_Crop_NT_List[0]
+        self.assertIsNotNone(first_season_crop)
+
+        model.run_model(num_steps=100, initialize_model=False)
+        self.assertIs(param_struct.Seasonal_Crop_NT_List[0], first_season_crop)
+
+        model.run_model(till_termination=True, initialize_model=False)
+        for season in range(model._clock_struct.n_seasons):
+            self.assertEqual(
+                param_struct.Seasonal_Crop_NT_List[season],
+                crop_struct_to_named_tuple(param_struct.Seasonal_Crop_List[season]),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
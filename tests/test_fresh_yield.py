@@ -0,0 +1,51 @@
+import os
+os.environ['DEVELOPMENT'] = 'True'
+import unittest
+
+import numpy as np
+
+from aquacrop import AquaCropModel, Soil, Crop, InitialWaterContent
+from aquacrop.utils import prepare_weather, get_filepath
+
+
+class TestFreshYield(unittest.TestCase):
+    """
+    Crops without a yield water content (YldWC of 0)
+    """
+
+    _weather_data = prepare_weather(get_filepath("champion_climate.txt"))
+
+    def _final_stats(self, crop_name):
+        model_os = AquaCropModel(
+            sim_start_time=f"{1982}/05/01",
+            sim_end_time=f"{1985}/10/30",
+            weather_df=self._weather_data,
+            soil=Soil(soil_type="SandyLoam"),
+            crop=Crop(crop_name, planting_date="05/01"),
+            initial_water_content=InitialWaterContent(value=["FC"]),
+        )
+        model_os.run_model(till_termination=True)
+        return model_os.get_simulation_results()
+
+    def test_gdd_crop(self):
+        """
+        The fresh yield is infinite, the other results are computed
+        """
+        final_stats = self._final_stats("MaizeChampionGDD")
+        self.assertTrue(np.isinf(final_stats["Fresh yield (tonne/ha)"]).all())
+        self.assertEqual(
+            final_stats["Harvest Date (Step)"].tolist(), [170, 474, 816, 1237]
+        )
+        self.assertAlmostEqual(final_stats["Dry yield (tonne/ha)"][0], 5.034375983784964)
+
+    def test_no_yield(self):
+        """
+        The fresh yield is not a number without dry yield
+        """
+        final_stats = self._final_stats("Cassava")
+        self.assertTrue(np.isnan(final_stats["Fresh yield (tonne/ha)"]).all())
+        self.assertTrue((final_stats["Dry yield (tonne/ha)"] == 0).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
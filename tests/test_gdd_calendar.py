@@ -0,0 +1,147 @@
+import os
+os.environ['DEVELOPMENT'] = 'True'
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from aquacrop import AquaCropModel, Soil, Crop, InitialWaterContent
+from aquacrop.utils import prepare_weather, get_filepath
+from aquacrop.utils.prepare_gdd import prepare_gdd
+from aquacrop.initialize.compute_crop_calendar import gdd_to_calendar_days
+from aquacrop.entities.gddTable import GDDTable
+from aquacrop.solution.growing_degree_day import growing_degree_days
+
+
+class TestGDDCalendar(unittest.TestCase):
+    """
+    Conversion between calendar days and growing degree days
+    """
+
+    _weather_data = prepare_weather(get_filepath("champion_climate.txt"))
+
+    def test_gdd_to_calendar_days(self):
+        """
+        First day on which the cumulative gdd's exceed each stage (1 if not reached)
+        """
+        gdd_cum = np.cumsum([5.0, 0.0, 5.0, 10.0])
+        np.testing.assert_array_equal(
+            gdd_to_calendar_days(gdd_cum, [0.0, 5.0, 9.0, 10.0, 20.0]), [1, 3, 3, 4, 1]
+        )
+
+    def test_prepare_gdd(self):
+        """
+        The gdd stages are the mean of the gdd's to the calendar stages of each season
+        """
+        weather_df = self._weather_data[
+            (self._weather_data.Date >= "1982/05/01") & (self._weather_data.Date <= "1990/10/30")
+        ]
+        gdd = np.random.default_rng(0).uniform(0, 20, len(weather_df))
+        crop = Crop("Maize", planting_date="05/01")
+        crop.Canopy10PctCD = crop.MaxCanopyCD = crop.CanopyDevEndCD = 60
+        crop.HIendCD = crop.FloweringEndCD = 100
+        crop.HIstart, crop.HIend = 800.0, 1200.0
+
+        crop = prepare_gdd(weather_df, "1982/05/01", "1990/10/30", gdd, crop, "mean")
+
+        maturity = []
+        for year in range(1982, 1991):
+            in_season = (weather_df.Date >= pd.Timestamp(f"{year}/05/01")) & (
+                weather_df.Date < pd.Timestamp(f"{year + 1}/05/01")
+            )
+            maturity.append(np.cumsum(gdd[in_season.to_numpy()])[int(crop.MaturityCD)])
+        self.assertAlmostEqual(crop.Maturity, np.mean(maturity))
+
+    def test_growing_degree_days(self):
+        """
+        The gdd's of each day with the three gdd methods
+        """
+        temp_max = np.array([-5.0, 4.0, 12.0, 25.0, 33.0, 40.0])
+        temp_min = np.array([-10.0, -2.0, 5.0, 9.0, 20.0, 36.0])
+        expected = {
+            1: [0.0, 0.0, 0.5, 9.0, 18.5, 22.0],
+            2: [0.0, 0.0, 2.0, 9.0, 17.0, 22.0],
+            3: [0.0, 0.0, 0.5, 9.0, 17.0, 22.0],
+        }
+        for gdd_method in [1, 2, 3]:
+            np.testing.assert_array_equal(
+                growing_degree_days(gdd_method, 30.0, 8.0, temp_max, temp_min),
+                expected[gdd_method],
+            )
+
+    def test_seasons_gdd(self):
+        """
+        The gdd's of each day are those of the crop of its season
+        """
+        temp = np.linspace(0.0, 40.0, 10)
+        gdd_table = GDDTable(temp, temp)
+        maize = Crop("Maize", planting_date="05/01")
+        wheat = Crop("Wheat", planting_date="10/01")
+
+        self.assertIs(gdd_table.seasons_gdd([maize, maize], [2, 6]), gdd_table.get(maize)[0])
+        gdd = gdd_table.seasons_gdd([maize, wheat, maize], [2, 4, 7])
+        np.testing.assert_array_equal(gdd[:4], gdd_table.get(maize)[0][:4])
+        np.testing.assert_array_equal(gdd[4:7], gdd_table.get(wheat)[0][4:7])
+        np.testing.assert_array_equal(gdd[7:], gdd_table.get(maize)[0][7:])
+
+    def test_season_cumulative_gdd(self):
+        """
+        The cumulative gdd's of a season are summed from its start, until the last stage is exceeded
+        """
+        crop = Crop("Maize", planting_date="05/01")
+        temp = np.array([10.0, 20.0, 12.0, 5.0, 5.0, 30.0, 25.0, 20.0, 18.0, 15.0])
+        gdd_table = GDDTable(temp, temp)
+        gdd = gdd_table.get(crop)[0]
+
+        gdd_cum = gdd_table.season_cumulative_gdd(crop, 2, 22.0)
+        np.testing.assert_array_equal(gdd_cum, np.cumsum(gdd[2:])[: len(gdd_cum)])
+        self.assertGreater(gdd_cum[-1], 23.0)
+        self.assertLessEqual(gdd_cum[-2], 23.0)
+
+        # Stage equal to a cumulative gdd, followed by days without gdd's
+        np.testing.assert_array_equal(gdd[2:5], [4.0, 0.0, 0.0])
+        gdd_cum = gdd_table.season_cumulative_gdd(crop, 2, 4.0)
+        self.assertEqual(len(gdd_cum), 4)
+        self.assertEqual(gdd_to_calendar_days(gdd_cum, [4.0])[0], 4)
+
+        # Not reached: until the end of the simulation
+        np.testing.assert_array_equal(
+            gdd_table.season_cumulative_gdd(crop, 2, 1000.0), np.cumsum(gdd[2:])
+        )
+
+    def test_gdd_model(self):
+        """
+        Calendar of a crop switched to growing degree days over many seasons
+        """
+        model_os = AquaCropModel(
+            sim_start_time=f"{1982}/05/01",
+            sim_end_time=f"{2018}/10/30",
+            weather_df=self._weather_data,
+            soil=Soil(soil_type="SandyLoam"),
+            crop=Crop("Maize", planting_date="05/01", SwitchGDD=1),
+            initial_water_content=InitialWaterContent(value=["FC"]),
+        )
+        model_os._initialize()
+        crop = model_os._param_struct.CropList[0]
+
+        self.assertEqual(crop.CalendarType, 2)
+        self.assertLess(crop.Emergence, crop.MaxCanopy)
+        self.assertLess(crop.MaxCanopy, crop.Maturity)
+
+    def test_short_season(self):
+        """
+        A season shorter than the calendar cannot be converted
+        """
+        with self.assertRaises(IndexError):
+            AquaCropModel(
+                sim_start_time=f"{1982}/05/01",
+                sim_end_time=f"{1983}/10/30",
+                weather_df=self._weather_data,
+                soil=Soil(soil_type="SandyLoam"),
+                crop=Crop("Wheat", planting_date="05/01", SwitchGDD=1),
+                initial_water_content=InitialWaterContent(value=["FC"]),
+            )._initialize()
+
+
+if __name__ == '__main__':
+    unittest.main()
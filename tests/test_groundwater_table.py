@@ -5,9 +5,11 @@ import os
 os.environ['DEVELOPMENT'] = 'True'
 import unittest
 
+import numpy as np
 
 from aquacrop import AquaCropModel, Soil, Crop, InitialWaterContent, GroundWater
 from aquacrop.utils import prepare_weather, get_filepath
+from aquacrop.initialize.read_groundwater_table import daily_groundwater_depths
 
 
 
@@ -52,5 +54,41 @@ class TestModelExceptions(unittest.TestCase):
         self.assertEqual(yield_expected, yield_returned)
 
 
+class TestDailyGroundwaterDepths(unittest.TestCase):
+    """
+    Daily water table depths built from observations
+    """
+
+    def test_constant(self):
+        """
+        Each depth is kept until the next observation, the first one before it
+        """
+        z_gw = daily_groundwater_depths(np.arange(8), [2, 5], [2.0, 3.0], "Constant")
+        np.testing.assert_array_equal(z_gw, [2.0, 2.0, 2.0, 2.0, 2.0, 3.0, 3.0, 3.0])
+
+    def test_variable(self):
+        """
+        Depths are interpolated between observations and kept after the last one
+        """
+        z_gw = daily_groundwater_depths(np.arange(7), [1, 3, 5], [2.0, 3.0, 2.0], "Variable")
+        np.testing.assert_array_equal(z_gw, [np.nan, 2.0, 2.5, 3.0, 2.5, 2.0, 2.0])
+
+    def test_constant_unsorted(self):
+        """
+        Each observation sets the depth from its day on, in the given order
+        """
+        z_gw = daily_groundwater_depths(
+            np.arange(8), [2, 5, 1, 5], [3.0, 2.0, 1.0, 4.0], "Constant"
+        )
+        np.testing.assert_array_equal(z_gw, [3.0, 1.0, 1.0, 1.0, 1.0, 4.0, 4.0, 4.0])
+
+    def test_unknown_method(self):
+        """
+        Unknown methods are not accepted
+        """
+        with self.assertRaises(ValueError):
+            daily_groundwater_depths(np.arange(3), [0, 2], [1.0, 2.0], "Linear")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,58 @@
+import os
+os.environ['DEVELOPMENT'] = 'True'
+import unittest
+import subprocess
+import sys
+import time
+
+
+class TestImportSpeed(unittest.TestCase):
+    """
+    Speed tests of `import aquacrop`
+    """
+
+    def _import_time(self, statement, repeat=5):
+        """
+        Median time of running the statement in a new interpreter
+        """
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, "-c", statement], check=True)
+            timings.append(time.perf_counter() - start)
+        return sorted(timings)[len(timings) // 2]
+
+    def test_import_time(self):
+        """
+        Speed test of `import aquacrop`, which does not import the model
+        """
+        interpreter_time = self._import_time("pass")
+        import_time = self._import_time("import aquacrop")
+        model_import_time = self._import_time("from aquacrop import AquaCropModel")
+        print("Interpreter start time is = ", interpreter_time)
+        print("import aquacrop time is = ", import_time)
+        print("from aquacrop import AquaCropModel time is = ", model_import_time)
+
+    def test_lazy_names(self):
+        """
+        The top-level names are only imported on first access
+        """
+        statement = (
+            "import sys, aquacrop; "
+            "assert 'aquacrop.core' not in sys.modules; "
+            "assert 'numba' not in sys.modules; "
+            "assert 'pandas' not in sys.modules; "
+            "from aquacrop import AquaCropModel; "
+            "assert aquacrop.AquaCropModel is sys.modules['aquacrop.core'].AquaCropModel"
+        )
+        subprocess.run([sys.executable, "-c", statement], check=True)
+
+        import aquacrop
+
+        self.assertIn("AquaCropModel", dir(aquacrop))
+        with self.assertRaises(AttributeError):
+            aquacrop.NotAName
+
+
+if __name__ == "__main__":
+    unittest.main()
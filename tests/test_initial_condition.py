@@ -0,0 +1,79 @@
+import os
+os.environ['DEVELOPMENT'] = 'True'
+import copy
+import pickle
+import unittest
+
+import numpy as np
+
+from aquacrop.entities import initParamVariables as ipv
+from aquacrop.entities.initParamVariables import InitialCondition
+
+
+class TestInitialCondition(unittest.TestCase):
+    """
+    InitialCondition stores its whole state in one float64 buffer
+    """
+
+    def test_named_accessors(self):
+        """
+        Fields are read and written by name in the buffer, with their type
+        """
+        init_cond = InitialCondition(4)
+        self.assertEqual(len(init_cond.buffer), ipv.state_size(4))
+
+        init_cond.dap = 12
+        init_cond.crop_mature = True
+        init_cond.canopy_cover = 0.25
+        init_cond.th = [0.1, 0.2, 0.3, 0.4]
+
+        self.assertEqual(init_cond.buffer[ipv.DAP], 12)
+        self.assertIsInstance(init_cond.dap, int)
+        self.assertIs(init_cond.crop_mature, True)
+        self.assertEqual(init_cond.canopy_cover, 0.25)
+        th_start = ipv.N_SCALARS + ipv.TH_ARRAY * 4
+        np.testing.assert_array_equal(init_cond.buffer[th_start:th_start + 4], [0.1, 0.2, 0.3, 0.4])
+        self.assertTrue(np.shares_memory(init_cond.th, init_cond.buffer))
+
+    def test_no_water_table(self):
+        """
+        The water table fields can be None
+        """
+        init_cond = InitialCondition(4)
+        init_cond.z_gw = None
+        init_cond.wt_in_soil = None
+
+        self.assertIsNone(init_cond.z_gw)
+        self.assertIsNone(init_cond.wt_in_soil)
+
+    def test_copy(self):
+        """
+        Copies do not share memory with the original state
+        """
+        init_cond = InitialCondition(4)
+        init_cond.th = 0.3
+        init_cond.biomass = 5.0
+
+        for state in [init_cond.copy(), copy.deepcopy(init_cond), pickle.loads(pickle.dumps(init_cond))]:
+            np.testing.assert_array_equal(state.buffer, init_cond.buffer)
+            state.th[0] = 0.1
+            state.biomass = 6.0
+            self.assertEqual(init_cond.th[0], 0.3)
+            self.assertEqual(init_cond.biomass, 5.0)
+
+    def test_from_buffer(self):
+        """
+        A state can be backed by a row of an array holding many states
+        """
+        states = np.stack([InitialCondition(4).buffer for _ in range(3)])
+        init_cond = InitialCondition.from_buffer(states[1])
+        init_cond.z_root = 0.5
+
+        self.assertEqual(init_cond.num_comp, 4)
+        self.assertEqual(states[1, ipv.Z_ROOT], 0.5)
+        with self.assertRaises(ValueError):
+            InitialCondition.from_buffer(states[1, 1:])
+
+
+if __name__ == "__main__":
+    unittest.main()
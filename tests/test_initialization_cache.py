@@ -0,0 +1,86 @@
+import os
+os.environ['DEVELOPMENT'] = 'True'
+import tempfile
+import unittest
+
+from aquacrop import (
+    AquaCropModel,
+    Soil,
+    Crop,
+    InitialWaterContent,
+    IrrigationManagement,
+    InitializationCache,
+)
+from aquacrop.utils import prepare_weather, get_filepath
+
+
+class TestInitializationCache(unittest.TestCase):
+    """
+    Models with the same inputs (except the irrigation management) are initialised once
+    """
+
+    _weather_data = prepare_weather(get_filepath("tunis_climate.txt"))
+
+    def _run(self, smt, cache, planting_date="10/01"):
+        model_os = AquaCropModel(
+            sim_start_time=f"{1979}/10/01",
+            sim_end_time=f"{1981}/05/30",
+            weather_df=self._weather_data,
+            soil=Soil(soil_type="SandyLoam"),
+            crop=Crop("Wheat", planting_date=planting_date),
+            initial_water_content=InitialWaterContent(value=["FC"]),
+            irrigation_management=IrrigationManagement(irrigation_method=1, SMT=[smt] * 4),
+            initialization_cache=cache,
+        )
+        model_os.run_model(till_termination=True)
+        return model_os.get_simulation_results()
+
+    def test_same_results(self):
+        """
+        The results of the models initialised from the cache are the same
+        """
+        cache = InitializationCache()
+        for smt in [40, 80, 40]:
+            self.assertTrue(self._run(smt, cache).equals(self._run(smt, None)))
+
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+        self.assertEqual(len(cache), 1)
+
+        # Other inputs are other templates
+        self._run(40, cache, planting_date="10/15")
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+        self.assertEqual(len(cache), 2)
+
+    def test_eviction(self):
+        """
+        The least recently used templates are evicted
+        """
+        cache = InitializationCache()
+        self._run(40, cache)
+        cache.max_bytes = int(cache.nbytes * 1.5)
+        self._run(40, cache, planting_date="10/15")
+        self.assertEqual(len(cache), 1)
+
+        self._run(40, cache, planting_date="10/15")
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+        self._run(40, cache)
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+
+    def test_directory(self):
+        """
+        The templates saved to a directory are used by other caches
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            self._run(40, InitializationCache(directory=directory))
+
+            cache = InitializationCache(directory=directory)
+            final_stats = self._run(80, cache)
+            self.assertEqual((cache.hits, cache.misses), (1, 0))
+            self.assertTrue(final_stats.equals(self._run(80, None)))
+
+            cache.clear()
+            self.assertEqual(os.listdir(directory), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import os
+os.environ['DEVELOPMENT'] = 'True'
+import unittest
+
+import pandas as pd
+
+from aquacrop import AquaCropModel, Soil, Crop, InitialWaterContent, IrrigationManagement
+from aquacrop.utils import prepare_weather, get_filepath
+
+
+class TestModelCheckpoint(unittest.TestCase):
+    """
+    Models continued from a checkpoint give the same results as the model that was saved
+    """
+
+    _weather_file_path = get_filepath("tunis_climate.txt")
+
+    _weather_data = prepare_weather(_weather_file_path)
+
+    def _model(self, **kwargs):
+        return AquaCropModel(
+            sim_start_time=f"{1979}/08/01",
+            sim_end_time=f"{1982}/05/30",
+            weather_df=self._weather_data,
+            soil=Soil(soil_type="SandyLoam"),
+            crop=Crop("Wheat", planting_date="10/01"),
+            initial_water_content=InitialWaterContent(value=["FC"]),
+            **kwargs,
+        )
+
+    def _assert_same_outputs(self, model, other_model):
+        for getter in ["get_water_flux", "get_water_storage", "get_crop_growth"]:
+            pd.testing.assert_frame_equal(
+                getattr(model, getter)(),
+                getattr(other_model, getter)(),
+            )
+        pd.testing.assert_frame_equal(
+            model.get_simulation_results(),
+            other_model.get_simulation_results(),
+        )
+
+    def test_fork(self):
+        """
+        Every model continued from one checkpoint matches the original run
+        """
+        model = self._model()
+        model.run_model(num_steps=200)
+        checkpoint = model.checkpoint()
+        model.run_model(till_termination=True, initialize_model=False)
+
+        for _ in range(2):
+            fork = AquaCropModel.from_checkpoint(checkpoint)
+            fork.run_model(till_termination=True, initialize_model=False)
+            self._assert_same_outputs(model, fork)
+
+    def test_fork_compiled(self):
+        """
+        A checkpoint can be continued in the compiled loop
+        """
+        model = self._model()
+        model.run_model(num_steps=200)
+        checkpoint = model.checkpoint()
+        model.run_model(till_termination=True, initialize_model=False)
+
+        fork = AquaCropModel.from_checkpoint(checkpoint)
+        fork.run_model(till_termination=True, initialize_model=False, compiled=True)
+        pd.testing.assert_frame_equal(
+            model.get_crop_growth(), fork.get_crop_growth(), check_exact=False, rtol=1e-9
+        )
+
+    def test_fork_new_irrigation(self):
+        """
+        A continuation with another irrigation strategy matches a model using that
+        strategy from the start, when the strategies only differ after the checkpoint
+        """
+        schedule = pd.DataFrame(
+            {"Date": pd.to_datetime(["1981/03/01", "1981/03/20"]), "Depth": [25.0, 25.0]}
+        )
+
+        model = self._model(
+            irrigation_management=IrrigationManagement(irrigation_method=3, Schedule=schedule)
+        )
+        model.run_model(till_termination=True)
+
+        rainfed_model = self._model()
+        rainfed_model.run_model(num_steps=350)
+        self.assertLess(rainfed_model._clock_struct.step_start_time, schedule.Date[0])
+        fork = AquaCropModel.from_checkpoint(
+            rainfed_model.checkpoint(),
+            irrigation_management=IrrigationManagement(irrigation_method=3, Schedule=schedule),
+        )
+        fork.run_model(till_termination=True, initialize_model=False)
+
+        self._assert_same_outputs(model, fork)
+        self.assertGreater(fork.get_water_flux()["IrrDay"].sum(), 0)
+
+    def test_checkpoint_requires_run(self):
+        """
+        Checkpoints are created from models that are running
+        """
+        with self.assertRaises(ValueError):
+            self._model().checkpoint()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+import os
+os.environ['DEVELOPMENT'] = 'True'
+import glob
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from aquacrop import AquaCropModel, Soil, Crop, InitialWaterContent, OutputSink
+from aquacrop.utils import prepare_weather, get_filepath
+
+
+class TestOutputSink(unittest.TestCase):
+    """
+    Outputs streamed to disk in chunks are the same as outputs kept in memory
+    """
+
+    _weather_file_path = get_filepath("tunis_climate.txt")
+
+    _weather_data = prepare_weather(_weather_file_path)
+
+    def _model(self, output_sink=None, off_season=False):
+        return AquaCropModel(
+            sim_start_time=f"{1979}/08/01",
+            sim_end_time=f"{1982}/05/30",
+            weather_df=self._weather_data,
+            soil=Soil(soil_type="SandyLoam"),
+            crop=Crop("Wheat", planting_date="10/01"),
+            initial_water_content=InitialWaterContent(value=["FC"]),
+            off_season=off_season,
+            output_sink=output_sink,
+        )
+
+    def _assert_same_outputs(self, model, other_model):
+        for getter in ["get_water_flux", "get_water_storage", "get_crop_growth"]:
+            pd.testing.assert_frame_equal(
+                getattr(model, getter)(), getattr(other_model, getter)()
+            )
+        pd.testing.assert_frame_equal(
+            model.get_simulation_results(), other_model.get_simulation_results()
+        )
+
+    def test_chunked_outputs(self):
+        """
+        Python and compiled loops, with and without off-season, write the same outputs
+        """
+        for off_season in [False, True]:
+            for compiled in [False, True]:
+                model = self._model(off_season=off_season)
+                model.run_model(till_termination=True, compiled=compiled)
+
+                with tempfile.TemporaryDirectory() as directory:
+                    streamed_model = self._model(OutputSink(100, directory), off_season)
+                    streamed_model.run_model(till_termination=True, compiled=compiled)
+
+                    self.assertEqual(len(streamed_model._outputs.water_flux), 100)
+                    self.assertGreater(len(glob.glob(os.path.join(directory, "water_flux_*.npy"))), 1)
+                    self._assert_same_outputs(model, streamed_model)
+
+    def test_existing_files(self):
+        """
+        A sink replaces its own chunk files, and refuses a directory holding others
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            sink = OutputSink(100, directory)
+            model = self._model(sink)
+            model.run_model(till_termination=True, compiled=True)
+            n_files = len(os.listdir(directory))
+            other_file = os.path.join(directory, "notes.txt")
+            open(other_file, "w").close()
+
+            rerun_model = self._model(sink)
+            rerun_model.run_model(till_termination=True, compiled=True)
+            self.assertEqual(len(os.listdir(directory)), n_files + 1)
+            self._assert_same_outputs(model, rerun_model)
+
+            with self.assertRaises(FileExistsError):
+                self._model(OutputSink(100, directory)).run_model(till_termination=True)
+            self.assertEqual(len(os.listdir(directory)), n_files + 1)
+
+    def test_batch(self):
+        """
+        A batch of models streamed to disk writes the same outputs as each
+        model kept in memory (with the off-season jumping over chunks)
+        """
+        models = [self._model(OutputSink(64), off_season) for off_season in [False, True]]
+        AquaCropModel.run_batch(models)
+
+        for model, off_season in zip(models, [False, True]):
+            in_memory_model = self._model(off_season=off_season)
+            in_memory_model.run_model(till_termination=True)
+            self._assert_same_outputs(in_memory_model, model)
+
+    def test_selected_columns(self):
+        """
+        Selected columns are read from the chunk files
+        """
+        model = self._model()
+        model.run_model(till_termination=True)
+        streamed_model = self._model(OutputSink(64))
+        streamed_model.run_model(till_termination=True)
+
+        pd.testing.assert_frame_equal(
+            model.get_crop_growth(columns=["biomass", "dap"]),
+            streamed_model.get_crop_growth(columns=["biomass", "dap"]),
+        )
+
+    def test_temporary_directory(self):
+        """
+        Without a directory, chunk files are deleted with the outputs
+        """
+        model = self._model(OutputSink(100))
+        model.run_model(num_steps=300)
+        directory = model._outputs.directory
+        self.assertTrue(os.path.isdir(directory))
+
+        model.run_model(num_steps=300)
+        self.assertFalse(os.path.isdir(directory))
+
+    def test_checkpoint(self):
+        """
+        Models continued from a checkpoint stream their outputs too
+        """
+        model = self._model(OutputSink(100))
+        model.run_model(num_steps=250)
+        fork = AquaCropModel.from_checkpoint(model.checkpoint())
+        model.run_model(till_termination=True, initialize_model=False)
+        fork.run_model(till_termination=True, initialize_model=False)
+
+        self.assertNotEqual(fork._outputs.directory, model._outputs.directory)
+        self._assert_same_outputs(model, fork)
+        np.testing.assert_array_equal(
+            fork._outputs.read("water_flux", stop=10), model._outputs.read("water_flux", stop=10)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+os.environ['DEVELOPMENT'] = 'True'
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from aquacrop import AquaCropModel, Soil, Crop, InitialWaterContent
+from aquacrop.utils import prepare_weather, get_filepath
+
+
+class TestOutputs(unittest.TestCase):
+    """
+    Outputs are kept as numpy arrays and only built as dataframes when requested
+    """
+
+    _weather_file_path = get_filepath("tunis_climate.txt")
+
+    _weather_data = prepare_weather(_weather_file_path)
+
+    _model_os = AquaCropModel(
+        sim_start_time=f"{1979}/10/01",
+        sim_end_time=f"{1981}/05/30",
+        weather_df=_weather_data,
+        soil=Soil(soil_type="SandyLoam"),
+        crop=Crop("Wheat", planting_date="10/01"),
+        initial_water_content=InitialWaterContent(value=["FC"]),
+    )
+    _model_os.run_model(till_termination=True)
+
+    def test_outputs_are_arrays(self):
+        """
+        Running the model does not build any dataframe
+        """
+        outputs = self._model_os._outputs
+        self.assertIsInstance(outputs.water_flux, np.ndarray)
+        self.assertIsInstance(outputs.water_storage, np.ndarray)
+        self.assertIsInstance(outputs.crop_growth, np.ndarray)
+        self.assertIsInstance(outputs.final_stats, np.ndarray)
+
+    def test_selected_columns(self):
+        """
+        Only the requested columns are returned, and the dataframe is kept
+        """
+        water_flux = self._model_os.get_water_flux()
+        selected = self._model_os.get_water_flux(columns=["Tr", "IrrDay"])
+
+        self.assertEqual(list(selected.columns), ["Tr", "IrrDay"])
+        pd.testing.assert_frame_equal(selected, water_flux[["Tr", "IrrDay"]])
+        self.assertIs(self._model_os.get_water_flux(columns=["Tr", "IrrDay"]), selected)
+        self.assertIs(self._model_os.get_water_flux(), water_flux)
+
+        with self.assertRaises(KeyError):
+            self._model_os.get_crop_growth(columns=["Tr"])
+
+    def test_final_stats(self):
+        """
+        One row per season, as a dataframe indexed by season
+        """
+        final_stats = self._model_os.get_simulation_results()
+
+        self.assertEqual(list(final_stats.index), [0, 1])
+        self.assertEqual(list(final_stats["crop Type"]), ["Wheat", "Wheat"])
+        self.assertEqual(
+            final_stats["Harvest Date (YYYY/MM/DD)"][0], pd.Timestamp("1980-04-15")
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import os
+os.environ['DEVELOPMENT'] = 'True'
+import unittest
+
+import numpy as np
+
+from aquacrop import AquaCropModel, Soil, Crop, InitialWaterContent
+from aquacrop.utils import prepare_weather, get_filepath
+from aquacrop.solution.root_zone_water import root_zone_water
+from aquacrop.solution.root_zone_water_cache import (
+    RZ_CACHE_CALLS,
+    RZ_CACHE_EVALUATIONS,
+    RZ_CACHE_RESULTS,
+    cached_root_zone_water,
+    new_root_zone_cache,
+)
+
+
+class TestRootZoneWaterCache(unittest.TestCase):
+    """
+    Results of root_zone_water, calculated again only when their inputs change
+    """
+
+    def setUp(self):
+        model_os = AquaCropModel(
+            sim_start_time=f"{1979}/10/01",
+            sim_end_time=f"{1980}/05/30",
+            weather_df=prepare_weather(get_filepath("tunis_climate.txt")),
+            soil=Soil(soil_type="SandyLoam"),
+            crop=Crop("Wheat", planting_date="10/01"),
+            initial_water_content=InitialWaterContent(value=["FC"]),
+        )
+        model_os._initialize()
+        self.soil = model_os._param_struct.Soil
+        self.crop = model_os._param_struct.CropList[0]
+        self.th = model_os._init_cond.th.copy()
+        self.cache = new_root_zone_cache(len(self.th))
+
+    def _call(self, Zroot, th, Zmin, Aer):
+        """
+        Cached results of a call, after marking the stored ones (a call that
+        reuses them returns the mark)
+        """
+        self.cache[RZ_CACHE_RESULTS] = -1.0
+        return cached_root_zone_water(
+            self.cache, self.soil.Profile, Zroot, th, self.soil.z_top, Zmin, Aer
+        )
+
+    def _assert_calculated(self, Zroot, th, Zmin, Aer):
+        self.assertEqual(
+            self._call(Zroot, th, Zmin, Aer),
+            root_zone_water(self.soil.Profile, Zroot, th, self.soil.z_top, Zmin, Aer),
+        )
+
+    def test_cache_hit(self):
+        """
+        An identical call reuses the results
+        """
+        self._assert_calculated(0.5, self.th, self.crop.Zmin, self.crop.Aer)
+        self.assertEqual(self._call(0.5, self.th, self.crop.Zmin, self.crop.Aer)[0], -1.0)
+        self.assertEqual(
+            self._call(0.5, self.th.copy(), self.crop.Zmin, self.crop.Aer)[0], -1.0
+        )
+        self.assertEqual(self.cache[RZ_CACHE_CALLS], 3)
+        self.assertEqual(self.cache[RZ_CACHE_EVALUATIONS], 1)
+
+    def test_cache_miss(self):
+        """
+        Changing the water content, the rooting depth or the crop paramaters
+        calculates the results again
+        """
+        self._assert_calculated(0.5, self.th, self.crop.Zmin, self.crop.Aer)
+
+        # Water content changed in place
+        self.th[0] = self.th[0] - 0.05
+        self._assert_calculated(0.5, self.th, self.crop.Zmin, self.crop.Aer)
+
+        th = np.full_like(self.th, self.soil.Profile.th_wp[0])
+        self._assert_calculated(0.5, th, self.crop.Zmin, self.crop.Aer)
+        self._assert_calculated(0.8, th, self.crop.Zmin, self.crop.Aer)
+        self._assert_calculated(0.8, th, self.crop.Zmin + 0.1, self.crop.Aer)
+        self._assert_calculated(0.8, th, self.crop.Zmin + 0.1, self.crop.Aer + 1)
+        self.assertEqual(self.cache[RZ_CACHE_CALLS], 6)
+        self.assertEqual(self.cache[RZ_CACHE_EVALUATIONS], 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
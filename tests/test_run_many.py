@@ -0,0 +1,97 @@
+import os
+os.environ['DEVELOPMENT'] = 'True'
+import unittest
+
+import numpy as np
+
+from aquacrop import AquaCropModel, Soil, Crop, InitialWaterContent, IrrigationManagement, run_many
+from aquacrop.scenarios import _attach_frames, _share_frame, _worker_blocks
+from aquacrop.utils import prepare_weather, get_filepath
+
+
+class TestRunMany(unittest.TestCase):
+    """
+    Scenarios run in worker processes must give the same results as running each model
+    """
+
+    _weather_file_path = get_filepath("tunis_climate.txt")
+
+    _weather_data = prepare_weather(_weather_file_path)
+
+    def _configs(self):
+        return [
+            dict(
+                sim_start_time=f"{1979}/08/01",
+                sim_end_time=f"{1981}/05/30",
+                weather_df=self._weather_data,
+                soil=Soil(soil_type=soil_type),
+                crop=Crop("Wheat", planting_date="10/01"),
+                initial_water_content=InitialWaterContent(value=["FC"]),
+                irrigation_management=IrrigationManagement(irrigation_method=1, SMT=[smt] * 4),
+            )
+            for soil_type in ["SandyLoam", "Loam"]
+            for smt in [30, 70]
+        ]
+
+    def test_run_many(self):
+        """
+        Results of a process pool match the results of each model run on its own
+        """
+        results = run_many(self._configs(), workers=2)
+
+        self.assertEqual(len(results), 4)
+        for config, result in zip(self._configs(), results):
+            model = AquaCropModel(**config)
+            model.run_model(till_termination=True, compiled=True)
+
+            np.testing.assert_array_equal(result["water_flux"], model.get_water_flux().to_numpy())
+            np.testing.assert_array_equal(
+                result["water_storage"], model.get_water_storage().to_numpy()
+            )
+            np.testing.assert_array_equal(result["crop_growth"], model.get_crop_growth().to_numpy())
+            np.testing.assert_array_equal(
+                result["final_stats"]["Dry yield (tonne/ha)"],
+                model.get_simulation_results()["Dry yield (tonne/ha)"].to_numpy(),
+            )
+
+    def test_selected_outputs(self):
+        """
+        Only the requested outputs are returned
+        """
+        results = run_many(self._configs()[:1], workers=1, outputs=["final_stats"])
+
+        self.assertEqual(list(results[0]), ["final_stats"])
+        self.assertEqual(len(results[0]["final_stats"]), 2)
+
+    def test_shared_frame(self):
+        """
+        A shared data frame is attached as read-only views of the shared memory
+        """
+        blocks = []
+        try:
+            descriptor = _share_frame(self._weather_data, blocks)
+            (frame,) = _attach_frames([descriptor])
+
+            self.assertTrue(frame.equals(self._weather_data))
+            for column in frame.columns:
+                values = frame[column].to_numpy()
+                self.assertFalse(values.flags.writeable)
+                self.assertTrue(np.shares_memory(values, np.asarray(_worker_blocks[-1].buf)))
+        finally:
+            del frame, values
+            while _worker_blocks:
+                _worker_blocks.pop().close()
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+    def test_unknown_output(self):
+        """
+        Unknown outputs are rejected
+        """
+        with self.assertRaises(ValueError):
+            run_many(self._configs(), outputs=["yield"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+os.environ['DEVELOPMENT'] = 'True'
+import unittest
+
+import numpy as np
+
+from aquacrop import AquaCropModel, Soil, Crop, InitialWaterContent
+from aquacrop.utils import prepare_weather, get_filepath
+from aquacrop.initialize.read_model_parameters import extend_soil_profile
+
+
+class TestSoilProfile(unittest.TestCase):
+    """
+    Soil profiles shallower than the maximum rooting depth of the crop
+    """
+
+    _weather_data = prepare_weather(get_filepath("tunis_climate.txt"))
+
+    def _model(self, soil):
+        return AquaCropModel(
+            sim_start_time=f"{1979}/10/01",
+            sim_end_time=f"{1980}/05/30",
+            weather_df=self._weather_data,
+            soil=soil,
+            crop=Crop("Wheat", planting_date="10/01"),
+            initial_water_content=InitialWaterContent(value=["FC"]),
+        )
+
+    def test_extend_soil_profile(self):
+        """
+        0.1 m is added to the deepest compartments thinner than 0.25 m
+        """
+        dz = extend_soil_profile(np.array([0.1, 0.1, 0.2, 0.3, 0.1]), 1.2)
+        np.testing.assert_array_almost_equal(dz, [0.1, 0.2, 0.3, 0.3, 0.3])
+
+        with self.assertRaises(ValueError):
+            extend_soil_profile(np.array([0.1, 0.3]), 1.0)
+
+    def test_soil_is_not_changed(self):
+        """
+        The soil of a model is not changed, so it can be used by other models
+        """
+        soil = Soil(soil_type="SandyLoam", dz=[0.1] * 6)
+        dz = soil.profile.dz.copy()
+
+        model_os = self._model(soil)
+        model_os.run_model(till_termination=True)
+
+        self.assertGreaterEqual(model_os._param_struct.Soil.zSoil, model_os.crop.Zmax + 0.1)
+        self.assertEqual(list(soil.profile.dz), list(dz))
+        self.assertEqual(soil.zSoil, 0.6)
+
+        shared_model = self._model(soil)
+        shared_model.run_model(till_termination=True)
+        self.assertEqual(
+            model_os.get_simulation_results()["Dry yield (tonne/ha)"][0],
+            shared_model.get_simulation_results()["Dry yield (tonne/ha)"][0],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
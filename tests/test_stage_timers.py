@@ -0,0 +1,74 @@
+import os
+os.environ['DEVELOPMENT'] = 'True'
+import unittest
+
+import pandas as pd
+
+from aquacrop import AquaCropModel, Soil, Crop, InitialWaterContent
+from aquacrop.utils import prepare_weather, get_filepath
+
+
+class TestStageTimers(unittest.TestCase):
+    """
+    Wall time and calls of each stage of the time steps
+    """
+
+    _weather_data = prepare_weather(get_filepath("tunis_climate.txt"))
+
+    def _model(self, **kwargs):
+        return AquaCropModel(
+            sim_start_time=f"{1979}/10/01",
+            sim_end_time=f"{1980}/05/30",
+            weather_df=self._weather_data,
+            soil=Soil(soil_type="SandyLoam"),
+            crop=Crop("Wheat", planting_date="10/01"),
+            initial_water_content=InitialWaterContent(value=["FC"]),
+            **kwargs,
+        )
+
+    def test_stage_timers(self):
+        """
+        Each stage is timed and the results do not change
+        """
+        model_os = self._model(stage_timers=True)
+        model_os.run_model(till_termination=True)
+        reference = self._model()
+        reference.run_model(till_termination=True)
+
+        timers = model_os.get_additional_information()["stage_timers"]
+        # The time step counter is not incremented after the last day
+        steps = model_os._clock_struct.time_step_counter + 1
+        self.assertEqual(timers["Time step"]["calls"], steps)
+        self.assertEqual(timers["4. Drainage"]["calls"], steps)
+        self.assertGreater(timers["4. Drainage"]["time"], 0)
+        stages_time = sum(
+            timer["time"] for stage, timer in timers.items() if stage != "Time step"
+        )
+        self.assertLess(stages_time, timers["Time step"]["time"])
+
+        pd.testing.assert_frame_equal(
+            model_os.get_simulation_results(), reference.get_simulation_results()
+        )
+        self.assertNotIn("stage_timers", reference.get_additional_information())
+
+    def test_stage_timers_accumulate(self):
+        """
+        The timers accumulate across the calls of run_model
+        """
+        model_os = self._model(stage_timers=True)
+        model_os.run_model(num_steps=10)
+        model_os.run_model(num_steps=5, initialize_model=False)
+
+        timers = model_os.get_additional_information()["stage_timers"]
+        self.assertEqual(timers["Time step"]["calls"], 15)
+
+    def test_compiled_run(self):
+        """
+        Stage timers are not available with compiled runs
+        """
+        with self.assertRaises(ValueError):
+            self._model(stage_timers=True).run_model(till_termination=True, compiled=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+os.environ['DEVELOPMENT'] = 'True'
+import unittest
+
+from aquacrop import AquaCropModel, Soil, Crop, InitialWaterContent, GroundWater
+from aquacrop.utils import prepare_weather, get_filepath
+
+
+class TestWorkCounters(unittest.TestCase):
+    """
+    Work done by the solution functions, reported per run
+    """
+
+    _weather_data = prepare_weather(get_filepath("tunis_climate.txt"))
+
+    def _run(self, compiled):
+        model_os = AquaCropModel(
+            sim_start_time=f"{1979}/10/01",
+            sim_end_time=f"{1982}/05/30",
+            weather_df=self._weather_data,
+            soil=Soil(soil_type="SandyLoam"),
+            crop=Crop("Wheat", planting_date="10/01"),
+            initial_water_content=InitialWaterContent(value=["FC"]),
+            groundwater=GroundWater(water_table="Y", dates=[f"{1979}/10/01"], values=[2.0]),
+        )
+        model_os.run_model(till_termination=True, compiled=compiled)
+        return model_os
+
+    def test_work_counters(self):
+        """
+        The counters of the python and compiled simulations are the same
+        """
+        model_os = self._run(compiled=False)
+        counters = model_os.get_additional_information()["work_counters"]
+
+        self.assertEqual(counters, self._run(compiled=True).get_additional_information()["work_counters"])
+        self.assertEqual(counters["season_resets"], 2)
+        # Stage 2 evaporation runs evap_time_steps sub-steps each day
+        self.assertGreater(counters["evap_stage2_sub_steps"], 0)
+        self.assertEqual(
+            counters["evap_stage2_sub_steps"] % model_os._clock_struct.evap_time_steps, 0
+        )
+        self.assertGreater(counters["capillary_rise_iterations"], 0)
+        self.assertGreater(counters["infiltration_iterations"], 0)
+        self.assertGreater(counters["root_zone_calls"], counters["root_zone_evaluations"])
+        self.assertGreater(counters["root_zone_evaluations"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()